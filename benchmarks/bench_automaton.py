@@ -0,0 +1,52 @@
+"""
+Build time and memory of the automata returned by `translate`: `networkx.MultiDiGraph` versus
+`Automaton`, both built from the same `TCompactGraph`.
+
+Automata are complete graphs from `stub_handler.make_graph` (4 labels, `4 * states^2` edges).
+Memory is the growth of traced allocations while `--copies` automata are kept alive.
+
+Usage: python benchmarks/bench_automaton.py [--states 10 50 200] [--copies 20]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from spotondocker.automaton import Automaton
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.compact import compact_graph
+from stub_handler import make_graph
+
+
+def measure(build, compact, copies):
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    kept = [build(compact) for _ in range(copies)]
+    elapsed = (time.perf_counter() - start) / copies
+    nbytes = (tracemalloc.get_traced_memory()[0] - base) / copies
+    tracemalloc.stop()
+    del kept
+    return elapsed, nbytes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--states", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--copies", type=int, default=20, help="Number of automata built and kept per measurement.")
+    args = parser.parse_args()
+
+    builders = {"networkx": SpotOnDockerClient._compact_to_networkx, "Automaton": Automaton.from_compact}
+    print(f"{'states':>7} {'edges':>8} {'type':>10} {'build ms':>10} {'bytes/edge':>11}")
+    for num_states in args.states:
+        compact = compact_graph(make_graph(num_states))
+        num_edges = len(compact.edgeSrc)
+        for name, build in builders.items():
+            elapsed, nbytes = measure(build, compact, args.copies)
+            print(f"{num_states:>7} {num_edges:>8} {name:>10} {1000 * elapsed:>10.2f} {nbytes / num_edges:>11.1f}")
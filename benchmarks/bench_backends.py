@@ -0,0 +1,71 @@
+"""
+Startup time and per-call latency of the backends of `SpotOnDockerClient`: "inprocess",
+"subprocess" (both need spot installed for this interpreter) and "docker" (needs a docker daemon
+and the spotondocker image). Unavailable backends are skipped.
+
+Startup is the time to construct the client, until the server answers. Calls are small (`ping`,
+`mp_class`) and a `translate` of a fixed formula; repeated calls are answered from the server's
+result cache, so they measure the overhead of the backend rather than spot.
+
+Usage: python benchmarks/bench_backends.py [--backends inprocess subprocess docker] [--calls 1000] [--starts 3]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import statistics
+import time
+
+from spotondocker.client import SpotOnDockerClient
+
+
+def latencies(call, calls):
+    for _ in range(min(100, calls)):
+        call()
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.99 * (len(samples) - 1))]
+
+
+def start(backend):
+    begin = time.perf_counter()
+    spot = SpotOnDockerClient(backend=backend, client_wait_time=60000)
+    return spot, time.perf_counter() - begin
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["inprocess", "subprocess", "docker"])
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per RPC and backend.")
+    parser.add_argument("--starts", type=int, default=3, help="Clients started per backend to measure startup.")
+    args = parser.parse_args()
+
+    rpcs = {
+        "ping": lambda spot: spot.ping(),
+        "mp_class": lambda spot: spot.mp_class("G(a -> Fb)"),
+        "translate": lambda spot: spot.translate("G(a -> Fb)", return_type="automaton"),
+    }
+    print(f"{'backend':>10} {'rpc':>10} {'p50 us':>10} {'p99 us':>10}")
+    for backend in args.backends:
+        try:
+            startups = []
+            for _ in range(args.starts):
+                spot, elapsed = start(backend)
+                startups.append(elapsed)
+                spot.close()
+        except Exception as err:
+            print(f"{backend:>10} skipped: {type(err).__name__}: {err}")
+            continue
+
+        print(f"{backend:>10} {'startup':>10} {1e6 * statistics.median(startups):>10.0f} {1e6 * max(startups):>10.0f}")
+        spot, _ = start(backend)
+        for rpc, func in rpcs.items():
+            p50, p99 = latencies(lambda: func(spot), args.calls)
+            print(f"{backend:>10} {rpc:>10} {1e6 * p50:>10.1f} {1e6 * p99:>10.1f}")
+        spot.close()
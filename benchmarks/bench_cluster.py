@@ -0,0 +1,83 @@
+"""
+`translate` throughput of `SpotOnDockerCluster` for 1..N replicas, using `StubHandler` servers.
+
+Every replica is a single-process server (as in a container launched by `SpotOnDockerClient`),
+reached through `SpotOnDockerClient(host=..., port=...)`. Client threads call `translate`
+concurrently through one cluster. With CPU-bound calls, throughput should grow almost linearly
+with the number of replicas up to the number of cores.
+
+Usage: python benchmarks/bench_cluster.py [--replicas 1 2 4 8] [--clients 16] [--calls 100] [--work-ms 5]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import multiprocessing
+import threading
+import time
+
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.cluster import SpotOnDockerCluster
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from stub_handler import StubHandler
+
+
+def run_server(port, work):
+    transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+    tfactory = TTransport.TBufferedTransportFactory()
+    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    TServer.TSimpleServer(SpotOnDocker.Processor(StubHandler(work=work)), transport, tfactory, pfactory).serve()
+
+
+def client_thread(spot, calls, barrier):
+    barrier.wait()
+    for _ in range(calls):
+        spot.translate("G(a -> Fb)", return_type="automaton")
+
+
+def measure(replicas, clients, calls, work):
+    ports = [SpotOnDockerClient._find_free_port() for _ in range(replicas)]
+    servers = [multiprocessing.get_context("fork").Process(target=run_server, args=(port, work)) for port in ports]
+    for server in servers:
+        server.start()
+    try:
+        spot = SpotOnDockerCluster(clients=[SpotOnDockerClient(host="127.0.0.1", port=port) for port in ports])
+        barrier = threading.Barrier(clients + 1)
+        threads = [threading.Thread(target=client_thread, args=(spot, calls, barrier)) for _ in range(clients)]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        spot.close()
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+    return clients * calls / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--replicas", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count()}))
+    parser.add_argument("--clients", type=int, default=None, help="Concurrent client threads (default: 2 x max replicas).")
+    parser.add_argument("--calls", type=int, default=100, help="Calls per client thread.")
+    parser.add_argument("--work-ms", type=float, default=5.0, help="CPU time per translate call in the stub handler.")
+    args = parser.parse_args()
+    clients = args.clients or 2 * max(args.replicas)
+
+    print(f"cpus={os.cpu_count()} clients={clients} calls/client={args.calls} work={args.work_ms}ms")
+    print(f"{'replicas':>8} {'calls/s':>10} {'speedup':>8}")
+    baseline = None
+    for replicas in args.replicas:
+        rate = measure(replicas, clients, args.calls, args.work_ms / 1000)
+        baseline = baseline or rate
+        print(f"{replicas:>8} {rate:>10.1f} {rate / baseline:>8.2f}")
@@ -0,0 +1,82 @@
+"""
+Time to convert translated automata into `TGraph`s: the former per-edge conversion of the server
+(formatting every edge condition) versus `convert.to_graph` (formatting every distinct condition
+once). Automata are translated once, before measuring, from `spot.randltl` formulas.
+
+Requires spot, so run it in the container, e.g.:
+    docker run --rm -v $PWD:/src -w /home/spotondocker abhibp1993/spotondocker \
+        python3 /src/benchmarks/bench_conversion.py
+
+Usage: python benchmarks/bench_conversion.py [--formulas 100] [--aps 4 6] [--tree-size 20]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "spotondocker"))
+
+import argparse
+import time
+
+import spot
+from convert import to_graph
+from genpy.spotondocker import SpotOnDocker
+
+
+def per_edge_to_graph(aut):
+    """ The conversion used by the server up to version 0.1.0 (without the debug output). """
+    bdict = aut.get_dict()
+    graph = SpotOnDocker.TGraph()
+    graph.acceptance = str(aut.get_acceptance())
+    graph.numAccSets = int(aut.num_sets())
+    graph.numStates = int(aut.num_states())
+    graph.initStates = [int(aut.get_init_state_number())]
+    graph.apNames = [str(ap) for ap in aut.ap()]
+    graph.formula = str(aut.get_name())
+    graph.isDeterministic = bool(aut.prop_universal() and aut.is_existential())
+    graph.isTerminal = bool(aut.prop_terminal())
+    graph.hasStateBasedAcc = bool(aut.prop_state_acc())
+
+    states = []
+    edges = []
+    for src in range(0, aut.num_states()):
+        n = SpotOnDocker.TNode()
+        n.id = int(src)
+        for edge in aut.out(src):
+            e = SpotOnDocker.TEdge()
+            e.srcId = int(edge.src)
+            e.dstId = int(edge.dst)
+            e.label = str(spot.bdd_format_formula(bdict, edge.cond))
+            n.isAcc = not (edge.acc is None)
+            edges.append(e)
+        states.append(n)
+    graph.nodes = states
+    graph.edges = edges
+    return graph
+
+
+def measure(convert, automata):
+    start = time.perf_counter()
+    for aut in automata:
+        convert(aut)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--formulas", type=int, default=100, help="Number of random formulas per row.")
+    parser.add_argument("--aps", type=int, nargs="+", default=[4, 6], help="Atomic propositions per formula.")
+    parser.add_argument("--tree-size", type=int, default=20, help="Size of the random formulas.")
+    args = parser.parse_args()
+
+    converters = {"per-edge": per_edge_to_graph, "to_graph": to_graph}
+    print(f"{'aps':>4} {'states':>8} {'edges':>9} {'labels':>7} {'converter':>10} {'ms':>9} {'us/edge':>8}")
+    for aps in args.aps:
+        formulas = spot.randltl(aps, args.formulas, seed=0, tree_size=args.tree_size)
+        automata = [spot.translate(f, "BA", "High", "SBAcc", "Complete") for f in formulas]
+        num_states = sum(aut.num_states() for aut in automata)
+        num_edges = sum(aut.num_edges() for aut in automata)
+        num_labels = sum(len({e.label for e in to_graph(aut).edges}) for aut in automata)
+        for name, convert in converters.items():
+            elapsed = measure(convert, automata)
+            print(f"{aps:>4} {num_states:>8} {num_edges:>9} {num_labels:>7} {name:>10} "
+                  f"{1000 * elapsed:>9.1f} {1e6 * elapsed / max(1, num_edges):>8.2f}")
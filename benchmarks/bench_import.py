@@ -0,0 +1,72 @@
+"""
+Import time of the client modules, measured with `python -X importtime` in fresh interpreters.
+
+Prints the median cumulative import time of every module given and the slowest imports below it.
+Exits with status 1 if a module takes longer than `--max-ms`, or if importing it loads one of the
+`--forbid` modules (by default the heavy dependencies which are only needed on first use), so that
+the script can guard against regressions in CI.
+
+Usage: python benchmarks/bench_import.py [--modules spotondocker.client ...] [--runs 5] [--max-ms 150] [--top 10]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def import_times(module):
+    """
+    Imports `module` in a fresh interpreter. Returns `{imported module: cumulative us}` for `module`
+    and the modules it imported (and which were not imported before, e.g. by `site`).
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), len(name) - len(name.lstrip()), int(cumulative)))
+
+    # Modules are listed after their imports, indented deeper.
+    end = max(i for i, (name, _, _) in enumerate(rows) if name == module)
+    start = end
+    while start > 0 and rows[start - 1][1] > rows[end][1]:
+        start -= 1
+    return {name: cumulative for name, _, cumulative in rows[start: end + 1]}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", nargs="+", default=["spotondocker.client", "spotondocker.aioclient", "spotondocker.cluster"])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module.")
+    parser.add_argument("--max-ms", type=float, default=150.0, help="Maximum median import time of a module.")
+    parser.add_argument("--forbid", nargs="*", default=["docker", "networkx", "sqlite3"],
+                        help="Modules which must not be imported.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports shown per module.")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        runs = [import_times(module) for _ in range(args.runs)]
+        total = statistics.median(run[module] for run in runs) / 1000
+        loaded = sorted(name for name in args.forbid if name in runs[0])
+        print(f"{module}: {total:.1f} ms")
+        slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)
+        for name, us in [item for item in slowest if item[0] != module][:args.top]:
+            print(f"    {us / 1000:>8.1f} ms  {name}")
+        if total > args.max_ms:
+            print(f"    FAIL: slower than {args.max_ms} ms")
+            failed = True
+        if loaded:
+            print(f"    FAIL: imports {', '.join(loaded)}")
+            failed = True
+
+    sys.exit(1 if failed else 0)
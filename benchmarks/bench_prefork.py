@@ -0,0 +1,111 @@
+"""
+Throughput of `TPreforkServer` for 1..N worker processes, using `StubHandler`.
+
+Every client thread holds its own connection and issues `Translate`, `Contains` and `IsEquivalent`
+calls round-robin. With CPU-bound calls, throughput should grow with the number of workers up to
+the number of cores.
+
+Usage: python benchmarks/bench_prefork.py [--workers 1 2 4 8] [--clients 8] [--calls 200] [--work-ms 5]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import contextlib
+import multiprocessing
+import socket
+import threading
+import time
+
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from spotondocker.servers import TPreforkServer
+from stub_handler import StubHandler
+
+
+def free_port():
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+def run_server(port, workers, work):
+    processor = SpotOnDocker.Processor(StubHandler(work=work))
+    transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+    tfactory = TTransport.TBufferedTransportFactory()
+    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    TPreforkServer(processor, transport, tfactory, pfactory, numWorkers=workers).serve()
+
+
+def wait_for_port(port, deadline=10.0):
+    start = time.monotonic()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+            return
+        except OSError:
+            if time.monotonic() - start > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def connect(port):
+    transport = TTransport.TBufferedTransport(TSocket.TSocket("127.0.0.1", port))
+    transport.open()
+    return transport, SpotOnDocker.Client(TBinaryProtocol.TBinaryProtocol(transport))
+
+
+def client_thread(port, calls, barrier):
+    transport, client = connect(port)
+    barrier.wait()
+    for i in range(calls):
+        if i % 3 == 0:
+            client.Translate("G(a -> Fb)")
+        elif i % 3 == 1:
+            client.Contains("Fa", "Ga")
+        else:
+            client.IsEquivalent("Fa", "Ga")
+    transport.close()
+
+
+def measure(workers, clients, calls, work):
+    port = free_port()
+    server = multiprocessing.get_context("fork").Process(target=run_server, args=(port, workers, work))
+    server.start()
+    try:
+        wait_for_port(port)
+        barrier = threading.Barrier(clients + 1)
+        threads = [threading.Thread(target=client_thread, args=(port, calls, barrier)) for _ in range(clients)]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.join()
+    return clients * calls / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count()}))
+    parser.add_argument("--clients", type=int, default=None, help="Concurrent connections (default: max workers).")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per client.")
+    parser.add_argument("--work-ms", type=float, default=5.0, help="CPU time per heavy call in the stub handler.")
+    args = parser.parse_args()
+    clients = args.clients or max(args.workers)
+
+    print(f"cpus={os.cpu_count()} clients={clients} calls/client={args.calls} work={args.work_ms}ms")
+    print(f"{'workers':>8} {'calls/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        rate = measure(workers, clients, args.calls, args.work_ms / 1000)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>10.1f} {rate / baseline:>8.2f}")
@@ -0,0 +1,127 @@
+"""
+Latency and bytes on the wire of every protocol and transport in `spotondocker.wire`, using `StubHandler`.
+
+For each combination a `TSimpleServer` is forked and a single connection issues `Ping` and `GetAP`
+(for the first `--states` only), and `TranslateCompact` / `Translate` calls returning automata with
+`--states` states (complete graphs from `stub_handler.make_graph`, `4 * states^2` edges). The stub does no work, so the latencies are
+the cost of encoding, transferring and decoding the messages.
+
+Usage: python benchmarks/bench_protocols.py [--states 4 50 200] [--calls 200] [--protocols ...] [--transports ...]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import contextlib
+import multiprocessing
+import socket
+import statistics
+import time
+
+from thrift import TSerialization
+from thrift.server import TServer
+from thrift.transport import TSocket
+from spotondocker import wire
+from spotondocker.compact import compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from stub_handler import StubHandler, make_graph
+
+
+def free_port():
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+def run_server(port, protocol, transport, states):
+    server = TServer.TSimpleServer(
+        SpotOnDocker.Processor(StubHandler(work=0, num_states=states)),
+        TSocket.TServerSocket(host="127.0.0.1", port=port),
+        wire.transport_factory(transport),
+        wire.protocol_factory(protocol)
+    )
+    server.serve()
+
+
+def wait_for_port(port, deadline=10.0):
+    start = time.monotonic()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+            return
+        except OSError:
+            if time.monotonic() - start > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def connect(port, protocol, transport):
+    trans = wire.transport_factory(transport).getTransport(TSocket.TSocket("127.0.0.1", port))
+    trans.open()
+    return trans, SpotOnDocker.Client(wire.protocol_factory(protocol).getProtocol(trans))
+
+
+def latencies(call, calls):
+    for _ in range(min(20, calls)):
+        call()
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.99 * (len(samples) - 1))]
+
+
+def reply_bytes(value, protocol, transport):
+    """ Size of `value` encoded with `protocol`, plus the frame header if `transport` is framed. """
+    data = TSerialization.serialize(value, wire.protocol_factory(protocol))
+    return len(data) + (4 if transport == "framed" else 0)
+
+
+def measure(protocol, transport, states, calls, small):
+    """ Returns `(rpc, p50, p99, reply bytes)` rows; `Ping` and `GetAP` are only called if `small`. """
+    port = free_port()
+    server = multiprocessing.get_context("fork").Process(target=run_server, args=(port, protocol, transport, states))
+    server.start()
+    try:
+        wait_for_port(port)
+        trans, client = connect(port, protocol, transport)
+        graph = make_graph(states)
+        rpcs = [
+            ("TranslateCompact", lambda: client.TranslateCompact("G(a -> Fb)", None), compact_graph(graph)),
+            ("Translate", lambda: client.Translate("G(a -> Fb)", None), graph),
+        ]
+        if small:
+            rpcs = [("Ping", client.Ping, None), ("GetAP", lambda: client.GetAP("G(a -> Fb)"), None)] + rpcs
+
+        rows = []
+        for name, call, reply in rpcs:
+            # Large automata take long to decode with the pure-Python protocol: fewer calls.
+            n = calls if reply is None else max(5, calls * 100 // len(graph.edges))
+            p50, p99 = latencies(call, n)
+            rows.append((name, p50, p99, None if reply is None else reply_bytes(reply, protocol, transport)))
+        trans.close()
+    finally:
+        server.terminate()
+        server.join()
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--states", type=int, nargs="+", default=[4, 50, 200])
+    parser.add_argument("--calls", type=int, default=200, help="Calls per RPC (fewer for large automata).")
+    parser.add_argument("--protocols", nargs="+", default=list(wire.PROTOCOLS))
+    parser.add_argument("--transports", nargs="+", default=list(wire.TRANSPORTS))
+    args = parser.parse_args()
+
+    print(f"{'states':>7} {'protocol':>12} {'transport':>10} {'rpc':>17} {'p50 us':>10} {'p99 us':>10} {'bytes':>10}")
+    for states in args.states:
+        for protocol in args.protocols:
+            for transport in args.transports:
+                for name, p50, p99, nbytes in measure(protocol, transport, states, args.calls, states == args.states[0]):
+                    print(f"{states:>7} {protocol:>12} {transport:>10} {name:>17} {1e6 * p50:>10.1f} {1e6 * p99:>10.1f} "
+                          f"{'-' if nbytes is None else nbytes:>10}")
@@ -0,0 +1,58 @@
+"""
+Per-call latency of translating small formulas with `spot.translate` (a new translator per call,
+as the server did before) versus `TranslatorPool` (long-lived translators and BDD dictionary).
+
+Formulas are drawn from `spot.randltl` and every formula is translated `--repeat` times, as
+happens when the server's result cache is disabled or too small. Requires spot, so run it in the
+container, e.g.:
+    docker run --rm -v $PWD:/src -w /home/spotondocker abhibp1993/spotondocker \
+        python3 /src/benchmarks/bench_translator.py
+
+Usage: python benchmarks/bench_translator.py [--formulas 200] [--aps 3] [--repeat 5] [--recycle 0 100 1000]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "spotondocker"))
+
+import argparse
+import statistics
+import time
+
+import spot
+from translators import TranslatorPool
+
+OPTIONS = ("BA", "High", "SBAcc", "Complete")
+
+
+def latencies(translate, formulas, repeat):
+    samples = []
+    for _ in range(repeat):
+        for f in formulas:
+            start = time.perf_counter()
+            translate(f)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), statistics.mean(samples), samples[int(0.99 * (len(samples) - 1))]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--formulas", type=int, default=200, help="Number of distinct random formulas.")
+    parser.add_argument("--aps", type=int, default=3, help="Atomic propositions per formula.")
+    parser.add_argument("--repeat", type=int, default=5, help="Translations of every formula.")
+    parser.add_argument("--recycle", type=int, nargs="+", default=[0, 100, 1000],
+                        help="`recycle_after` values of the measured pools.")
+    args = parser.parse_args()
+
+    formulas = [spot.formula(f) for f in spot.randltl(args.aps, args.formulas, seed=0, tree_size=(5, 15))]
+    translators = {"spot.translate": lambda f: spot.translate(f, *OPTIONS)}
+    for recycle in args.recycle:
+        pool = TranslatorPool(recycle_after=recycle)
+        translators[f"pool/{recycle}"] = lambda f, pool=pool: pool.translate(f, *OPTIONS)
+
+    print(f"spot {spot.version()}, {args.formulas} formulas x {args.repeat}")
+    print(f"{'translator':>16} {'p50 us':>9} {'mean us':>9} {'p99 us':>9}")
+    for name, translate in translators.items():
+        p50, mean, p99 = latencies(translate, formulas, args.repeat)
+        print(f"{name:>16} {1e6 * p50:>9.1f} {1e6 * mean:>9.1f} {1e6 * p99:>9.1f}")
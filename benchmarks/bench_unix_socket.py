@@ -0,0 +1,90 @@
+"""
+Latency of small RPCs (`Ping`, `GetAP`, `MpClass`) over TCP versus a Unix domain socket.
+
+By default, `StubHandler` servers are started locally: one on a loopback TCP port and one on a
+Unix domain socket. With `--docker`, two containers are launched instead (`SpotOnDockerClient()`
+and `SpotOnDockerClient(unix_socket=True)`), so that the TCP path includes the docker proxy.
+
+Usage: python benchmarks/bench_unix_socket.py [--calls 5000] [--docker]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import time
+
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from stub_handler import StubHandler
+
+
+def run_server(address):
+    transport = TSocket.TServerSocket(**address)
+    tfactory = TTransport.TBufferedTransportFactory()
+    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    TServer.TSimpleServer(SpotOnDocker.Processor(StubHandler()), transport, tfactory, pfactory).serve()
+
+
+def latencies(call, calls):
+    for _ in range(min(100, calls)):
+        call()
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.99 * (len(samples) - 1))]
+
+
+def measure(clients, calls):
+    rpcs = {
+        "ping": lambda spot: spot.ping(),
+        "get_ap": lambda spot: spot.get_ap("Fa & Gb"),
+        "mp_class": lambda spot: spot.mp_class("G(a -> Fb)"),
+    }
+    print(f"{'rpc':>10} {'transport':>10} {'p50 us':>9} {'p99 us':>9}")
+    for rpc, func in rpcs.items():
+        for name, spot in clients.items():
+            p50, p99 = latencies(lambda: func(spot), calls)
+            print(f"{rpc:>10} {name:>10} {1e6 * p50:>9.1f} {1e6 * p99:>9.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=5000, help="Calls per RPC and transport.")
+    parser.add_argument("--docker", action="store_true", help="Measure against spotondocker containers.")
+    args = parser.parse_args()
+
+    if args.docker:
+        clients = {"tcp": SpotOnDockerClient(), "unix": SpotOnDockerClient(unix_socket=True)}
+        measure(clients, args.calls)
+        for spot in clients.values():
+            spot.close()
+        sys.exit(0)
+
+    port = SpotOnDockerClient._find_free_port()
+    path = os.path.join(tempfile.mkdtemp(), "server.sock")
+    addresses = {"tcp": dict(host="127.0.0.1", port=port), "unix": dict(unix_socket=path)}
+    servers = [multiprocessing.get_context("fork").Process(target=run_server, args=(a, )) for a in addresses.values()]
+    for server in servers:
+        server.start()
+    try:
+        clients = {
+            "tcp": SpotOnDockerClient(host="127.0.0.1", port=port),
+            "unix": SpotOnDockerClient(unix_socket=path),
+        }
+        measure(clients, args.calls)
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
@@ -0,0 +1,70 @@
+"""
+Bytes on the wire and decode time of a `Translate` result as `TGraph` versus `TCompactGraph`.
+
+Automata are complete graphs from `stub_handler.make_graph` (4 labels, `4 * states^2` edges).
+Decoding is timed with the pure-Python binary protocol (used by `SpotOnDockerClient`) and with
+the C-accelerated one, and once more including the conversion to `networkx.MultiDiGraph`.
+
+Usage: python benchmarks/bench_wire_format.py [--states 10 50 200] [--repeat 5]
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import argparse
+import time
+
+from thrift import TSerialization
+from thrift.protocol import TBinaryProtocol
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.compact import compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from stub_handler import make_graph
+
+
+PROTOCOLS = {
+    "binary": TBinaryProtocol.TBinaryProtocolFactory(),
+    "accel": TBinaryProtocol.TBinaryProtocolAcceleratedFactory(),
+}
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(num_states, repeat):
+    graph = make_graph(num_states)
+    formats = {
+        "TGraph": (graph, SpotOnDocker.TGraph, SpotOnDockerClient._to_networkx),
+        "TCompactGraph": (compact_graph(graph), SpotOnDocker.TCompactGraph, SpotOnDockerClient._compact_to_networkx),
+    }
+
+    rows = []
+    for name, (value, cls, to_networkx) in formats.items():
+        data = TSerialization.serialize(value)
+        times = []
+        for factory in PROTOCOLS.values():
+            times.append(best_time(lambda: TSerialization.deserialize(cls(), data, factory), repeat))
+        factory = PROTOCOLS["binary"]
+        times.append(best_time(lambda: to_networkx(TSerialization.deserialize(cls(), data, factory)), repeat))
+        rows.append((name, len(data), times))
+    return len(graph.edges), rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--states", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is reported).")
+    args = parser.parse_args()
+
+    print(f"{'states':>7} {'edges':>8} {'format':>14} {'bytes':>10} {'binary ms':>10} {'accel ms':>10} {'+nx ms':>10}")
+    for num_states in args.states:
+        num_edges, rows = measure(num_states, args.repeat)
+        for name, nbytes, times in rows:
+            print(f"{num_states:>7} {num_edges:>8} {name:>14} {nbytes:>10} " + " ".join(f"{1000 * t:>10.2f}" for t in times))
@@ -0,0 +1,75 @@
+"""
+Stand-in for `SpotOnDockerHandler` which does not need spot.
+
+Heavy calls (`Translate`, `TranslateCompact`, `Contains`, `IsEquivalent`) spin for `work` seconds of CPU time to
+imitate spot being CPU-bound; the remaining calls return immediately.
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import time
+from spotondocker.compact import compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+class StubHandler:
+    def __init__(self, work=0.005, num_states=4):
+        self.work = work
+        self.num_states = num_states
+
+    def _burn(self):
+        end = time.thread_time() + self.work
+        while time.thread_time() < end:
+            pass
+
+    def Ping(self):
+        pass
+
+    def MpClass(self, formula):
+        return "recurrence"
+
+    def Contains(self, formula1, formula2):
+        self._burn()
+        return True
+
+    def IsEquivalent(self, formula1, formula2):
+        self._burn()
+        return False
+
+    def RndLTL(self, numAP, rndSeed):
+        return "G(a -> Fb)"
+
+    def GetAP(self, formula):
+        return ["a", "b"]
+
+    def ToLatexString(self, formula):
+        return formula
+
+    def Translate(self, formula, options=None):
+        self._burn()
+        return make_graph(self.num_states, formula)
+
+    def TranslateCompact(self, formula, options=None):
+        return compact_graph(self.Translate(formula))
+
+
+def make_graph(num_states, formula="G(a -> Fb)", labels=("a & b", "a & !b", "!a & b", "!a & !b")):
+    """ Complete automaton with `num_states` states and one edge per (state, state, label) triple. """
+    nodes = [SpotOnDocker.TNode(id=i, isAcc=(i % 2 == 0)) for i in range(num_states)]
+    edges = [SpotOnDocker.TEdge(srcId=i, dstId=j, label=label)
+             for i in range(num_states) for j in range(num_states) for label in labels]
+    return SpotOnDocker.TGraph(
+        acceptance="Inf(0)",
+        numAccSets=1,
+        numStates=num_states,
+        initStates=[0],
+        apNames=["a", "b"],
+        formula=formula,
+        isDeterministic=False,
+        hasStateBasedAcc=True,
+        isTerminal=False,
+        nodes=nodes,
+        edges=edges,
+    )
@@ -68,6 +68,116 @@ struct TGraph {
     11: list<TEdge> edges,
 }
 
+/* 
+ * Automaton graph in columnar form (see `TranslateCompact`). States are numbered 0..numStates-1. 
+ * Bit `i % 8` of byte `i / 8` of `accepting` is set iff state `i` is accepting. Edge `k` goes from 
+ * `edgeSrc[k]` to `edgeDst[k]` and is labeled by `labels[edgeLabel[k]]`; each distinct label is 
+ * sent once. 
+ */
+struct TCompactGraph {
+    1: string acceptance,
+    2: i32 numAccSets,
+    3: i32 numStates,
+    4: list<i32> initStates,
+    5: list<string> apNames,
+    6: string formula,
+    7: bool isDeterministic,
+    8: bool hasStateBasedAcc,
+    9: bool isTerminal,
+    10: binary accepting,
+    11: list<string> labels,
+    12: list<i32> edgeSrc,
+    13: list<i32> edgeDst,
+    14: list<i32> edgeLabel,
+}
+
+/* 
+ * Open cursor of a paged translation (see `TranslateOpen`). `header` holds the automaton without 
+ * edges (its `labels`, `edgeSrc`, `edgeDst` and `edgeLabel` are empty). 
+ */
+struct TTranslateCursor {
+    1: i64 cursor,
+    2: TCompactGraph header,
+    3: i64 numEdges,
+}
+
+/* 
+ * Page of edges of a paged translation, in the columnar form of `TCompactGraph`. Label indices 
+ * refer to the concatenation of the `labels` of this and all previous pages: every page only 
+ * carries the labels which first occur in it. `last` is set on the final page. 
+ */
+struct TEdgePage {
+    1: list<string> labels,
+    2: list<i32> edgeSrc,
+    3: list<i32> edgeDst,
+    4: list<i32> edgeLabel,
+    5: bool last,
+}
+
+/* 
+ * Options of the translation of a formula to an automaton (see `spot::translator`). Unset fields 
+ * take the defaults below, which are also used when no options are given. 
+ * - `outputType`: "BA" (state-based Buchi), "TGBA", "GBA", "Buchi", "coBuchi", "Monitor", 
+ *   "parity" or "generic". 
+ * - `level`: optimization effort, "Low", "Medium" or "High". Lower levels translate faster, 
+ *   but may return bigger automata. 
+ * - `stateBasedAcc`: use state-based acceptance. 
+ * - `complete`: make the automaton complete. 
+ * - `deterministic`: prefer deterministic automata over small ones. 
+ */
+struct TTranslateOptions {
+    1: string outputType = "BA",
+    2: string level = "High",
+    3: bool stateBasedAcc = true,
+    4: bool complete = true,
+    5: bool deterministic = false,
+}
+
+/* Pair of formulas, argument of batched binary operations. */
+struct TFormulaPair {
+    1: string formula1,
+    2: string formula2,
+}
+
+/* 
+ * Per-item results of batched operations. 
+ * Exactly one of `value` and `error` is set. `error` describes why the item failed. 
+ */
+struct TStringResult {
+    1: string value,
+    2: string error,
+}
+
+struct TBoolResult {
+    1: bool value,
+    2: string error,
+}
+
+struct TStringListResult {
+    1: list<string> value,
+    2: string error,
+}
+
+struct TGraphResult {
+    1: TGraph value,
+    2: string error,
+}
+
+struct TCompactGraphResult {
+    1: TCompactGraph value,
+    2: string error,
+}
+
+/* Counters of the server-side result cache of one operation. */
+struct TCacheStats {
+    1: string operation,
+    2: i64 hits,
+    3: i64 misses,
+    4: i64 evictions,
+    5: i32 size,
+    6: i64 sizeBytes,
+}
+
 /* Functionality provided by SpotOnDocker service. */
 service SpotOnDocker {
     void Ping(),
@@ -77,5 +187,31 @@ service SpotOnDocker {
     string RndLTL(1:i32 numAP, 2:i32 rndSeed),
     list<string> GetAP(1:string formula),
     string ToLatexString(1:string formula),
-    TGraph Translate(1:string formula),
+    TGraph Translate(1:string formula, 2:TTranslateOptions options),
+
+    /* Same automaton as `Translate`, in a smaller and faster to decode format. */
+    TCompactGraph TranslateCompact(1:string formula, 2:TTranslateOptions options),
+
+    /* 
+     * Paged translation. `TranslateNext` returns the next (at most) `maxEdges` edges, and closes 
+     * the cursor after the last page. Cursors belong to the connection's server process, so all 
+     * calls for one cursor must use the same connection. 
+     */
+    TTranslateCursor TranslateOpen(1:string formula, 2:TTranslateOptions options),
+    TEdgePage TranslateNext(1:i64 cursor, 2:i32 maxEdges),
+    void TranslateClose(1:i64 cursor),
+
+    /* Batched variants: one result per input item, in the same order. */
+    list<TStringResult> MpClassBatch(1:list<string> formulas),
+    list<TBoolResult> ContainsBatch(1:list<TFormulaPair> pairs),
+    list<TBoolResult> IsEquivalentBatch(1:list<TFormulaPair> pairs),
+    list<TStringListResult> GetAPBatch(1:list<string> formulas),
+    list<TStringResult> ToLatexStringBatch(1:list<string> formulas),
+    list<TGraphResult> TranslateBatch(1:list<string> formulas, 2:TTranslateOptions options),
+    list<TCompactGraphResult> TranslateCompactBatch(1:list<string> formulas, 2:TTranslateOptions options),
+
+    list<TCacheStats> GetCacheStats(),
+
+    /* Version of the server and of spot. Results of other calls may change with it. */
+    string Version(),
 }
@@ -0,0 +1,302 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: aioclient.py
+Description:
+    The file defines `AsyncSpotOnDockerClient` class, an asyncio version of `SpotOnDockerClient` which
+    pipelines many in-flight requests over a single connection to a SpotOnDocker server.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from spotondocker.client import SpotOnDockerClient, SpotOnDockerError
+from spotondocker import wire
+from thrift.Thrift import TApplicationException, TMessageType
+from thrift.transport import TTransport
+
+import asyncio
+import struct
+
+
+class AsyncSpotOnDockerClient:
+    """
+    asyncio client for a running SpotOnDocker server at `host:port` (e.g. the container started by
+    `SpotOnDockerClient`, or one started with `docker run -p 7159:7159 abhibp1993/spotondocker
+    python3 server.py * 7159`), or at the Unix domain socket `unix_socket`.
+
+    All requests share one connection. A request is written as soon as it is issued, without
+    waiting for the replies to earlier requests, and every reply is matched to its request by the
+    Thrift sequence id. Hence, any number of coroutines can await calls concurrently.
+
+    The server answers the requests on one connection in order, so pipelining saves the round
+    trips but does not make the server compute in parallel.
+
+    `protocol` and `transport` must be those of the server (see `SpotOnDockerClient`).
+
+    Usage:
+        async with AsyncSpotOnDockerClient(port=7159) as client:
+            classes = await asyncio.gather(*(client.mp_class(f) for f in formulas))
+    """
+    # Maximum number of items sent in one message by the batched methods.
+    batch_chunk_size = SpotOnDockerClient.batch_chunk_size
+
+    # Number of bytes requested from the socket per read.
+    read_size = 2 ** 16
+
+    def __init__(self, port=None, host="localhost", unix_socket=None, protocol="accelerated", transport="buffered"):
+        wire.check(protocol, transport)
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.framed = transport == "framed"
+
+        self._protocol_factory = wire.protocol_factory(protocol)
+        self._reader = None
+        self._writer = None
+        self._receiver = None
+        self._pending = dict()
+        self._seqid = 0
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self):
+        if self.unix_socket is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        else:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_socket)
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    async def close(self):
+        if self._writer is None:
+            return
+
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+        self._fail_pending(TTransport.TTransportException(TTransport.TTransportException.NOT_OPEN, "Connection closed"))
+        self._writer = None
+
+    async def _call(self, method, *args):
+        if self._writer is None:
+            raise TTransport.TTransportException(TTransport.TTransportException.NOT_OPEN, "Client is not connected")
+
+        self._seqid = (self._seqid + 1) % 2 ** 31
+        seqid = self._seqid
+
+        buf = TTransport.TMemoryBuffer()
+        oprot = self._protocol_factory.getProtocol(buf)
+        oprot.writeMessageBegin(method, TMessageType.CALL, seqid)
+        getattr(SpotOnDocker, f"{method}_args")(*args).write(oprot)
+        oprot.writeMessageEnd()
+        data = buf.getvalue()
+        if self.framed:
+            data = struct.pack("!i", len(data)) + data
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[seqid] = future
+        self._writer.write(data)
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self):
+        """ Reads replies from the connection and resolves the futures of the matching requests. """
+        data = bytearray()
+        try:
+            while True:
+                chunk = await self._reader.read(self.read_size)
+                if not chunk:
+                    raise TTransport.TTransportException(TTransport.TTransportException.END_OF_FILE, "Connection closed by server")
+                data += chunk
+
+                # Unless framed, the length of a reply is unknown. So, try to decode one after every 
+                # read, and keep the bytes if the reply is still incomplete.
+                while data:
+                    nbytes = self._dispatch(bytes(data))
+                    if nbytes == 0:
+                        break
+                    del data[:nbytes]
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self._fail_pending(err)
+
+    def _dispatch(self, data):
+        """ Decodes one reply from `data` and returns its length in bytes, or 0 if it is incomplete. """
+        if self.framed:
+            if len(data) < 4:
+                return 0
+            size = struct.unpack("!i", data[:4])[0]
+            if len(data) < 4 + size:
+                return 0
+            self._decode(data[4: 4 + size])
+            return 4 + size
+        return self._decode(data)
+
+    def _decode(self, data):
+        """ Decodes one reply from the start of `data` and returns its length in bytes, or 0 if it is incomplete. """
+        buf = TTransport.TMemoryBuffer(data)
+        iprot = self._protocol_factory.getProtocol(buf)
+        try:
+            method, mtype, seqid = iprot.readMessageBegin()
+            if mtype == TMessageType.EXCEPTION:
+                result = TApplicationException()
+            else:
+                result = getattr(SpotOnDocker, f"{method}_result")()
+            result.read(iprot)
+            iprot.readMessageEnd()
+        except (EOFError, struct.error):
+            return 0
+
+        future = self._pending.pop(seqid, None)
+        if future is not None and not future.done():
+            if mtype == TMessageType.EXCEPTION:
+                future.set_exception(result)
+            elif not result.thrift_spec:
+                # void method
+                future.set_result(None)
+            elif result.success is not None:
+                future.set_result(result.success)
+            else:
+                future.set_exception(TApplicationException(TApplicationException.MISSING_RESULT, f"{method} failed: unknown result"))
+
+        return buf._buffer.tell()
+
+    def _fail_pending(self, err):
+        pending, self._pending = self._pending, dict()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(err)
+
+    async def _call_batch(self, method, items, convert=None, args=()):
+        """
+        Like `SpotOnDockerClient._call_batch`, except that all chunks are sent at once.
+        Failed items are returned as `SpotOnDockerError`.
+        """
+        items = list(items)
+        chunks = [items[start: start + self.batch_chunk_size] for start in range(0, len(items), self.batch_chunk_size)]
+        replies = await asyncio.gather(*(self._call(method, chunk, *args) for chunk in chunks))
+
+        values = []
+        for reply in replies:
+            for result in reply:
+                if result.error is not None:
+                    values.append(SpotOnDockerError(result.error))
+                elif convert is None:
+                    values.append(result.value)
+                else:
+                    values.append(convert(result.value))
+        return values
+
+    async def ping(self):
+        await self._call("Ping")
+
+    async def version(self):
+        """ Returns the version string of the server. """
+        return await self._call("Version")
+
+    async def mp_class(self, formula):
+        """ See `SpotOnDockerClient.mp_class`. """
+        return await self._call("MpClass", formula)
+
+    async def contains(self, formula1, formula2):
+        """ See `SpotOnDockerClient.contains`. """
+        return await self._call("Contains", formula1, formula2)
+
+    async def equiv(self, formula1, formula2):
+        """ See `SpotOnDockerClient.equiv`. """
+        return await self._call("IsEquivalent", formula1, formula2)
+
+    async def rand_ltl(self, numAP, rndSeed):
+        """ See `SpotOnDockerClient.rand_ltl`. """
+        return await self._call("RndLTL", numAP, rndSeed)
+
+    async def get_ap(self, formula):
+        """ See `SpotOnDockerClient.get_ap`. """
+        return await self._call("GetAP", formula)
+
+    async def to_string_latex(self, formula):
+        return await self._call("ToLatexString", formula)
+
+    async def translate(self, formula, return_type="networkx", options=None):
+        """ See `SpotOnDockerClient.translate`. """
+        convert = SpotOnDockerClient._graph_converter(return_type)
+        options = SpotOnDockerClient._translate_options(options)
+        return convert(await self._call("TranslateCompact", formula, options))
+
+    async def cache_stats(self):
+        """ See `SpotOnDockerClient.cache_stats`. """
+        return {
+            s.operation: {"hits": s.hits, "misses": s.misses, "evictions": s.evictions, "size": s.size, "sizeBytes": s.sizeBytes}
+            for s in await self._call("GetCacheStats")
+        }
+
+    async def mp_class_batch(self, formulas):
+        """ See `SpotOnDockerClient.mp_class_batch`. """
+        return await self._call_batch("MpClassBatch", formulas)
+
+    async def contains_batch(self, pairs):
+        """ Batched `contains`. `pairs` is an iterable of `(formula1, formula2)` tuples. """
+        pairs = [SpotOnDocker.TFormulaPair(formula1=f1, formula2=f2) for f1, f2 in pairs]
+        return await self._call_batch("ContainsBatch", pairs)
+
+    async def equiv_batch(self, pairs):
+        """ Batched `equiv`. `pairs` is an iterable of `(formula1, formula2)` tuples. """
+        pairs = [SpotOnDocker.TFormulaPair(formula1=f1, formula2=f2) for f1, f2 in pairs]
+        return await self._call_batch("IsEquivalentBatch", pairs)
+
+    async def get_ap_batch(self, formulas):
+        """ Batched `get_ap`. """
+        return await self._call_batch("GetAPBatch", formulas)
+
+    async def to_string_latex_batch(self, formulas):
+        """ Batched `to_string_latex`. """
+        return await self._call_batch("ToLatexStringBatch", formulas)
+
+    async def translate_batch(self, formulas, return_type="networkx", options=None):
+        """ Batched `translate`. Returns a `networkx.MultiDiGraph` (or an `Automaton`) per formula. """
+        convert = SpotOnDockerClient._graph_converter(return_type)
+        options = SpotOnDockerClient._translate_options(options)
+        return await self._call_batch("TranslateCompactBatch", formulas, convert=convert, args=(options, ))
@@ -0,0 +1,176 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: automaton.py
+Description:
+    The file defines `Automaton` class, a compact read-only representation of the automata returned
+    by `SpotOnDockerClient.translate(..., return_type="automaton")`.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from array import array
+from spotondocker.compact import unpack_bits
+
+import sys
+
+
+class Automaton:
+    """
+    Read-only automaton stored in compressed sparse row (CSR) form.
+
+    The out-edges of state `s` are the edges `offsets[s]` to `offsets[s + 1] - 1`. Edge `k` goes to
+    state `targets[k]` and is labeled by `labels[edgeLabels[k]]`. `offsets`, `targets` and
+    `edgeLabels` are `array.array('i')` objects, so they support the buffer protocol (e.g.
+    `numpy.frombuffer(aut.targets, dtype=numpy.int32)` is a view without copy). Label strings are
+    interned, so automata over the same propositions share them.
+
+    The graph-level properties of `TGraph` are available as attributes with the same names as the
+    graph attributes of the `networkx.MultiDiGraph` returned by `translate` (`acc`, `numAccSets`,
+    `numStates`, `initStates`, `apNames`, `formula`, `isDeterministic`, `hasStateBasedAcc`,
+    `isTerminal`). `to_networkx()` returns that graph.
+    """
+    __slots__ = ("acc", "numAccSets", "numStates", "initStates", "apNames", "formula", "isDeterministic",
+                 "hasStateBasedAcc", "isTerminal", "accepting", "labels", "offsets", "targets", "edgeLabels")
+
+    def __init__(self, acc, numAccSets, numStates, initStates, apNames, formula, isDeterministic,
+                 hasStateBasedAcc, isTerminal, accepting, labels, offsets, targets, edgeLabels):
+        self.acc = acc
+        self.numAccSets = numAccSets
+        self.numStates = numStates
+        self.initStates = tuple(initStates)
+        self.apNames = tuple(sys.intern(ap) for ap in apNames)
+        self.formula = formula
+        self.isDeterministic = isDeterministic
+        self.hasStateBasedAcc = hasStateBasedAcc
+        self.isTerminal = isTerminal
+        # Packed bitmap, see `compact.pack_bits`.
+        self.accepting = bytes(accepting)
+        self.labels = tuple(sys.intern(label) for label in labels)
+        self.offsets = offsets
+        self.targets = targets
+        self.edgeLabels = edgeLabels
+
+    @classmethod
+    def from_compact(cls, compactGraph):
+        """ Builds an automaton from a `TCompactGraph`. """
+        g = compactGraph
+        return cls._from_columns(g, g.labels, g.edgeSrc, g.edgeDst, g.edgeLabel)
+
+    @classmethod
+    def from_pages(cls, header, pages):
+        """ 
+        Builds an automaton from the header and the `TEdgePage`s of a paged translation (see 
+        `SpotOnDockerClient.iter_translate_pages`). Pages are consumed one at a time. 
+        """
+        labels, src, dst, lbl = [], array('i'), array('i'), array('i')
+        for page in pages:
+            labels.extend(page.labels)
+            src.extend(page.edgeSrc)
+            dst.extend(page.edgeDst)
+            lbl.extend(page.edgeLabel)
+        return cls._from_columns(header, labels, src, dst, lbl)
+
+    @classmethod
+    def _from_columns(cls, compactGraph, labels, src, dst, lbl):
+        n = compactGraph.numStates
+
+        # Edges usually arrive grouped by source state. Otherwise, sort them (stably) by source.
+        if any(src[k] > src[k + 1] for k in range(len(src) - 1)):
+            order = sorted(range(len(src)), key=src.__getitem__)
+            dst = [dst[k] for k in order]
+            lbl = [lbl[k] for k in order]
+
+        counts = array('i', [0]) * (n + 1)
+        for s in src:
+            counts[s + 1] += 1
+        for s in range(n):
+            counts[s + 1] += counts[s]
+
+        return cls(
+            acc=compactGraph.acceptance,
+            numAccSets=compactGraph.numAccSets,
+            numStates=n,
+            initStates=compactGraph.initStates,
+            apNames=compactGraph.apNames,
+            formula=compactGraph.formula,
+            isDeterministic=compactGraph.isDeterministic,
+            hasStateBasedAcc=compactGraph.hasStateBasedAcc,
+            isTerminal=compactGraph.isTerminal,
+            accepting=compactGraph.accepting,
+            labels=labels,
+            offsets=counts,
+            targets=dst if isinstance(dst, array) else array('i', dst),
+            edgeLabels=lbl if isinstance(lbl, array) else array('i', lbl),
+        )
+
+    def __repr__(self):
+        return f"Automaton(formula={self.formula!r}, numStates={self.numStates}, numEdges={self.num_edges})"
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def is_accepting(self, state):
+        return bool(self.accepting[state >> 3] >> (state & 7) & 1)
+
+    def accepting_states(self):
+        return [s for s, isAcc in enumerate(unpack_bits(self.accepting, self.numStates)) if isAcc]
+
+    def out(self, state):
+        """ Returns the out-edges of `state` as a list of `(dst, label)` tuples. """
+        labels, targets, edgeLabels = self.labels, self.targets, self.edgeLabels
+        return [(targets[k], labels[edgeLabels[k]]) for k in range(self.offsets[state], self.offsets[state + 1])]
+
+    def edges(self):
+        """ Iterates over all edges as `(src, dst, label)` tuples, grouped by source state. """
+        labels, targets, edgeLabels, offsets = self.labels, self.targets, self.edgeLabels, self.offsets
+        for src in range(self.numStates):
+            for k in range(offsets[src], offsets[src + 1]):
+                yield src, targets[k], labels[edgeLabels[k]]
+
+    def to_networkx(self):
+        """ Returns the automaton as the `networkx.MultiDiGraph` which `translate` returns by default. """
+        import networkx as nx
+        aut = nx.MultiDiGraph(
+                acc=self.acc,
+                numAccSets=self.numAccSets,
+                numStates=self.numStates,
+                initStates=list(self.initStates),
+                apNames=list(self.apNames),
+                formula=self.formula,
+                isDeterministic=self.isDeterministic,
+                hasStateBasedAcc=self.hasStateBasedAcc,
+                isTerminal=self.isTerminal
+            )
+        aut.add_nodes_from((i, {"isAcc": isAcc}) for i, isAcc in enumerate(unpack_bits(self.accepting, self.numStates)))
+        aut.add_edges_from((src, dst, {"label": label}) for src, dst, label in self.edges())
+        return aut
@@ -0,0 +1,145 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: backends.py
+Description:
+    The file defines the backends of `SpotOnDockerClient` which do not use docker: `LocalServer`
+    class, which runs the server in a child process, and `InProcessConnection` class, which calls a
+    `SpotOnDockerHandler` in the client's own process.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from thrift.Thrift import TApplicationException
+
+import importlib.util
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+dir_spotondocker = os.path.dirname(os.path.realpath(__file__))
+
+# Backends accepted by `SpotOnDockerClient`.
+BACKENDS = ("docker", "subprocess", "inprocess", "auto")
+
+
+def spot_available():
+    """ Whether spot can be imported by this Python interpreter. """
+    return importlib.util.find_spec("spot") is not None
+
+
+def resolve_backend(backend):
+    """ Returns the backend to use for `backend`: "auto" is "inprocess" if spot is available, else "docker". """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, not {backend!r}")
+    if backend == "auto":
+        return "inprocess" if spot_available() else "docker"
+    return backend
+
+
+class LocalServer:
+    """
+    Runs `server.py` with the local Python interpreter (which must be able to import spot), in a
+    child process. The server listens on a Unix domain socket in a temporary directory (`socket_path`)
+    or, where those are not available, on a free loopback TCP port (`host`, `port`).
+
+    `server_args` are further command line arguments of `server.py` (e.g. `["--workers", "4"]`).
+    """
+    def __init__(self, server_args=()):
+        self.host = None
+        self.port = None
+        self.socket_path = None
+        self.socket_dir = None
+
+        command = [sys.executable, os.path.join(dir_spotondocker, "server.py")]
+        if hasattr(socket, "AF_UNIX"):
+            self.socket_dir = tempfile.mkdtemp(prefix="spotondocker.")
+            self.socket_path = os.path.join(self.socket_dir, "server.sock")
+            command += ["--unix-socket", self.socket_path]
+        else:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind(("127.0.0.1", 0))
+                self.host, self.port = "127.0.0.1", s.getsockname()[1]
+            command += [self.host, str(self.port)]
+
+        self.process = subprocess.Popen(command + list(server_args), cwd=dir_spotondocker, stdout=subprocess.DEVNULL)
+
+    def exited(self):
+        """ Returns the exit code of the server, or `None` while it is running. """
+        return self.process.poll()
+
+    def close(self):
+        """ Stops the server and removes its socket directory. """
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.socket_dir is not None:
+            shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+
+class InProcessConnection:
+    """
+    Stands in for both the transport and the `SpotOnDocker.Client` of a pooled connection, but calls
+    the methods of `handler` directly, without serializing anything.
+
+    Calls are serialized by `lock` (spot is not thread-safe), which should be shared by all
+    connections to the same handler. As with a remote server, errors raised by the handler are
+    raised as `TApplicationException` (the original exception is its `__cause__`).
+    """
+    def __init__(self, handler, lock=None):
+        self._handler = handler
+        self._lock = threading.Lock() if lock is None else lock
+
+    def isOpen(self):
+        return True
+
+    def close(self):
+        pass
+
+    def __getattr__(self, method):
+        func = getattr(self._handler, method)
+
+        def call(*args):
+            with self._lock:
+                try:
+                    return func(*args)
+                except Exception as err:
+                    raise TApplicationException(TApplicationException.INTERNAL_ERROR, f"{type(err).__name__}: {err}") from err
+
+        return call
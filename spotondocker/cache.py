@@ -0,0 +1,217 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: cache.py
+Description:
+    The file defines `LRUCache` class which is used by `SpotOnDockerHandler` to remember the results
+    of expensive spot calls, and `PersistentCache` class which is used by `SpotOnDockerClient` to 
+    keep results on disk across processes.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from collections import OrderedDict
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+
+def approx_sizeof(obj):
+    """
+    Approximate deep size of `obj` in bytes. Follows containers and the `__dict__` of objects
+    (e.g. Thrift structs). Shared objects are counted once per reference.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return size + sum(approx_sizeof(k) + approx_sizeof(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(approx_sizeof(item) for item in obj)
+    if hasattr(obj, "__dict__"):
+        return size + approx_sizeof(obj.__dict__)
+    return size
+
+
+class LRUCache:
+    """
+    Thread-safe mapping which evicts the least recently used entries once it holds more than
+    `maxsize` entries or more than `maxbytes` bytes (as estimated by `sizeof`).
+
+    `maxsize=0` disables the cache. Hits, misses and evictions are counted.
+    """
+    def __init__(self, maxsize=4096, maxbytes=64 * 2 ** 20, sizeof=approx_sizeof):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+
+        nbytes = self.sizeof(key) + self.sizeof(value)
+        if nbytes > self.maxbytes:
+            # Would evict everything else and still not fit.
+            return
+
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data.pop(key)[1]
+            self._data[key] = (value, nbytes)
+            self.nbytes += nbytes
+
+            while len(self._data) > self.maxsize or self.nbytes > self.maxbytes:
+                _, (_, evicted_nbytes) = self._data.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+                self.evictions += 1
+
+    def get_or_compute(self, key, func):
+        """ Returns the cached value of `key`, computing it with `func()` (outside the lock) on a miss. """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+
+class PersistentCache:
+    """
+    On-disk key-value store backed by a SQLite database at `path`. It can be shared by several 
+    processes. Keys are strings and values are bytes.
+
+    Once the store holds more than `maxsize` entries or more than `maxbytes` bytes of values, 
+    the least recently used entries are deleted until both are below 90% of their limits. 
+    Limits are checked every few writes, so they may be exceeded briefly.
+    """
+    def __init__(self, path, maxsize=1000000, maxbytes=2 ** 30):
+        self.path = path
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS results "
+                         "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+        self._writes_since_check = 0
+        self._bytes_since_check = 0
+        with self._lock:
+            self._evict()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        """ Returns the value stored under `key`, or `None`. """
+        with self._lock:
+            row = self._db.execute("SELECT value FROM results WHERE key = ?", (key, )).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+            return bytes(row[0])
+
+    def put(self, key, value):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, value, len(value), time.time()))
+            self._writes_since_check += 1
+            self._bytes_since_check += len(value)
+            if self._writes_since_check >= 64 or self._bytes_since_check >= self.maxbytes // 100:
+                self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _evict(self):
+        self._writes_since_check = 0
+        self._bytes_since_check = 0
+
+        count, nbytes = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.maxsize and nbytes <= self.maxbytes:
+            return
+
+        target_count, target_bytes = int(0.9 * self.maxsize), int(0.9 * self.maxbytes)
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if count <= target_count and nbytes <= target_bytes:
+                break
+            victims.append((key, ))
+            count -= 1
+            nbytes -= size
+
+        self._db.executemany("DELETE FROM results WHERE key = ?", victims)
+        self.evictions += len(victims)
@@ -37,58 +37,207 @@ Description:
 Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
 """
 
-import sys, os
-dir_spotondocker = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(dir_spotondocker)
-
-from genpy.spotondocker import SpotOnDocker
+# Imports are kept light: docker, networkx, sqlite3 and the Thrift socket transport are imported 
+# on first use (launching a container, returning a graph, using the persistent cache, connecting). 
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from spotondocker.automaton import Automaton
+from spotondocker.backends import InProcessConnection, LocalServer, resolve_backend
+from spotondocker.compact import unpack_bits
+from spotondocker.pool import ConnectionPool
+from spotondocker import wire
 from thrift import Thrift
-from thrift.transport import TSocket
 from thrift.transport import TTransport
-from thrift.protocol import TBinaryProtocol
 
 import contextlib 
-import docker
-import networkx as nx
+import hashlib
+import itertools
+import json
+import logging
 import os
+import shutil
 import socket
+import sys
+import tempfile
+import threading
 import time
 
 
+logger = logging.getLogger(__name__)
+
+
+class SpotOnDockerError(Exception):
+    """ Error reported by SpotOnDocker server for one item of a batched call. """
+    pass
+
+
 class SpotOnDockerClient:
-     """
+    """
     Wraps the server-client communication with a Docker container with a proper installation of spot (see: https://spot.lrde.epita.fr/).
     
     Functionality:
-        - Creates a new docker container and launches SpotOnDocker server on it.
+        - Creates a new docker container and launches SpotOnDocker server on it (or attaches to a 
+          running one).
         - Manages communication with SpotOnDocker server. 
         - Exposes "some" of the spot functionality. 
 
+    The client is thread-safe. Every call checks out one of at most `pool_size` Thrift 
+    connections, waiting up to `pool_timeout` seconds (forever if `None`) for a free one. 
+    Note that the server must be able to serve `pool_size` connections concurrently.
+
+    If `cache_dir` is given, results of `translate`, `mp_class`, `contains`, `equiv` and `get_ap` 
+    (and of their batched variants) are also stored in a SQLite database in that directory, which 
+    is shared by all clients using the same directory. The database holds at most `cache_max_mb` 
+    MiB of results, evicting the least recently used ones. Entries are keyed by operation, 
+    arguments and server version, so upgrading the image does not return stale results.
+
+    After launching the container, the client pings the server (retrying with exponential backoff) 
+    until it answers, for at most `client_wait_time` milliseconds. The time from launching the 
+    container until the server answered is stored in `startup_latency` (seconds).
+
+    Container lifecycle:
+        - By default, a new container is launched and killed when the client is closed (or 
+          garbage-collected).
+        - If a container named `container_name` is already running, the client attaches to it 
+          (using its port) instead of launching one, and leaves it running when closed. 
+        - With `keep_alive=True`, a container that is launched is also left running, so that later 
+          clients (in this or other processes) attach to it. If no `container_name` is given, 
+          `SHARED_CONTAINER_NAME` is used. The server in such a container exits, and the container 
+          is removed, after `idle_timeout` seconds without connected clients.
+        - With `host`, the client connects to the server at `host:port` and does not use docker.
+
+    With `unix_socket=True`, a launched server listens on a Unix domain socket in a temporary 
+    directory, which is bind-mounted into the container, instead of a published TCP port. This 
+    avoids the docker proxy and the TCP stack on every call (Linux hosts only). The client also 
+    uses the socket when attaching to a container launched this way. With `unix_socket=<path>`, 
+    the client connects to a server listening at `<path>` and does not use docker.
+
+    When attaching, note that the server may not serve `pool_size` connections concurrently.
+
+    Backends: the server may also run without docker, where spot is installed. 
+        - `backend="docker"` (default): the server runs in a container, as described above.
+        - `backend="subprocess"`: the client runs `server.py` in a child process of the local 
+          Python interpreter, connected by a Unix domain socket, and stops it when closed. 
+        - `backend="inprocess"`: the client calls a `SpotOnDockerHandler` in its own process, 
+          without any serialization. Errors are raised as `TApplicationException`, as for the 
+          other backends. 
+        - `backend="auto"`: "inprocess" if spot can be imported, else "docker". 
+    The backend is ignored if `host` or a `unix_socket` path is given.
+
+    `protocol` ("binary", "accelerated" or "compact") and `transport` ("buffered" or "framed") 
+    select the Thrift protocol and transport (see `spotondocker.wire`). A launched server is 
+    started with the same ones; when attaching to a container, the client uses those the container 
+    was started with. A server given by `host` or `unix_socket` must use the same ones. 
+
+    With `nonblocking=True` (requires `transport="framed"`), a launched server serves all 
+    connections from a non-blocking I/O loop and computes the calls in `pool_size` worker processes 
+    (`server.py --nonblocking`), so that cheap calls of other clients are not held up by a slow one. 
     """
-    def __init__(self, container_name=None, port=None, client_wait_time=2000):
+    # Maximum number of items sent in one message by the batched methods. 
+    batch_chunk_size = 1000
+
+    # Remote methods whose results are stored in the persistent cache.
+    PERSISTENT_CACHE_METHODS = ("MpClass", "Contains", "IsEquivalent", "GetAP", "Translate", "TranslateCompact")
+
+    # Name of the container shared by `keep_alive` clients which do not name one.
+    SHARED_CONTAINER_NAME = "spotondocker.shared"
+
+    # Directory of the server's Unix domain socket inside the container.
+    CONTAINER_SOCKET_DIR = "/var/run/spotondocker"
+
+    def __init__(self, container_name=None, port=None, client_wait_time=2000, pool_size=1, pool_timeout=None, 
+                 cache_dir=None, cache_max_mb=1024, host=None, keep_alive=False, idle_timeout=600, unix_socket=None, 
+                 backend="docker", protocol="accelerated", transport="buffered", nonblocking=False):
+        wire.check(protocol, transport)
+        if nonblocking and transport != "framed":
+            raise ValueError("nonblocking=True requires transport='framed'")
+
         # Internal parameters: docker container 
-        self.dclient = docker.from_env() 
-        self.port = self._find_free_port() if port is None else port
-        self.container_name = f"spotondocker.pyclient.{self.port}" if container_name is None else container_name
+        self.host = "localhost" if host is None else host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.socket_path = unix_socket if isinstance(unix_socket, str) else None
+        self.socket_dir = None
+        self.container_name = container_name
         self.container = None
-        self._create_docker_container()
+        self.owns_container = False
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
+        self.pool_size = pool_size
+        self.protocol = protocol
+        self.transport = transport
+        self.nonblocking = nonblocking
+        self.client_wait_time = client_wait_time
+        self.backend = resolve_backend(backend) if host is None and self.socket_path is None else "remote"
+        self.server_process = None
+        self.handler = None
+        self.startup_latency = None
+        self._started_at = time.monotonic()
+        if self.backend == "docker":
+            import docker
+            self.dclient = docker.from_env() 
+            self._attach_or_create_container()
+        elif self.backend == "subprocess":
+            self._start_local_server()
+        elif self.backend == "inprocess":
+            self._start_handler()
+        elif host is not None and port is None:
+            raise ValueError("`port` is required to connect to a server by `host`.")
 
         # Thrift Client initialize
-        self.client = None
-        self.transport = None
+        self.pool_timeout = pool_timeout
+        self.pool = None
         self._start_thrift_client()
 
+        # Persistent cache (optional)
+        self.disk_cache = None
+        self.server_version = None
+        if cache_dir is not None:
+            from spotondocker.cache import PersistentCache
+            path = os.path.join(os.path.expanduser(cache_dir), "results.sqlite")
+            self.disk_cache = PersistentCache(path, maxbytes=int(cache_max_mb * 2 ** 20))
+            self.server_version = self._get_server_version()
+
     def __del__(self):
+        self.close()
+
+    def close(self):
+        """ 
+        Closes the connections, and kills the container unless it is shared (see class documentation) 
+        or the local server process. 
+        """
         try:
-            self._stop_docker_container()
+            if self.owns_container:
+                self.owns_container = False
+                self._stop_docker_container()
+                if self.socket_dir is not None:
+                    shutil.rmtree(self.socket_dir, ignore_errors=True)
         except:
             pass
 
         try:
-            self.transport.close()
+            if self.server_process is not None:
+                self.server_process.close()
+                self.server_process = None
+        except:
+            pass
+
+        try:
+            self.pool.close()
+        except:
+            pass
+
+        try:
+            self.disk_cache.close()
         except:
             pass
     
+    @property
+    def address(self):
+        """ Address of the server: the path of its Unix domain socket, or `host:port` (`"inprocess"` for that backend). """
+        if self.handler is not None:
+            return "inprocess"
+        return self.socket_path if self.socket_path is not None else f"{self.host}:{self.port}"
+
     @staticmethod
     def _find_free_port():
         """ 
@@ -101,24 +250,96 @@ class SpotOnDockerClient:
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             return s.getsockname()[1]
     
+    def _attach_or_create_container(self):
+        import docker
+
+        if self.container_name is None and self.keep_alive:
+            self.container_name = self.SHARED_CONTAINER_NAME
+
+        if self.container_name is not None:
+            self.container = self._find_container(self.container_name)
+
+        if self.container is None:
+            if self.unix_socket:
+                self.socket_dir = tempfile.mkdtemp(prefix="spotondocker.")
+                self.socket_path = os.path.join(self.socket_dir, "server.sock")
+                if self.container_name is None:
+                    self.container_name = f"spotondocker.pyclient.{os.path.basename(self.socket_dir)}"
+            elif self.port is None:
+                self.port = self._find_free_port()
+            if self.container_name is None:
+                self.container_name = f"spotondocker.pyclient.{self.port}"
+            try:
+                self._create_docker_container()
+                self.owns_container = not self.keep_alive
+                return
+            except docker.errors.APIError as err:
+                if err.status_code != 409:
+                    raise
+                # Another process launched a container with the same name in the meantime.
+                self.container = self._find_container(self.container_name)
+                if self.container is None:
+                    raise
+
+        # Attach to the running container, using its protocol and transport. 
+        command = self.container.attrs.get("Config", {}).get("Cmd") or []
+        self.protocol, self.transport = wire.parse_server_args(command.split() if isinstance(command, str) else command)
+        for mount in self.container.attrs.get("Mounts", []):
+            if mount.get("Destination") == self.CONTAINER_SOCKET_DIR:
+                self.socket_path = os.path.join(mount["Source"], "server.sock")
+                return
+        bindings = self.container.attrs["HostConfig"]["PortBindings"]
+        self.port = int(next(iter(bindings.values()))[0]["HostPort"])
+
+    def _find_container(self, name):
+        """ Returns the container called `name` if it is running (or starting), else `None`. """
+        import docker
+
+        try:
+            container = self.dclient.containers.get(name)
+        except docker.errors.NotFound:
+            return None
+
+        if container.status in ("exited", "dead"):
+            # Stopped, but not removed yet. 
+            try:
+                container.remove(force=True)
+            except docker.errors.APIError:
+                pass
+            return None
+        return container
+
     def _create_docker_container(self):
         # Create and run docker container
         # print("Launching docker container... might take a few seconds.")
+        if self.socket_dir is None:
+            ports, volumes = {self.port: self.port}, None
+        else:
+            ports, volumes = None, {self.socket_dir: {"bind": self.CONTAINER_SOCKET_DIR, "mode": "rw"}}
         self.container = self.dclient.containers.run(image="abhibp1993/spotondocker",
                                     auto_remove=True,
                                     detach=True,
-                                    ports={self.port:self.port},
+                                    ports=ports,
                                     name=self.container_name,
-                                    #volumes={os.path.dirname(os.path.realpath(__file__)): {'bind': "/home/server", "mode": 'rw'}},
-                                    # volumes={os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "docker_server"): {'bind': "/home/server", "mode": 'rw'}},
-                                    command=f"python3 server.py * {self.port}"
+                                    volumes=volumes,
+                                    command=self._server_command()
                 )
 
-        # Allow the process to start
-        time.sleep(0.5)
-
-        # TODO: Check if python is running 
-        # print("Created docker", self.container.status)
+    def _server_command(self):
+        if self.socket_dir is None:
+            command = f"python3 server.py * {self.port}"
+        else:
+            command = f"python3 server.py --unix-socket {self.CONTAINER_SOCKET_DIR}/server.sock"
+        if self.pool_size > 1:
+            # One worker process per pooled connection, so that no connection waits on another. 
+            command += f" --workers {self.pool_size}"
+        if self.nonblocking:
+            command += " --nonblocking"
+        if self.keep_alive and self.idle_timeout:
+            command += f" --idle-timeout {self.idle_timeout}"
+        for arg in wire.server_args(self.protocol, self.transport):
+            command += f" {arg}"
+        return command
 
     def _stop_docker_container(self):
         try:
@@ -127,24 +348,173 @@ class SpotOnDockerClient:
             pass
         # print("Killed docker")
 
+    def _start_local_server(self):
+        args = ["--workers", str(self.pool_size)] if self.pool_size > 1 else []
+        args += ["--nonblocking"] if self.nonblocking else []
+        args += wire.server_args(self.protocol, self.transport)
+        self.server_process = LocalServer(args)
+        self.socket_path = self.server_process.socket_path
+        if self.socket_path is None:
+            self.host, self.port = self.server_process.host, self.server_process.port
+
+    def _start_handler(self):
+        # Imports spot. 
+        from spotondocker.server import SpotOnDockerHandler
+        self.handler = SpotOnDockerHandler()
+        self._handler_lock = threading.Lock()
+
     def _start_thrift_client(self):
+        self.pool = ConnectionPool(self._connect, size=self.pool_size, timeout=self.pool_timeout)
+
+        # Open the first connection eagerly, so that connection errors surface here.
+        self._wait_until_ready()
+
+    def _wait_until_ready(self):
+        """
+        Pings the server until it answers, retrying with exponential backoff until `client_wait_time` 
+        ms have passed since the container was launched. The connection that answered stays in the pool. 
+        """
+        deadline = self._started_at + self.client_wait_time / 1000
+        delay = 0.01
+        while True:
+            try:
+                with self.pool.connection() as client:
+                    client.Ping()
+                break
+            except (TTransport.TTransportException, OSError, EOFError) as err:
+                # Server not listening yet (or docker proxy accepted and closed the connection).
+                if self.server_process is not None and self.server_process.exited() is not None:
+                    raise RuntimeError(f"Local SpotOnDocker server exited with code {self.server_process.exited()} "
+                                       f"(is spot installed for {sys.executable}?).") from err
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"SpotOnDocker server at {self.address} did not answer within "
+                                       f"{self.client_wait_time} ms.") from err
+                time.sleep(min(delay, remaining))
+                delay = min(2 * delay, 0.5)
+
+        self.startup_latency = time.monotonic() - self._started_at
+        logger.info("SpotOnDocker server at %s ready after %.0f ms.", self.address, 1000 * self.startup_latency)
+
+    def _connect(self):
+        if self.handler is not None:
+            conn = InProcessConnection(self.handler, self._handler_lock)
+            return conn, conn
+
+        from thrift.transport import TSocket
+
         # Make socket
-        self.transport = TSocket.TSocket('localhost', self.port)
+        if self.socket_path is None:
+            transport = TSocket.TSocket(self.host, self.port)
+        else:
+            transport = TSocket.TSocket(unix_socket=self.socket_path)
 
-        # Buffering is critical. Raw sockets are very slow
-        self.transport = TTransport.TBufferedTransport(self.transport)
+        # Buffering (or framing) is critical. Raw sockets are very slow
+        transport = wire.transport_factory(self.transport).getTransport(transport)
 
         # Wrap in a protocol
-        protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
+        protocol = wire.protocol_factory(self.protocol).getProtocol(transport)
 
         # Create a client to use the protocol encoder
-        self.client = SpotOnDocker.Client(protocol)
+        client = SpotOnDocker.Client(protocol)
         
         # Connect!
-        self.transport.open()
+        transport.open()
+        return transport, client
+
+    def _call(self, method, *args):
+        with self.pool.connection() as client:
+            return getattr(client, method)(*args)
+
+    def _cached_call(self, method, *args):
+        """ Like `_call`, but looks up and stores the result in the persistent cache. """
+        if self.disk_cache is None or method not in self.PERSISTENT_CACHE_METHODS:
+            return self._call(method, *args)
+
+        key = self._cache_key(method, args)
+        data = self.disk_cache.get(key)
+        if data is not None:
+            return self._decode_result(method, data)
+
+        value = self._call(method, *args)
+        self.disk_cache.put(key, self._encode_result(method, value))
+        return value
+
+    def _call_batch(self, method, items, convert=None, args=()):
+        """ 
+        Calls a batched RPC in chunks of `batch_chunk_size` items, so that a large batch does 
+        not become a single huge message. `args` are passed after the items, with every chunk. 
+        Items found in the persistent cache are not sent. Failed items are returned as 
+        `SpotOnDockerError`.
+        """
+        items = list(items)
+        values = [None] * len(items)
+
+        # Look up the persistent cache. 
+        single_method = method[:-len("Batch")]
+        keys = None
+        pending = list(range(len(items)))
+        if self.disk_cache is not None and single_method in self.PERSISTENT_CACHE_METHODS:
+            keys = [self._cache_key(single_method, self._batch_item_args(item) + tuple(args)) for item in items]
+            pending = []
+            for i, key in enumerate(keys):
+                data = self.disk_cache.get(key)
+                if data is None:
+                    pending.append(i)
+                else:
+                    values[i] = self._decode_result(single_method, data)
+
+        # Query the server for the rest.
+        for start in range(0, len(pending), self.batch_chunk_size):
+            chunk = pending[start: start + self.batch_chunk_size]
+            for i, result in zip(chunk, self._call(method, [items[i] for i in chunk], *args)):
+                if result.error is not None:
+                    values[i] = SpotOnDockerError(result.error)
+                    continue
+                values[i] = result.value
+                if keys is not None:
+                    self.disk_cache.put(keys[i], self._encode_result(single_method, result.value))
+
+        if convert is None:
+            return values
+        return [v if isinstance(v, SpotOnDockerError) else convert(v) for v in values]
+
+    def _get_server_version(self):
+        try:
+            return self._call("Version")
+        except Thrift.TApplicationException:
+            # Server predates the `Version` call.
+            return "unknown"
+
+    def _cache_key(self, method, args):
+        # Thrift structs (e.g. `TTranslateOptions`) are keyed by their fields.
+        key = json.dumps([method, list(args), self.server_version], default=vars)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _batch_item_args(item):
+        if isinstance(item, SpotOnDocker.TFormulaPair):
+            return item.formula1, item.formula2
+        return (item, )
+
+    @staticmethod
+    def _encode_result(method, value):
+        from thrift import TSerialization
+        if method in ("Translate", "TranslateCompact"):
+            return TSerialization.serialize(value)
+        return json.dumps(value).encode("utf-8")
+
+    @staticmethod
+    def _decode_result(method, data):
+        from thrift import TSerialization
+        if method == "Translate":
+            return TSerialization.deserialize(SpotOnDocker.TGraph(), data)
+        if method == "TranslateCompact":
+            return TSerialization.deserialize(SpotOnDocker.TCompactGraph(), data)
+        return json.loads(data.decode("utf-8"))
 
     def ping(self):
-        self.client.Ping()
+        self._call("Ping")
 
     def mp_class(self, formula):
         """ 
@@ -161,7 +531,7 @@ class SpotOnDockerClient:
         
         Ref: https://spot.lrde.epita.fr/doxygen/group__tl__hier.html#ga9da740d4283ad977895d64b82d838ac2
         """
-        return self.client.MpClass(formula)
+        return self._cached_call("MpClass", formula)
     
     def contains(self, formula1, formula2):
         """
@@ -177,7 +547,7 @@ class SpotOnDockerClient:
 
         Ref: https://spot.lrde.epita.fr/doxygen/group__containment.html#gaafb6ae0dc34a6d7ed1382ce5b8962a61
         """
-        return self.client.Contains(formula1, formula2)
+        return self._cached_call("Contains", formula1, formula2)
 
     def equiv(self, formula1, formula2):
         """
@@ -186,14 +556,14 @@ class SpotOnDockerClient:
 
         Ref: https://spot.lrde.epita.fr/doxygen/group__containment.html#ga30fcc11035f85051dee3d3decc4cc9c8
         """
-        return self.client.IsEquivalent(formula1, formula2)
+        return self._cached_call("IsEquivalent", formula1, formula2)
         
     def rand_ltl(self, numAP, rndSeed):
         """
         Create a random LTL generator using atomic propositions given number of APs and a random seed.
         Ref: https://spot.lrde.epita.fr/doxygen/classspot_1_1random__ltl.html
         """
-        return self.client.RndLTL(numAP, rndSeed)
+        return self._call("RndLTL", numAP, rndSeed)
 
     def get_ap(self, formula):
         """
@@ -201,25 +571,141 @@ class SpotOnDockerClient:
         
         Ref: https://spot.lrde.epita.fr/doxygen/group__tl__misc.html#ga10d99d88d084d657ddba2bb69f22e75b
         """
-        return self.client.GetAP(formula)
+        return self._cached_call("GetAP", formula)
         
     def to_string_latex(self, formula):
-        return self.client.ToLatexString(formula)
+        return self._call("ToLatexString", formula)
 
-    def translate(self, formula):
+    def translate(self, formula, return_type="networkx", options=None):
         """
-        Translates formula to a state-based Buchi automaton. 
+        Translates formula to an automaton, by default a complete state-based Buchi automaton. 
         
-        Spot's translate function is provided with following parameters (see reference 
-        for descriptions of parameters):
+        Returns a `networkx.MultiDiGraph` or, if `return_type="automaton"`, an `Automaton`, which 
+        takes much less memory and time to build (use `Automaton.to_networkx()` to convert it).
+        
+        `options` is a `TTranslateOptions` or a dictionary of its fields (see spotondocker.thrift), 
+        e.g. `{"level": "Low"}`. Unset fields take their defaults, which correspond to the following 
+        parameters of spot's translate function (see reference for descriptions of parameters):
         - "BA"
         - "High", 
         - "SBAcc", 
         - "Complete"
 
+        Lower optimization levels translate large formulas much faster, at the price of bigger 
+        automata. Results are cached per formula and set of options.
+
+        The automaton is transferred in the columnar `TCompactGraph` format, which is smaller 
+        and faster to decode than `TGraph`.
+
         Ref: https://spot.lrde.epita.fr/doxygen/classspot_1_1translator.html
         """
-        thriftGraph = self.client.Translate(formula)
+        options = self._translate_options(options)
+        return self._graph_converter(return_type)(self._cached_call("TranslateCompact", formula, options))
+
+    def cache_stats(self):
+        """
+        Returns the counters of the server-side result caches as a dictionary 
+        `{operation: {"hits": .., "misses": .., "evictions": .., "size": .., "sizeBytes": ..}}`.
+
+        Note: In pre-fork mode (`pool_size > 1`), every server worker has its own caches. The 
+        counters are those of the worker serving the connection used for this call. 
+        """
+        return {
+            s.operation: {"hits": s.hits, "misses": s.misses, "evictions": s.evictions, "size": s.size, "sizeBytes": s.sizeBytes}
+            for s in self._call("GetCacheStats")
+        }
+
+    def mp_class_batch(self, formulas):
+        """
+        Batched `mp_class`: returns one class per formula, in the same order, using a single 
+        round trip per `batch_chunk_size` formulas.
+
+        A formula that fails (e.g. a syntax error) does not fail the batch. Its entry in the 
+        returned list is a `SpotOnDockerError` instance instead of a result. The same holds 
+        for all `*_batch` methods.
+        """
+        return self._call_batch("MpClassBatch", formulas)
+
+    def contains_batch(self, pairs):
+        """ Batched `contains`. `pairs` is an iterable of `(formula1, formula2)` tuples. """
+        pairs = [SpotOnDocker.TFormulaPair(formula1=f1, formula2=f2) for f1, f2 in pairs]
+        return self._call_batch("ContainsBatch", pairs)
+
+    def equiv_batch(self, pairs):
+        """ Batched `equiv`. `pairs` is an iterable of `(formula1, formula2)` tuples. """
+        pairs = [SpotOnDocker.TFormulaPair(formula1=f1, formula2=f2) for f1, f2 in pairs]
+        return self._call_batch("IsEquivalentBatch", pairs)
+
+    def get_ap_batch(self, formulas):
+        """ Batched `get_ap`. """
+        return self._call_batch("GetAPBatch", formulas)
+
+    def to_string_latex_batch(self, formulas):
+        """ Batched `to_string_latex`. """
+        return self._call_batch("ToLatexStringBatch", formulas)
+
+    def translate_batch(self, formulas, return_type="networkx", options=None):
+        """ Batched `translate`. Returns a `networkx.MultiDiGraph` (or an `Automaton`) per formula. """
+        options = self._translate_options(options)
+        return self._call_batch("TranslateCompactBatch", formulas, convert=self._graph_converter(return_type), args=(options, ))
+
+    def translate_paged(self, formula, page_size=65536, return_type="networkx", options=None):
+        """
+        Like `translate`, but the automaton is transferred in pages of at most `page_size` edges, 
+        and the result is built page by page. Neither the server nor the client hold the whole 
+        automaton in Thrift objects, so that peak memory is the result plus one page. 
+        """
+        pages = self.iter_translate_pages(formula, page_size, options)
+        header, first = next(pages)
+        pages = itertools.chain([first], (page for _, page in pages))
+        if return_type == "networkx":
+            return self._pages_to_networkx(header, pages)
+        if return_type == "automaton":
+            return Automaton.from_pages(header, pages)
+        raise ValueError(f"return_type must be 'networkx' or 'automaton', not {return_type!r}")
+
+    def iter_translate_pages(self, formula, page_size=65536, options=None):
+        """
+        Translates formula (as `translate`) and generates its edges in pages: yields `(header, page)` 
+        pairs, where `header` is a `TCompactGraph` holding the graph properties and accepting states 
+        (but no edges), and `page` is a `TEdgePage` with at most `page_size` edges. Label indices of 
+        a page refer to the concatenated `labels` of all pages so far.
+
+        A connection is checked out until the generator is exhausted or closed.
+        """
+        with self.pool.connection() as client:
+            opened = client.TranslateOpen(formula, self._translate_options(options))
+            last = False
+            try:
+                while not last:
+                    page = client.TranslateNext(opened.cursor, page_size)
+                    last = page.last
+                    yield opened.header, page
+            except GeneratorExit:
+                # Stopped early: free the cursor on the server.
+                client.TranslateClose(opened.cursor)
+
+    @staticmethod
+    def _translate_options(options):
+        """ Returns `options` (None, a dictionary of fields or `TTranslateOptions`) as `TTranslateOptions`. """
+        if options is None:
+            return SpotOnDocker.TTranslateOptions()
+        if isinstance(options, dict):
+            return SpotOnDocker.TTranslateOptions(**options)
+        return options
+
+    @classmethod
+    def _graph_converter(cls, return_type):
+        """ Returns the function converting a `TCompactGraph` to the type of graph `translate` returns. """
+        if return_type == "networkx":
+            return cls._compact_to_networkx
+        if return_type == "automaton":
+            return Automaton.from_compact
+        raise ValueError(f"return_type must be 'networkx' or 'automaton', not {return_type!r}")
+
+    @staticmethod
+    def _to_networkx(thriftGraph):
+        import networkx as nx
         aut = nx.MultiDiGraph(
                 acc=thriftGraph.acceptance, 
                 numAccSets=thriftGraph.numAccSets,
@@ -239,3 +725,44 @@ class SpotOnDockerClient:
             aut.add_edge(tedge.srcId, tedge.dstId, label=tedge.label)
 
         return aut
+
+    @staticmethod
+    def _compact_to_networkx(compactGraph):
+        """ Like `_to_networkx`, for a `TCompactGraph`. Edges with the same label share the label string. """
+        import networkx as nx
+        aut = nx.MultiDiGraph(
+                acc=compactGraph.acceptance, 
+                numAccSets=compactGraph.numAccSets,
+                numStates=compactGraph.numStates,
+                initStates=compactGraph.initStates,
+                apNames=compactGraph.apNames,
+                formula=compactGraph.formula,
+                isDeterministic=compactGraph.isDeterministic,
+                hasStateBasedAcc=compactGraph.hasStateBasedAcc,
+                isTerminal=compactGraph.isTerminal
+            )
+
+        aut.add_nodes_from(
+            (i, {"isAcc": isAcc}) for i, isAcc in enumerate(unpack_bits(compactGraph.accepting, compactGraph.numStates))
+        )
+
+        labels = compactGraph.labels
+        aut.add_edges_from(
+            (src, dst, {"label": labels[k]}) 
+            for src, dst, k in zip(compactGraph.edgeSrc, compactGraph.edgeDst, compactGraph.edgeLabel)
+        )
+
+        return aut
+
+    @classmethod
+    def _pages_to_networkx(cls, header, pages):
+        """ Like `_compact_to_networkx`, for the header and `TEdgePage`s of a paged translation. """
+        aut = cls._compact_to_networkx(header)
+        labels = []
+        for page in pages:
+            labels.extend(page.labels)
+            aut.add_edges_from(
+                (src, dst, {"label": labels[k]}) 
+                for src, dst, k in zip(page.edgeSrc, page.edgeDst, page.edgeLabel)
+            )
+        return aut
@@ -0,0 +1,237 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: cluster.py
+Description:
+    The file defines `SpotOnDockerCluster` class which distributes calls over several SpotOnDocker
+    containers (replicas), each managed by a `SpotOnDockerClient`.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from spotondocker.client import SpotOnDockerClient
+from thrift.transport import TTransport
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class _Replica:
+    __slots__ = ["client", "outstanding", "alive"]
+
+    def __init__(self, client):
+        self.client = client
+        self.outstanding = 0
+        self.alive = True
+
+
+class SpotOnDockerCluster:
+    """
+    Distributes calls over `replicas` SpotOnDocker containers, so that up to `replicas` calls are
+    computed in parallel (spot itself is single-threaded).
+
+    Every call goes to the live replica with the fewest outstanding calls. If a call fails because
+    its replica is unreachable (and the replica does not answer a `Ping` afterwards), the replica is
+    taken out of rotation and the call is retried on another one. All supported spot functions are
+    free of side effects, so retrying is safe. Errors reported by the server are raised as usual.
+
+    Batched calls are split evenly over the live replicas, and the parts are sent in parallel.
+
+    The replicas are created in parallel, as `SpotOnDockerClient(**client_kwargs)`. If `port` is
+    given, replica `i` uses `port + i`. If `container_name` is given (or `keep_alive` is set, see
+    `SpotOnDockerClient`), replica `i` uses the container `{container_name}.{i}`, attaching to it if
+    it is running. Alternatively, pass already created `clients`.
+
+    Usage:
+        spot = SpotOnDockerCluster(replicas=8)
+        automata = spot.translate_batch(formulas)
+    """
+    def __init__(self, replicas=None, clients=None, **client_kwargs):
+        if clients is None:
+            replicas = os.cpu_count() if replicas is None else replicas
+            with ThreadPoolExecutor(max_workers=replicas) as executor:
+                clients = list(executor.map(lambda i: self._new_client(i, client_kwargs), range(replicas)))
+
+        if len(clients) == 0:
+            raise ValueError("A cluster needs at least one replica.")
+
+        self.replicas = [_Replica(client) for client in clients]
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(self.replicas))
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """ Closes all replicas. """
+        try:
+            self._executor.shutdown(wait=False)
+        except Exception:
+            pass
+
+        for replica in getattr(self, "replicas", []):
+            replica.client.close()
+
+    @staticmethod
+    def _new_client(i, client_kwargs):
+        kwargs = dict(client_kwargs)
+        if kwargs.get("port") is not None:
+            kwargs["port"] += i
+        name = kwargs.get("container_name")
+        if name is None and kwargs.get("keep_alive"):
+            name = SpotOnDockerClient.SHARED_CONTAINER_NAME
+        if name is not None:
+            kwargs["container_name"] = f"{name}.{i}"
+        return SpotOnDockerClient(**kwargs)
+
+    @property
+    def num_alive(self):
+        return sum(1 for r in self.replicas if r.alive)
+
+    def _checkout(self, exclude=()):
+        with self._lock:
+            candidates = [r for r in self.replicas if r.alive and r not in exclude]
+            if not candidates:
+                return None
+            replica = min(candidates, key=lambda r: r.outstanding)
+            replica.outstanding += 1
+            return replica
+
+    def _call(self, method, *args, **kwargs):
+        """ Calls `method` of the least busy replica, failing over to other replicas if it is unreachable. """
+        tried = []
+        while True:
+            replica = self._checkout(exclude=tried)
+            if replica is None and tried:
+                raise last_error
+            if replica is None:
+                raise TTransport.TTransportException(TTransport.TTransportException.NOT_OPEN, "No live replica left.")
+            try:
+                return getattr(replica.client, method)(*args, **kwargs)
+            except TimeoutError:
+                # No free connection in time: the replica is busy, not dead.
+                raise
+            except (TTransport.TTransportException, OSError, EOFError) as err:
+                last_error = err
+                tried.append(replica)
+                if self._is_dead(replica):
+                    logger.warning("Replica at %s is unreachable (%s). Taking it out of rotation.", replica.client.address, err)
+                    replica.alive = False
+            finally:
+                with self._lock:
+                    replica.outstanding -= 1
+
+    @staticmethod
+    def _is_dead(replica):
+        try:
+            replica.client.ping()
+            return False
+        except Exception:
+            return True
+
+    def _call_batch(self, method, items, **kwargs):
+        items = list(items)
+        if not items:
+            return []
+        parts = max(1, min(self.num_alive, len(items)))
+        size = -(-len(items) // parts)
+        chunks = [items[start: start + size] for start in range(0, len(items), size)]
+        results = self._executor.map(lambda chunk: self._call(method, chunk, **kwargs), chunks)
+        return [value for chunk in results for value in chunk]
+
+    def ping(self):
+        """ Pings every live replica. """
+        for replica in self.replicas:
+            if replica.alive:
+                replica.client.ping()
+
+    def mp_class(self, formula):
+        """ See `SpotOnDockerClient.mp_class`. """
+        return self._call("mp_class", formula)
+
+    def contains(self, formula1, formula2):
+        """ See `SpotOnDockerClient.contains`. """
+        return self._call("contains", formula1, formula2)
+
+    def equiv(self, formula1, formula2):
+        """ See `SpotOnDockerClient.equiv`. """
+        return self._call("equiv", formula1, formula2)
+
+    def rand_ltl(self, numAP, rndSeed):
+        """ See `SpotOnDockerClient.rand_ltl`. """
+        return self._call("rand_ltl", numAP, rndSeed)
+
+    def get_ap(self, formula):
+        """ See `SpotOnDockerClient.get_ap`. """
+        return self._call("get_ap", formula)
+
+    def to_string_latex(self, formula):
+        return self._call("to_string_latex", formula)
+
+    def translate(self, formula, return_type="networkx", options=None):
+        """ See `SpotOnDockerClient.translate`. """
+        return self._call("translate", formula, return_type=return_type, options=options)
+
+    def translate_paged(self, formula, page_size=65536, return_type="networkx", options=None):
+        """ See `SpotOnDockerClient.translate_paged`. """
+        return self._call("translate_paged", formula, page_size=page_size, return_type=return_type, options=options)
+
+    def cache_stats(self):
+        """ Returns the `SpotOnDockerClient.cache_stats` of every live replica, as a list. """
+        return [r.client.cache_stats() for r in self.replicas if r.alive]
+
+    def mp_class_batch(self, formulas):
+        """ See `SpotOnDockerClient.mp_class_batch`. """
+        return self._call_batch("mp_class_batch", formulas)
+
+    def contains_batch(self, pairs):
+        """ See `SpotOnDockerClient.contains_batch`. """
+        return self._call_batch("contains_batch", pairs)
+
+    def equiv_batch(self, pairs):
+        """ See `SpotOnDockerClient.equiv_batch`. """
+        return self._call_batch("equiv_batch", pairs)
+
+    def get_ap_batch(self, formulas):
+        """ See `SpotOnDockerClient.get_ap_batch`. """
+        return self._call_batch("get_ap_batch", formulas)
+
+    def to_string_latex_batch(self, formulas):
+        """ See `SpotOnDockerClient.to_string_latex_batch`. """
+        return self._call_batch("to_string_latex_batch", formulas)
+
+    def translate_batch(self, formulas, return_type="networkx", options=None):
+        """ See `SpotOnDockerClient.translate_batch`. """
+        return self._call_batch("translate_batch", formulas, return_type=return_type, options=options)
@@ -0,0 +1,123 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: compact.py
+Description:
+    The file defines functions to convert automata from `TGraph` to the columnar `TCompactGraph`
+    format (used by `SpotOnDockerHandler.TranslateCompact`) and to read its packed acceptance bitmap, 
+    and `EdgePager` class which splits edges into `TEdgePage`s (used by `SpotOnDockerHandler.TranslateNext`).
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+try:
+    # Imported as part of the spotondocker package (client side).
+    from spotondocker.genpy.spotondocker import SpotOnDocker
+except ImportError:
+    # Imported next to server.py, e.g. in the container.
+    from genpy.spotondocker import SpotOnDocker
+
+import itertools
+import time
+
+
+def pack_bits(flags):
+    """ Packs a sequence of booleans into bytes. Flag `i` is bit `i % 8` of byte `i // 8`. """
+    bits = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+def unpack_bits(bits, n):
+    """ Inverse of `pack_bits`: returns the first `n` flags stored in `bits` as a list of booleans. """
+    return [bool(bits[i >> 3] >> (i & 7) & 1) for i in range(n)]
+
+
+def compact_graph(graph):
+    """ Converts a `TGraph` to a `TCompactGraph` representing the same automaton. """
+    accepting = [False] * graph.numStates
+    for node in graph.nodes:
+        accepting[node.id] = bool(node.isAcc)
+
+    # Intern labels: every distinct label is stored once, edges refer to it by index.
+    labels = dict()
+    edgeLabel = [labels.setdefault(edge.label, len(labels)) for edge in graph.edges]
+
+    return SpotOnDocker.TCompactGraph(
+        acceptance=graph.acceptance,
+        numAccSets=graph.numAccSets,
+        numStates=graph.numStates,
+        initStates=graph.initStates,
+        apNames=graph.apNames,
+        formula=graph.formula,
+        isDeterministic=graph.isDeterministic,
+        hasStateBasedAcc=graph.hasStateBasedAcc,
+        isTerminal=graph.isTerminal,
+        accepting=pack_bits(accepting),
+        labels=list(labels),
+        edgeSrc=[edge.srcId for edge in graph.edges],
+        edgeDst=[edge.dstId for edge in graph.edges],
+        edgeLabel=edgeLabel,
+    )
+
+
+class EdgePager:
+    """ 
+    Splits an iterable of `(src, dst, label)` edges into `TEdgePage`s. Every page carries only the 
+    labels which did not occur in earlier pages. 
+    """
+    __slots__ = ["edges", "labels", "last_used"]
+
+    def __init__(self, edges):
+        self.edges = iter(edges)
+        self.labels = dict()
+        self.last_used = time.monotonic()
+
+    def next_page(self, max_edges):
+        """ Returns the next page of at most `max_edges` edges. `last` is set if no edges are left. """
+        if max_edges <= 0:
+            raise ValueError(f"max_edges must be positive, got {max_edges}.")
+
+        page = SpotOnDocker.TEdgePage(labels=[], edgeSrc=[], edgeDst=[], edgeLabel=[], last=False)
+        for src, dst, label in itertools.islice(self.edges, max_edges):
+            k = self.labels.get(label)
+            if k is None:
+                k = self.labels[label] = len(self.labels)
+                page.labels.append(label)
+            page.edgeSrc.append(src)
+            page.edgeDst.append(dst)
+            page.edgeLabel.append(k)
+
+        page.last = len(page.edgeSrc) < max_edges
+        self.last_used = time.monotonic()
+        return page
@@ -0,0 +1,120 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: convert.py
+Description:
+    The file defines the functions used by `SpotOnDockerHandler` to convert spot automata into the
+    Thrift structures returned to clients (`TGraph`, and the header and edges of paged translations).
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+import sys, os
+dir_spotondocker = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_spotondocker)
+
+try:
+    # Imported as part of the spotondocker package (client side).
+    from spotondocker.genpy.spotondocker import SpotOnDocker
+except ImportError:
+    # Imported next to server.py, e.g. in the container.
+    from genpy.spotondocker import SpotOnDocker
+from compact import pack_bits
+
+import spot
+
+
+class EdgeLabels:
+    """
+    Formats the edge conditions of one automaton. Automata use few distinct conditions, so every
+    distinct BDD is formatted once and its label is reused.
+
+    Keys are BDD node ids, which are only stable while the automaton is alive. Use one instance per
+    automaton.
+    """
+    def __init__(self, aut):
+        self.bdict = aut.get_dict()
+        self.labels = dict()
+
+    def __call__(self, cond):
+        key = cond.id()
+        label = self.labels.get(key)
+        if label is None:
+            label = self.labels[key] = str(spot.bdd_format_formula(self.bdict, cond))
+        return label
+
+
+def graph_properties(aut):
+    """ Returns the fields shared by `TGraph` and `TCompactGraph`, as a dictionary. """
+    return dict(
+        acceptance=str(aut.get_acceptance()),
+        numAccSets=int(aut.num_sets()),
+        numStates=int(aut.num_states()),
+        initStates=[int(aut.get_init_state_number())],
+        apNames=[str(ap) for ap in aut.ap()],
+        formula=str(aut.get_name()),
+        isDeterministic=bool(aut.prop_universal() and aut.is_existential()),
+        hasStateBasedAcc=bool(aut.prop_state_acc()),
+        isTerminal=bool(aut.prop_terminal()),
+    )
+
+
+def accepting_states(aut):
+    """ Returns a list of booleans, `True` for every accepting state of `aut`. """
+    return [bool(aut.state_is_accepting(s)) for s in range(aut.num_states())]
+
+
+def iter_edges(aut):
+    """ Generates the edges of `aut` as `(src, dst, label)` tuples, state by state. """
+    label = EdgeLabels(aut)
+    for src in range(aut.num_states()):
+        for edge in aut.out(src):
+            yield int(edge.src), int(edge.dst), label(edge.cond)
+
+
+def to_graph(aut):
+    """ Converts `aut` into a `TGraph`. """
+    graph = SpotOnDocker.TGraph(**graph_properties(aut))
+    graph.nodes = [SpotOnDocker.TNode(id=s, isAcc=acc) for s, acc in enumerate(accepting_states(aut))]
+    graph.edges = [SpotOnDocker.TEdge(srcId=src, dstId=dst, label=label) for src, dst, label in iter_edges(aut)]
+    return graph
+
+
+def to_header(aut):
+    """ Converts `aut` into a `TCompactGraph` without edges, the header of a paged translation. """
+    return SpotOnDocker.TCompactGraph(
+        accepting=pack_bits(accepting_states(aut)),
+        labels=[],
+        edgeSrc=[],
+        edgeDst=[],
+        edgeLabel=[],
+        **graph_properties(aut)
+    )
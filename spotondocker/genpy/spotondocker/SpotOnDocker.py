@@ -73,14 +73,114 @@ class Iface(object):
         """
         pass
 
-    def Translate(self, formula):
+    def Translate(self, formula, options):
         """
         Parameters:
          - formula
+         - options
 
         """
         pass
 
+    def TranslateCompact(self, formula, options):
+        """
+        Parameters:
+         - formula
+         - options
+
+        """
+        pass
+
+    def TranslateOpen(self, formula, options):
+        """
+        Parameters:
+         - formula
+         - options
+
+        """
+        pass
+
+    def TranslateNext(self, cursor, maxEdges):
+        """
+        Parameters:
+         - cursor
+         - maxEdges
+
+        """
+        pass
+
+    def TranslateClose(self, cursor):
+        """
+        Parameters:
+         - cursor
+
+        """
+        pass
+
+    def MpClassBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        pass
+
+    def ContainsBatch(self, pairs):
+        """
+        Parameters:
+         - pairs
+
+        """
+        pass
+
+    def IsEquivalentBatch(self, pairs):
+        """
+        Parameters:
+         - pairs
+
+        """
+        pass
+
+    def GetAPBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        pass
+
+    def ToLatexStringBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        pass
+
+    def TranslateBatch(self, formulas, options):
+        """
+        Parameters:
+         - formulas
+         - options
+
+        """
+        pass
+
+    def TranslateCompactBatch(self, formulas, options):
+        """
+        Parameters:
+         - formulas
+         - options
+
+        """
+        pass
+
+    def GetCacheStats(self):
+        pass
+
+    def Version(self):
+        pass
+
 
 class Client(Iface):
     def __init__(self, iprot, oprot=None):
@@ -311,19 +411,21 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "ToLatexString failed: unknown result")
 
-    def Translate(self, formula):
+    def Translate(self, formula, options):
         """
         Parameters:
          - formula
+         - options
 
         """
-        self.send_Translate(formula)
+        self.send_Translate(formula, options)
         return self.recv_Translate()
 
-    def send_Translate(self, formula):
+    def send_Translate(self, formula, options):
         self._oprot.writeMessageBegin('Translate', TMessageType.CALL, self._seqid)
         args = Translate_args()
         args.formula = formula
+        args.options = options
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -343,166 +445,729 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "Translate failed: unknown result")
 
+    def TranslateCompact(self, formula, options):
+        """
+        Parameters:
+         - formula
+         - options
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["Ping"] = Processor.process_Ping
-        self._processMap["MpClass"] = Processor.process_MpClass
-        self._processMap["Contains"] = Processor.process_Contains
-        self._processMap["IsEquivalent"] = Processor.process_IsEquivalent
-        self._processMap["RndLTL"] = Processor.process_RndLTL
-        self._processMap["GetAP"] = Processor.process_GetAP
-        self._processMap["ToLatexString"] = Processor.process_ToLatexString
-        self._processMap["Translate"] = Processor.process_Translate
-        self._on_message_begin = None
+        """
+        self.send_TranslateCompact(formula, options)
+        return self.recv_TranslateCompact()
 
-    def on_message_begin(self, func):
-        self._on_message_begin = func
+    def send_TranslateCompact(self, formula, options):
+        self._oprot.writeMessageBegin('TranslateCompact', TMessageType.CALL, self._seqid)
+        args = TranslateCompact_args()
+        args.formula = formula
+        args.options = options
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if self._on_message_begin:
-            self._on_message_begin(name, type, seqid)
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
+    def recv_TranslateCompact(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
             iprot.readMessageEnd()
-            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
-            return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
-
-    def process_Ping(self, seqid, iprot, oprot):
-        args = Ping_args()
-        args.read(iprot)
+            raise x
+        result = TranslateCompact_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = Ping_result()
-        try:
-            self._handler.Ping()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("Ping", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "TranslateCompact failed: unknown result")
 
-    def process_MpClass(self, seqid, iprot, oprot):
-        args = MpClass_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = MpClass_result()
-        try:
-            result.success = self._handler.MpClass(args.formula)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("MpClass", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def TranslateOpen(self, formula, options):
+        """
+        Parameters:
+         - formula
+         - options
 
-    def process_Contains(self, seqid, iprot, oprot):
-        args = Contains_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = Contains_result()
-        try:
-            result.success = self._handler.Contains(args.formula1, args.formula2)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("Contains", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_TranslateOpen(formula, options)
+        return self.recv_TranslateOpen()
 
-    def process_IsEquivalent(self, seqid, iprot, oprot):
-        args = IsEquivalent_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = IsEquivalent_result()
-        try:
-            result.success = self._handler.IsEquivalent(args.formula1, args.formula2)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("IsEquivalent", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_TranslateOpen(self, formula, options):
+        self._oprot.writeMessageBegin('TranslateOpen', TMessageType.CALL, self._seqid)
+        args = TranslateOpen_args()
+        args.formula = formula
+        args.options = options
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_RndLTL(self, seqid, iprot, oprot):
-        args = RndLTL_args()
-        args.read(iprot)
+    def recv_TranslateOpen(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = TranslateOpen_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = RndLTL_result()
-        try:
-            result.success = self._handler.RndLTL(args.numAP, args.rndSeed)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("RndLTL", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "TranslateOpen failed: unknown result")
 
-    def process_GetAP(self, seqid, iprot, oprot):
-        args = GetAP_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = GetAP_result()
-        try:
-            result.success = self._handler.GetAP(args.formula)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
+    def TranslateNext(self, cursor, maxEdges):
+        """
+        Parameters:
+         - cursor
+         - maxEdges
+
+        """
+        self.send_TranslateNext(cursor, maxEdges)
+        return self.recv_TranslateNext()
+
+    def send_TranslateNext(self, cursor, maxEdges):
+        self._oprot.writeMessageBegin('TranslateNext', TMessageType.CALL, self._seqid)
+        args = TranslateNext_args()
+        args.cursor = cursor
+        args.maxEdges = maxEdges
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_TranslateNext(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = TranslateNext_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "TranslateNext failed: unknown result")
+
+    def TranslateClose(self, cursor):
+        """
+        Parameters:
+         - cursor
+
+        """
+        self.send_TranslateClose(cursor)
+        self.recv_TranslateClose()
+
+    def send_TranslateClose(self, cursor):
+        self._oprot.writeMessageBegin('TranslateClose', TMessageType.CALL, self._seqid)
+        args = TranslateClose_args()
+        args.cursor = cursor
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_TranslateClose(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = TranslateClose_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
+    def MpClassBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        self.send_MpClassBatch(formulas)
+        return self.recv_MpClassBatch()
+
+    def send_MpClassBatch(self, formulas):
+        self._oprot.writeMessageBegin('MpClassBatch', TMessageType.CALL, self._seqid)
+        args = MpClassBatch_args()
+        args.formulas = formulas
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_MpClassBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = MpClassBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "MpClassBatch failed: unknown result")
+
+    def ContainsBatch(self, pairs):
+        """
+        Parameters:
+         - pairs
+
+        """
+        self.send_ContainsBatch(pairs)
+        return self.recv_ContainsBatch()
+
+    def send_ContainsBatch(self, pairs):
+        self._oprot.writeMessageBegin('ContainsBatch', TMessageType.CALL, self._seqid)
+        args = ContainsBatch_args()
+        args.pairs = pairs
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_ContainsBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = ContainsBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "ContainsBatch failed: unknown result")
+
+    def IsEquivalentBatch(self, pairs):
+        """
+        Parameters:
+         - pairs
+
+        """
+        self.send_IsEquivalentBatch(pairs)
+        return self.recv_IsEquivalentBatch()
+
+    def send_IsEquivalentBatch(self, pairs):
+        self._oprot.writeMessageBegin('IsEquivalentBatch', TMessageType.CALL, self._seqid)
+        args = IsEquivalentBatch_args()
+        args.pairs = pairs
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_IsEquivalentBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = IsEquivalentBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "IsEquivalentBatch failed: unknown result")
+
+    def GetAPBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        self.send_GetAPBatch(formulas)
+        return self.recv_GetAPBatch()
+
+    def send_GetAPBatch(self, formulas):
+        self._oprot.writeMessageBegin('GetAPBatch', TMessageType.CALL, self._seqid)
+        args = GetAPBatch_args()
+        args.formulas = formulas
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_GetAPBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = GetAPBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "GetAPBatch failed: unknown result")
+
+    def ToLatexStringBatch(self, formulas):
+        """
+        Parameters:
+         - formulas
+
+        """
+        self.send_ToLatexStringBatch(formulas)
+        return self.recv_ToLatexStringBatch()
+
+    def send_ToLatexStringBatch(self, formulas):
+        self._oprot.writeMessageBegin('ToLatexStringBatch', TMessageType.CALL, self._seqid)
+        args = ToLatexStringBatch_args()
+        args.formulas = formulas
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_ToLatexStringBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = ToLatexStringBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "ToLatexStringBatch failed: unknown result")
+
+    def TranslateBatch(self, formulas, options):
+        """
+        Parameters:
+         - formulas
+         - options
+
+        """
+        self.send_TranslateBatch(formulas, options)
+        return self.recv_TranslateBatch()
+
+    def send_TranslateBatch(self, formulas, options):
+        self._oprot.writeMessageBegin('TranslateBatch', TMessageType.CALL, self._seqid)
+        args = TranslateBatch_args()
+        args.formulas = formulas
+        args.options = options
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_TranslateBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = TranslateBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "TranslateBatch failed: unknown result")
+
+    def TranslateCompactBatch(self, formulas, options):
+        """
+        Parameters:
+         - formulas
+         - options
+
+        """
+        self.send_TranslateCompactBatch(formulas, options)
+        return self.recv_TranslateCompactBatch()
+
+    def send_TranslateCompactBatch(self, formulas, options):
+        self._oprot.writeMessageBegin('TranslateCompactBatch', TMessageType.CALL, self._seqid)
+        args = TranslateCompactBatch_args()
+        args.formulas = formulas
+        args.options = options
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_TranslateCompactBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = TranslateCompactBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "TranslateCompactBatch failed: unknown result")
+
+    def GetCacheStats(self):
+        self.send_GetCacheStats()
+        return self.recv_GetCacheStats()
+
+    def send_GetCacheStats(self):
+        self._oprot.writeMessageBegin('GetCacheStats', TMessageType.CALL, self._seqid)
+        args = GetCacheStats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_GetCacheStats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = GetCacheStats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "GetCacheStats failed: unknown result")
+
+    def Version(self):
+        self.send_Version()
+        return self.recv_Version()
+
+    def send_Version(self):
+        self._oprot.writeMessageBegin('Version', TMessageType.CALL, self._seqid)
+        args = Version_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_Version(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = Version_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "Version failed: unknown result")
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["Ping"] = Processor.process_Ping
+        self._processMap["MpClass"] = Processor.process_MpClass
+        self._processMap["Contains"] = Processor.process_Contains
+        self._processMap["IsEquivalent"] = Processor.process_IsEquivalent
+        self._processMap["RndLTL"] = Processor.process_RndLTL
+        self._processMap["GetAP"] = Processor.process_GetAP
+        self._processMap["ToLatexString"] = Processor.process_ToLatexString
+        self._processMap["Translate"] = Processor.process_Translate
+        self._processMap["TranslateCompact"] = Processor.process_TranslateCompact
+        self._processMap["TranslateOpen"] = Processor.process_TranslateOpen
+        self._processMap["TranslateNext"] = Processor.process_TranslateNext
+        self._processMap["TranslateClose"] = Processor.process_TranslateClose
+        self._processMap["MpClassBatch"] = Processor.process_MpClassBatch
+        self._processMap["ContainsBatch"] = Processor.process_ContainsBatch
+        self._processMap["IsEquivalentBatch"] = Processor.process_IsEquivalentBatch
+        self._processMap["GetAPBatch"] = Processor.process_GetAPBatch
+        self._processMap["ToLatexStringBatch"] = Processor.process_ToLatexStringBatch
+        self._processMap["TranslateBatch"] = Processor.process_TranslateBatch
+        self._processMap["TranslateCompactBatch"] = Processor.process_TranslateCompactBatch
+        self._processMap["GetCacheStats"] = Processor.process_GetCacheStats
+        self._processMap["Version"] = Processor.process_Version
+        self._on_message_begin = None
+
+    def on_message_begin(self, func):
+        self._on_message_begin = func
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if self._on_message_begin:
+            self._on_message_begin(name, type, seqid)
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_Ping(self, seqid, iprot, oprot):
+        args = Ping_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = Ping_result()
+        try:
+            self._handler.Ping()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("Ping", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_MpClass(self, seqid, iprot, oprot):
+        args = MpClass_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = MpClass_result()
+        try:
+            result.success = self._handler.MpClass(args.formula)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("MpClass", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_Contains(self, seqid, iprot, oprot):
+        args = Contains_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = Contains_result()
+        try:
+            result.success = self._handler.Contains(args.formula1, args.formula2)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("Contains", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_IsEquivalent(self, seqid, iprot, oprot):
+        args = IsEquivalent_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = IsEquivalent_result()
+        try:
+            result.success = self._handler.IsEquivalent(args.formula1, args.formula2)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("IsEquivalent", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_RndLTL(self, seqid, iprot, oprot):
+        args = RndLTL_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = RndLTL_result()
+        try:
+            result.success = self._handler.RndLTL(args.numAP, args.rndSeed)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("RndLTL", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetAP(self, seqid, iprot, oprot):
+        args = GetAP_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetAP_result()
+        try:
+            result.success = self._handler.GetAP(args.formula)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetAP", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ToLatexString(self, seqid, iprot, oprot):
+        args = ToLatexString_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ToLatexString_result()
+        try:
+            result.success = self._handler.ToLatexString(args.formula)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ToLatexString", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_Translate(self, seqid, iprot, oprot):
+        args = Translate_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = Translate_result()
+        try:
+            result.success = self._handler.Translate(args.formula, args.options)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("Translate", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateCompact(self, seqid, iprot, oprot):
+        args = TranslateCompact_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateCompact_result()
+        try:
+            result.success = self._handler.TranslateCompact(args.formula, args.options)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("TranslateCompact", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateOpen(self, seqid, iprot, oprot):
+        args = TranslateOpen_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateOpen_result()
+        try:
+            result.success = self._handler.TranslateOpen(args.formula, args.options)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("TranslateOpen", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateNext(self, seqid, iprot, oprot):
+        args = TranslateNext_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateNext_result()
+        try:
+            result.success = self._handler.TranslateNext(args.cursor, args.maxEdges)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("TranslateNext", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateClose(self, seqid, iprot, oprot):
+        args = TranslateClose_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateClose_result()
+        try:
+            self._handler.TranslateClose(args.cursor)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
         except TApplicationException as ex:
             logging.exception('TApplication exception in handler')
             msg_type = TMessageType.EXCEPTION
@@ -511,61 +1176,1699 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("GetAP", msg_type, seqid)
+        oprot.writeMessageBegin("TranslateClose", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_MpClassBatch(self, seqid, iprot, oprot):
+        args = MpClassBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = MpClassBatch_result()
+        try:
+            result.success = self._handler.MpClassBatch(args.formulas)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("MpClassBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ContainsBatch(self, seqid, iprot, oprot):
+        args = ContainsBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ContainsBatch_result()
+        try:
+            result.success = self._handler.ContainsBatch(args.pairs)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ContainsBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_IsEquivalentBatch(self, seqid, iprot, oprot):
+        args = IsEquivalentBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = IsEquivalentBatch_result()
+        try:
+            result.success = self._handler.IsEquivalentBatch(args.pairs)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("IsEquivalentBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetAPBatch(self, seqid, iprot, oprot):
+        args = GetAPBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetAPBatch_result()
+        try:
+            result.success = self._handler.GetAPBatch(args.formulas)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetAPBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ToLatexStringBatch(self, seqid, iprot, oprot):
+        args = ToLatexStringBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ToLatexStringBatch_result()
+        try:
+            result.success = self._handler.ToLatexStringBatch(args.formulas)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ToLatexStringBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateBatch(self, seqid, iprot, oprot):
+        args = TranslateBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateBatch_result()
+        try:
+            result.success = self._handler.TranslateBatch(args.formulas, args.options)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("TranslateBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_TranslateCompactBatch(self, seqid, iprot, oprot):
+        args = TranslateCompactBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = TranslateCompactBatch_result()
+        try:
+            result.success = self._handler.TranslateCompactBatch(args.formulas, args.options)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("TranslateCompactBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetCacheStats(self, seqid, iprot, oprot):
+        args = GetCacheStats_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetCacheStats_result()
+        try:
+            result.success = self._handler.GetCacheStats()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetCacheStats", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_ToLatexString(self, seqid, iprot, oprot):
-        args = ToLatexString_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = ToLatexString_result()
-        try:
-            result.success = self._handler.ToLatexString(args.formula)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("ToLatexString", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def process_Version(self, seqid, iprot, oprot):
+        args = Version_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = Version_result()
+        try:
+            result.success = self._handler.Version()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("Version", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class Ping_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Ping_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Ping_args)
+Ping_args.thrift_spec = (
+)
+
+
+class Ping_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Ping_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Ping_result)
+Ping_result.thrift_spec = (
+)
+
+
+class MpClass_args(object):
+    """
+    Attributes:
+     - formula
+
+    """
+
+
+    def __init__(self, formula=None,):
+        self.formula = formula
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MpClass_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(MpClass_args)
+MpClass_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+)
+
+
+class MpClass_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MpClass_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(MpClass_result)
+MpClass_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+)
+
+
+class Contains_args(object):
+    """
+    Attributes:
+     - formula1
+     - formula2
+
+    """
+
+
+    def __init__(self, formula1=None, formula2=None,):
+        self.formula1 = formula1
+        self.formula2 = formula2
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula1 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.formula2 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Contains_args')
+        if self.formula1 is not None:
+            oprot.writeFieldBegin('formula1', TType.STRING, 1)
+            oprot.writeString(self.formula1.encode('utf-8') if sys.version_info[0] == 2 else self.formula1)
+            oprot.writeFieldEnd()
+        if self.formula2 is not None:
+            oprot.writeFieldBegin('formula2', TType.STRING, 2)
+            oprot.writeString(self.formula2.encode('utf-8') if sys.version_info[0] == 2 else self.formula2)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Contains_args)
+Contains_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula1', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'formula2', 'UTF8', None, ),  # 2
+)
+
+
+class Contains_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Contains_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Contains_result)
+Contains_result.thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ),  # 0
+)
+
+
+class IsEquivalent_args(object):
+    """
+    Attributes:
+     - formula1
+     - formula2
+
+    """
+
+
+    def __init__(self, formula1=None, formula2=None,):
+        self.formula1 = formula1
+        self.formula2 = formula2
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula1 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.formula2 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('IsEquivalent_args')
+        if self.formula1 is not None:
+            oprot.writeFieldBegin('formula1', TType.STRING, 1)
+            oprot.writeString(self.formula1.encode('utf-8') if sys.version_info[0] == 2 else self.formula1)
+            oprot.writeFieldEnd()
+        if self.formula2 is not None:
+            oprot.writeFieldBegin('formula2', TType.STRING, 2)
+            oprot.writeString(self.formula2.encode('utf-8') if sys.version_info[0] == 2 else self.formula2)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(IsEquivalent_args)
+IsEquivalent_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula1', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'formula2', 'UTF8', None, ),  # 2
+)
+
+
+class IsEquivalent_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('IsEquivalent_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(IsEquivalent_result)
+IsEquivalent_result.thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ),  # 0
+)
+
+
+class RndLTL_args(object):
+    """
+    Attributes:
+     - numAP
+     - rndSeed
+
+    """
+
+
+    def __init__(self, numAP=None, rndSeed=None,):
+        self.numAP = numAP
+        self.rndSeed = rndSeed
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.numAP = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.rndSeed = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('RndLTL_args')
+        if self.numAP is not None:
+            oprot.writeFieldBegin('numAP', TType.I32, 1)
+            oprot.writeI32(self.numAP)
+            oprot.writeFieldEnd()
+        if self.rndSeed is not None:
+            oprot.writeFieldBegin('rndSeed', TType.I32, 2)
+            oprot.writeI32(self.rndSeed)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(RndLTL_args)
+RndLTL_args.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'numAP', None, None, ),  # 1
+    (2, TType.I32, 'rndSeed', None, None, ),  # 2
+)
+
+
+class RndLTL_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('RndLTL_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(RndLTL_result)
+RndLTL_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+)
+
+
+class GetAP_args(object):
+    """
+    Attributes:
+     - formula
+
+    """
+
+
+    def __init__(self, formula=None,):
+        self.formula = formula
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('GetAP_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(GetAP_args)
+GetAP_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+)
+
+
+class GetAP_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype108, _size105) = iprot.readListBegin()
+                    for _i109 in range(_size105):
+                        _elem110 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.success.append(_elem110)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('GetAP_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter111 in self.success:
+                oprot.writeString(iter111.encode('utf-8') if sys.version_info[0] == 2 else iter111)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(GetAP_result)
+GetAP_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRING, 'UTF8', False), None, ),  # 0
+)
+
+
+class ToLatexString_args(object):
+    """
+    Attributes:
+     - formula
+
+    """
+
+
+    def __init__(self, formula=None,):
+        self.formula = formula
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ToLatexString_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ToLatexString_args)
+ToLatexString_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+)
+
+
+class ToLatexString_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ToLatexString_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ToLatexString_result)
+ToLatexString_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+)
+
+
+class Translate_args(object):
+    """
+    Attributes:
+     - formula
+     - options
+
+    """
+
+
+    def __init__(self, formula=None, options=None,):
+        self.formula = formula
+        self.options = options
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.options = TTranslateOptions()
+                    self.options.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Translate_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        if self.options is not None:
+            oprot.writeFieldBegin('options', TType.STRUCT, 2)
+            self.options.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Translate_args)
+Translate_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+    (2, TType.STRUCT, 'options', [TTranslateOptions, None], None, ),  # 2
+)
+
+
+class Translate_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = TGraph()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Translate_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Translate_result)
+Translate_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [TGraph, None], None, ),  # 0
+)
+
+
+class TranslateCompact_args(object):
+    """
+    Attributes:
+     - formula
+     - options
+
+    """
+
+
+    def __init__(self, formula=None, options=None,):
+        self.formula = formula
+        self.options = options
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.options = TTranslateOptions()
+                    self.options.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateCompact_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        if self.options is not None:
+            oprot.writeFieldBegin('options', TType.STRUCT, 2)
+            self.options.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateCompact_args)
+TranslateCompact_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+    (2, TType.STRUCT, 'options', [TTranslateOptions, None], None, ),  # 2
+)
+
+
+class TranslateCompact_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = TCompactGraph()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateCompact_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateCompact_result)
+TranslateCompact_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [TCompactGraph, None], None, ),  # 0
+)
+
+
+class TranslateOpen_args(object):
+    """
+    Attributes:
+     - formula
+     - options
+
+    """
+
+
+    def __init__(self, formula=None, options=None,):
+        self.formula = formula
+        self.options = options
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.options = TTranslateOptions()
+                    self.options.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateOpen_args')
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 1)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        if self.options is not None:
+            oprot.writeFieldBegin('options', TType.STRUCT, 2)
+            self.options.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateOpen_args)
+TranslateOpen_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+    (2, TType.STRUCT, 'options', [TTranslateOptions, None], None, ),  # 2
+)
+
+
+class TranslateOpen_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = TTranslateCursor()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateOpen_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateOpen_result)
+TranslateOpen_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [TTranslateCursor, None], None, ),  # 0
+)
+
+
+class TranslateNext_args(object):
+    """
+    Attributes:
+     - cursor
+     - maxEdges
+
+    """
+
+
+    def __init__(self, cursor=None, maxEdges=None,):
+        self.cursor = cursor
+        self.maxEdges = maxEdges
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.cursor = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.maxEdges = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateNext_args')
+        if self.cursor is not None:
+            oprot.writeFieldBegin('cursor', TType.I64, 1)
+            oprot.writeI64(self.cursor)
+            oprot.writeFieldEnd()
+        if self.maxEdges is not None:
+            oprot.writeFieldBegin('maxEdges', TType.I32, 2)
+            oprot.writeI32(self.maxEdges)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateNext_args)
+TranslateNext_args.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'cursor', None, None, ),  # 1
+    (2, TType.I32, 'maxEdges', None, None, ),  # 2
+)
+
+
+class TranslateNext_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = TEdgePage()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateNext_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateNext_result)
+TranslateNext_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [TEdgePage, None], None, ),  # 0
+)
+
+
+class TranslateClose_args(object):
+    """
+    Attributes:
+     - cursor
+
+    """
+
+
+    def __init__(self, cursor=None,):
+        self.cursor = cursor
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.cursor = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TranslateClose_args')
+        if self.cursor is not None:
+            oprot.writeFieldBegin('cursor', TType.I64, 1)
+            oprot.writeI64(self.cursor)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_Translate(self, seqid, iprot, oprot):
-        args = Translate_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = Translate_result()
-        try:
-            result.success = self._handler.Translate(args.formula)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("Translate", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-# HELPER FUNCTIONS AND STRUCTURES
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TranslateClose_args)
+TranslateClose_args.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'cursor', None, None, ),  # 1
+)
 
 
-class Ping_args(object):
+class TranslateClose_result(object):
 
 
     def read(self, iprot):
@@ -586,7 +2889,7 @@ class Ping_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Ping_args')
+        oprot.writeStructBegin('TranslateClose_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -603,13 +2906,21 @@ class Ping_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Ping_args)
-Ping_args.thrift_spec = (
+all_structs.append(TranslateClose_result)
+TranslateClose_result.thrift_spec = (
 )
 
 
-class Ping_result(object):
+class MpClassBatch_args(object):
+    """
+    Attributes:
+     - formulas
+
+    """
+
 
+    def __init__(self, formulas=None,):
+        self.formulas = formulas
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -620,6 +2931,16 @@ class Ping_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.formulas = []
+                    (_etype115, _size112) = iprot.readListBegin()
+                    for _i116 in range(_size112):
+                        _elem117 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.formulas.append(_elem117)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -629,7 +2950,14 @@ class Ping_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Ping_result')
+        oprot.writeStructBegin('MpClassBatch_args')
+        if self.formulas is not None:
+            oprot.writeFieldBegin('formulas', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.formulas))
+            for iter118 in self.formulas:
+                oprot.writeString(iter118.encode('utf-8') if sys.version_info[0] == 2 else iter118)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -646,21 +2974,234 @@ class Ping_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Ping_result)
-Ping_result.thrift_spec = (
+all_structs.append(MpClassBatch_args)
+MpClassBatch_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'formulas', (TType.STRING, 'UTF8', False), None, ),  # 1
+)
+
+
+class MpClassBatch_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype122, _size119) = iprot.readListBegin()
+                    for _i123 in range(_size119):
+                        _elem124 = TStringResult()
+                        _elem124.read(iprot)
+                        self.success.append(_elem124)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MpClassBatch_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter125 in self.success:
+                iter125.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(MpClassBatch_result)
+MpClassBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TStringResult, None], False), None, ),  # 0
+)
+
+
+class ContainsBatch_args(object):
+    """
+    Attributes:
+     - pairs
+
+    """
+
+
+    def __init__(self, pairs=None,):
+        self.pairs = pairs
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.pairs = []
+                    (_etype129, _size126) = iprot.readListBegin()
+                    for _i130 in range(_size126):
+                        _elem131 = TFormulaPair()
+                        _elem131.read(iprot)
+                        self.pairs.append(_elem131)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ContainsBatch_args')
+        if self.pairs is not None:
+            oprot.writeFieldBegin('pairs', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.pairs))
+            for iter132 in self.pairs:
+                iter132.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ContainsBatch_args)
+ContainsBatch_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'pairs', (TType.STRUCT, [TFormulaPair, None], False), None, ),  # 1
+)
+
+
+class ContainsBatch_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype136, _size133) = iprot.readListBegin()
+                    for _i137 in range(_size133):
+                        _elem138 = TBoolResult()
+                        _elem138.read(iprot)
+                        self.success.append(_elem138)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ContainsBatch_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter139 in self.success:
+                iter139.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ContainsBatch_result)
+ContainsBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TBoolResult, None], False), None, ),  # 0
 )
 
 
-class MpClass_args(object):
+class IsEquivalentBatch_args(object):
     """
     Attributes:
-     - formula
+     - pairs
 
     """
 
 
-    def __init__(self, formula=None,):
-        self.formula = formula
+    def __init__(self, pairs=None,):
+        self.pairs = pairs
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -672,8 +3213,14 @@ class MpClass_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.pairs = []
+                    (_etype143, _size140) = iprot.readListBegin()
+                    for _i144 in range(_size140):
+                        _elem145 = TFormulaPair()
+                        _elem145.read(iprot)
+                        self.pairs.append(_elem145)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -685,10 +3232,13 @@ class MpClass_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('MpClass_args')
-        if self.formula is not None:
-            oprot.writeFieldBegin('formula', TType.STRING, 1)
-            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+        oprot.writeStructBegin('IsEquivalentBatch_args')
+        if self.pairs is not None:
+            oprot.writeFieldBegin('pairs', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.pairs))
+            for iter146 in self.pairs:
+                iter146.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -706,14 +3256,14 @@ class MpClass_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(MpClass_args)
-MpClass_args.thrift_spec = (
+all_structs.append(IsEquivalentBatch_args)
+IsEquivalentBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+    (1, TType.LIST, 'pairs', (TType.STRUCT, [TFormulaPair, None], False), None, ),  # 1
 )
 
 
-class MpClass_result(object):
+class IsEquivalentBatch_result(object):
     """
     Attributes:
      - success
@@ -734,8 +3284,14 @@ class MpClass_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype150, _size147) = iprot.readListBegin()
+                    for _i151 in range(_size147):
+                        _elem152 = TBoolResult()
+                        _elem152.read(iprot)
+                        self.success.append(_elem152)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -747,10 +3303,13 @@ class MpClass_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('MpClass_result')
+        oprot.writeStructBegin('IsEquivalentBatch_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter153 in self.success:
+                iter153.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -768,24 +3327,22 @@ class MpClass_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(MpClass_result)
-MpClass_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+all_structs.append(IsEquivalentBatch_result)
+IsEquivalentBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TBoolResult, None], False), None, ),  # 0
 )
 
 
-class Contains_args(object):
+class GetAPBatch_args(object):
     """
     Attributes:
-     - formula1
-     - formula2
+     - formulas
 
     """
 
 
-    def __init__(self, formula1=None, formula2=None,):
-        self.formula1 = formula1
-        self.formula2 = formula2
+    def __init__(self, formulas=None,):
+        self.formulas = formulas
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -797,13 +3354,13 @@ class Contains_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula1 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.formula2 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.formulas = []
+                    (_etype157, _size154) = iprot.readListBegin()
+                    for _i158 in range(_size154):
+                        _elem159 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.formulas.append(_elem159)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -815,14 +3372,13 @@ class Contains_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Contains_args')
-        if self.formula1 is not None:
-            oprot.writeFieldBegin('formula1', TType.STRING, 1)
-            oprot.writeString(self.formula1.encode('utf-8') if sys.version_info[0] == 2 else self.formula1)
-            oprot.writeFieldEnd()
-        if self.formula2 is not None:
-            oprot.writeFieldBegin('formula2', TType.STRING, 2)
-            oprot.writeString(self.formula2.encode('utf-8') if sys.version_info[0] == 2 else self.formula2)
+        oprot.writeStructBegin('GetAPBatch_args')
+        if self.formulas is not None:
+            oprot.writeFieldBegin('formulas', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.formulas))
+            for iter160 in self.formulas:
+                oprot.writeString(iter160.encode('utf-8') if sys.version_info[0] == 2 else iter160)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -840,15 +3396,14 @@ class Contains_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Contains_args)
-Contains_args.thrift_spec = (
+all_structs.append(GetAPBatch_args)
+GetAPBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'formula1', 'UTF8', None, ),  # 1
-    (2, TType.STRING, 'formula2', 'UTF8', None, ),  # 2
+    (1, TType.LIST, 'formulas', (TType.STRING, 'UTF8', False), None, ),  # 1
 )
 
 
-class Contains_result(object):
+class GetAPBatch_result(object):
     """
     Attributes:
      - success
@@ -869,8 +3424,14 @@ class Contains_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype164, _size161) = iprot.readListBegin()
+                    for _i165 in range(_size161):
+                        _elem166 = TStringListResult()
+                        _elem166.read(iprot)
+                        self.success.append(_elem166)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -882,10 +3443,13 @@ class Contains_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Contains_result')
+        oprot.writeStructBegin('GetAPBatch_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter167 in self.success:
+                iter167.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -903,24 +3467,22 @@ class Contains_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Contains_result)
-Contains_result.thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ),  # 0
+all_structs.append(GetAPBatch_result)
+GetAPBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TStringListResult, None], False), None, ),  # 0
 )
 
 
-class IsEquivalent_args(object):
+class ToLatexStringBatch_args(object):
     """
     Attributes:
-     - formula1
-     - formula2
+     - formulas
 
     """
 
 
-    def __init__(self, formula1=None, formula2=None,):
-        self.formula1 = formula1
-        self.formula2 = formula2
+    def __init__(self, formulas=None,):
+        self.formulas = formulas
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -932,13 +3494,13 @@ class IsEquivalent_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula1 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.formula2 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.formulas = []
+                    (_etype171, _size168) = iprot.readListBegin()
+                    for _i172 in range(_size168):
+                        _elem173 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.formulas.append(_elem173)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -950,14 +3512,13 @@ class IsEquivalent_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('IsEquivalent_args')
-        if self.formula1 is not None:
-            oprot.writeFieldBegin('formula1', TType.STRING, 1)
-            oprot.writeString(self.formula1.encode('utf-8') if sys.version_info[0] == 2 else self.formula1)
-            oprot.writeFieldEnd()
-        if self.formula2 is not None:
-            oprot.writeFieldBegin('formula2', TType.STRING, 2)
-            oprot.writeString(self.formula2.encode('utf-8') if sys.version_info[0] == 2 else self.formula2)
+        oprot.writeStructBegin('ToLatexStringBatch_args')
+        if self.formulas is not None:
+            oprot.writeFieldBegin('formulas', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.formulas))
+            for iter174 in self.formulas:
+                oprot.writeString(iter174.encode('utf-8') if sys.version_info[0] == 2 else iter174)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -975,15 +3536,14 @@ class IsEquivalent_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(IsEquivalent_args)
-IsEquivalent_args.thrift_spec = (
+all_structs.append(ToLatexStringBatch_args)
+ToLatexStringBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'formula1', 'UTF8', None, ),  # 1
-    (2, TType.STRING, 'formula2', 'UTF8', None, ),  # 2
+    (1, TType.LIST, 'formulas', (TType.STRING, 'UTF8', False), None, ),  # 1
 )
 
 
-class IsEquivalent_result(object):
+class ToLatexStringBatch_result(object):
     """
     Attributes:
      - success
@@ -1004,8 +3564,14 @@ class IsEquivalent_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype178, _size175) = iprot.readListBegin()
+                    for _i179 in range(_size175):
+                        _elem180 = TStringResult()
+                        _elem180.read(iprot)
+                        self.success.append(_elem180)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1017,10 +3583,13 @@ class IsEquivalent_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('IsEquivalent_result')
+        oprot.writeStructBegin('ToLatexStringBatch_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter181 in self.success:
+                iter181.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1038,24 +3607,24 @@ class IsEquivalent_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(IsEquivalent_result)
-IsEquivalent_result.thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ),  # 0
+all_structs.append(ToLatexStringBatch_result)
+ToLatexStringBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TStringResult, None], False), None, ),  # 0
 )
 
 
-class RndLTL_args(object):
+class TranslateBatch_args(object):
     """
     Attributes:
-     - numAP
-     - rndSeed
+     - formulas
+     - options
 
     """
 
 
-    def __init__(self, numAP=None, rndSeed=None,):
-        self.numAP = numAP
-        self.rndSeed = rndSeed
+    def __init__(self, formulas=None, options=None,):
+        self.formulas = formulas
+        self.options = options
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1067,13 +3636,19 @@ class RndLTL_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I32:
-                    self.numAP = iprot.readI32()
+                if ftype == TType.LIST:
+                    self.formulas = []
+                    (_etype185, _size182) = iprot.readListBegin()
+                    for _i186 in range(_size182):
+                        _elem187 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.formulas.append(_elem187)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.rndSeed = iprot.readI32()
+                if ftype == TType.STRUCT:
+                    self.options = TTranslateOptions()
+                    self.options.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -1085,14 +3660,17 @@ class RndLTL_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('RndLTL_args')
-        if self.numAP is not None:
-            oprot.writeFieldBegin('numAP', TType.I32, 1)
-            oprot.writeI32(self.numAP)
+        oprot.writeStructBegin('TranslateBatch_args')
+        if self.formulas is not None:
+            oprot.writeFieldBegin('formulas', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.formulas))
+            for iter188 in self.formulas:
+                oprot.writeString(iter188.encode('utf-8') if sys.version_info[0] == 2 else iter188)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.rndSeed is not None:
-            oprot.writeFieldBegin('rndSeed', TType.I32, 2)
-            oprot.writeI32(self.rndSeed)
+        if self.options is not None:
+            oprot.writeFieldBegin('options', TType.STRUCT, 2)
+            self.options.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1110,15 +3688,15 @@ class RndLTL_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(RndLTL_args)
-RndLTL_args.thrift_spec = (
+all_structs.append(TranslateBatch_args)
+TranslateBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.I32, 'numAP', None, None, ),  # 1
-    (2, TType.I32, 'rndSeed', None, None, ),  # 2
+    (1, TType.LIST, 'formulas', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRUCT, 'options', [TTranslateOptions, None], None, ),  # 2
 )
 
 
-class RndLTL_result(object):
+class TranslateBatch_result(object):
     """
     Attributes:
      - success
@@ -1139,8 +3717,14 @@ class RndLTL_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype192, _size189) = iprot.readListBegin()
+                    for _i193 in range(_size189):
+                        _elem194 = TGraphResult()
+                        _elem194.read(iprot)
+                        self.success.append(_elem194)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1152,10 +3736,13 @@ class RndLTL_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('RndLTL_result')
+        oprot.writeStructBegin('TranslateBatch_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter195 in self.success:
+                iter195.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1173,22 +3760,24 @@ class RndLTL_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(RndLTL_result)
-RndLTL_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+all_structs.append(TranslateBatch_result)
+TranslateBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TGraphResult, None], False), None, ),  # 0
 )
 
 
-class GetAP_args(object):
+class TranslateCompactBatch_args(object):
     """
     Attributes:
-     - formula
+     - formulas
+     - options
 
     """
 
 
-    def __init__(self, formula=None,):
-        self.formula = formula
+    def __init__(self, formulas=None, options=None,):
+        self.formulas = formulas
+        self.options = options
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1200,8 +3789,19 @@ class GetAP_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.formulas = []
+                    (_etype199, _size196) = iprot.readListBegin()
+                    for _i200 in range(_size196):
+                        _elem201 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.formulas.append(_elem201)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.options = TTranslateOptions()
+                    self.options.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -1213,10 +3813,17 @@ class GetAP_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('GetAP_args')
-        if self.formula is not None:
-            oprot.writeFieldBegin('formula', TType.STRING, 1)
-            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+        oprot.writeStructBegin('TranslateCompactBatch_args')
+        if self.formulas is not None:
+            oprot.writeFieldBegin('formulas', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.formulas))
+            for iter202 in self.formulas:
+                oprot.writeString(iter202.encode('utf-8') if sys.version_info[0] == 2 else iter202)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.options is not None:
+            oprot.writeFieldBegin('options', TType.STRUCT, 2)
+            self.options.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1234,14 +3841,15 @@ class GetAP_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(GetAP_args)
-GetAP_args.thrift_spec = (
+all_structs.append(TranslateCompactBatch_args)
+TranslateCompactBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+    (1, TType.LIST, 'formulas', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRUCT, 'options', [TTranslateOptions, None], None, ),  # 2
 )
 
 
-class GetAP_result(object):
+class TranslateCompactBatch_result(object):
     """
     Attributes:
      - success
@@ -1264,10 +3872,11 @@ class GetAP_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype31, _size28) = iprot.readListBegin()
-                    for _i32 in range(_size28):
-                        _elem33 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                        self.success.append(_elem33)
+                    (_etype206, _size203) = iprot.readListBegin()
+                    for _i207 in range(_size203):
+                        _elem208 = TCompactGraphResult()
+                        _elem208.read(iprot)
+                        self.success.append(_elem208)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -1280,12 +3889,12 @@ class GetAP_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('GetAP_result')
+        oprot.writeStructBegin('TranslateCompactBatch_result')
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter34 in self.success:
-                oprot.writeString(iter34.encode('utf-8') if sys.version_info[0] == 2 else iter34)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter209 in self.success:
+                iter209.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -1304,22 +3913,14 @@ class GetAP_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(GetAP_result)
-GetAP_result.thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRING, 'UTF8', False), None, ),  # 0
+all_structs.append(TranslateCompactBatch_result)
+TranslateCompactBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TCompactGraphResult, None], False), None, ),  # 0
 )
 
 
-class ToLatexString_args(object):
-    """
-    Attributes:
-     - formula
-
-    """
-
+class GetCacheStats_args(object):
 
-    def __init__(self, formula=None,):
-        self.formula = formula
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1330,11 +3931,6 @@ class ToLatexString_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1344,11 +3940,7 @@ class ToLatexString_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ToLatexString_args')
-        if self.formula is not None:
-            oprot.writeFieldBegin('formula', TType.STRING, 1)
-            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('GetCacheStats_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1365,14 +3957,12 @@ class ToLatexString_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(ToLatexString_args)
-ToLatexString_args.thrift_spec = (
-    None,  # 0
-    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+all_structs.append(GetCacheStats_args)
+GetCacheStats_args.thrift_spec = (
 )
 
 
-class ToLatexString_result(object):
+class GetCacheStats_result(object):
     """
     Attributes:
      - success
@@ -1393,8 +3983,14 @@ class ToLatexString_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype213, _size210) = iprot.readListBegin()
+                    for _i214 in range(_size210):
+                        _elem215 = TCacheStats()
+                        _elem215.read(iprot)
+                        self.success.append(_elem215)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1406,10 +4002,13 @@ class ToLatexString_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ToLatexString_result')
+        oprot.writeStructBegin('GetCacheStats_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter216 in self.success:
+                iter216.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1427,22 +4026,14 @@ class ToLatexString_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(ToLatexString_result)
-ToLatexString_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+all_structs.append(GetCacheStats_result)
+GetCacheStats_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [TCacheStats, None], False), None, ),  # 0
 )
 
 
-class Translate_args(object):
-    """
-    Attributes:
-     - formula
-
-    """
-
+class Version_args(object):
 
-    def __init__(self, formula=None,):
-        self.formula = formula
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1453,11 +4044,6 @@ class Translate_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1467,11 +4053,7 @@ class Translate_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Translate_args')
-        if self.formula is not None:
-            oprot.writeFieldBegin('formula', TType.STRING, 1)
-            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('Version_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1488,14 +4070,12 @@ class Translate_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Translate_args)
-Translate_args.thrift_spec = (
-    None,  # 0
-    (1, TType.STRING, 'formula', 'UTF8', None, ),  # 1
+all_structs.append(Version_args)
+Version_args.thrift_spec = (
 )
 
 
-class Translate_result(object):
+class Version_result(object):
     """
     Attributes:
      - success
@@ -1516,9 +4096,8 @@ class Translate_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = TGraph()
-                    self.success.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1530,10 +4109,10 @@ class Translate_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('Translate_result')
+        oprot.writeStructBegin('Version_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1551,9 +4130,9 @@ class Translate_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(Translate_result)
-Translate_result.thrift_spec = (
-    (0, TType.STRUCT, 'success', [TGraph, None], None, ),  # 0
+all_structs.append(Version_result)
+Version_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
 )
 fix_spec(all_structs)
 del all_structs
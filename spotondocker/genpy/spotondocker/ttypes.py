@@ -362,6 +362,1098 @@ class TGraph(object):
 
     def __ne__(self, other):
         return not (self == other)
+
+
+class TCompactGraph(object):
+    """
+    Attributes:
+     - acceptance
+     - numAccSets
+     - numStates
+     - initStates
+     - apNames
+     - formula
+     - isDeterministic
+     - hasStateBasedAcc
+     - isTerminal
+     - accepting
+     - labels
+     - edgeSrc
+     - edgeDst
+     - edgeLabel
+
+    """
+
+
+    def __init__(self, acceptance=None, numAccSets=None, numStates=None, initStates=None, apNames=None, formula=None, isDeterministic=None, hasStateBasedAcc=None, isTerminal=None, accepting=None, labels=None, edgeSrc=None, edgeDst=None, edgeLabel=None,):
+        self.acceptance = acceptance
+        self.numAccSets = numAccSets
+        self.numStates = numStates
+        self.initStates = initStates
+        self.apNames = apNames
+        self.formula = formula
+        self.isDeterministic = isDeterministic
+        self.hasStateBasedAcc = hasStateBasedAcc
+        self.isTerminal = isTerminal
+        self.accepting = accepting
+        self.labels = labels
+        self.edgeSrc = edgeSrc
+        self.edgeDst = edgeDst
+        self.edgeLabel = edgeLabel
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.acceptance = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.numAccSets = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.numStates = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.initStates = []
+                    (_etype31, _size28) = iprot.readListBegin()
+                    for _i32 in range(_size28):
+                        _elem33 = iprot.readI32()
+                        self.initStates.append(_elem33)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.apNames = []
+                    (_etype37, _size34) = iprot.readListBegin()
+                    for _i38 in range(_size34):
+                        _elem39 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.apNames.append(_elem39)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.formula = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.BOOL:
+                    self.isDeterministic = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.BOOL:
+                    self.hasStateBasedAcc = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.BOOL:
+                    self.isTerminal = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRING:
+                    self.accepting = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.LIST:
+                    self.labels = []
+                    (_etype43, _size40) = iprot.readListBegin()
+                    for _i44 in range(_size40):
+                        _elem45 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.labels.append(_elem45)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.LIST:
+                    self.edgeSrc = []
+                    (_etype49, _size46) = iprot.readListBegin()
+                    for _i50 in range(_size46):
+                        _elem51 = iprot.readI32()
+                        self.edgeSrc.append(_elem51)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.LIST:
+                    self.edgeDst = []
+                    (_etype55, _size52) = iprot.readListBegin()
+                    for _i56 in range(_size52):
+                        _elem57 = iprot.readI32()
+                        self.edgeDst.append(_elem57)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.LIST:
+                    self.edgeLabel = []
+                    (_etype61, _size58) = iprot.readListBegin()
+                    for _i62 in range(_size58):
+                        _elem63 = iprot.readI32()
+                        self.edgeLabel.append(_elem63)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TCompactGraph')
+        if self.acceptance is not None:
+            oprot.writeFieldBegin('acceptance', TType.STRING, 1)
+            oprot.writeString(self.acceptance.encode('utf-8') if sys.version_info[0] == 2 else self.acceptance)
+            oprot.writeFieldEnd()
+        if self.numAccSets is not None:
+            oprot.writeFieldBegin('numAccSets', TType.I32, 2)
+            oprot.writeI32(self.numAccSets)
+            oprot.writeFieldEnd()
+        if self.numStates is not None:
+            oprot.writeFieldBegin('numStates', TType.I32, 3)
+            oprot.writeI32(self.numStates)
+            oprot.writeFieldEnd()
+        if self.initStates is not None:
+            oprot.writeFieldBegin('initStates', TType.LIST, 4)
+            oprot.writeListBegin(TType.I32, len(self.initStates))
+            for iter64 in self.initStates:
+                oprot.writeI32(iter64)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.apNames is not None:
+            oprot.writeFieldBegin('apNames', TType.LIST, 5)
+            oprot.writeListBegin(TType.STRING, len(self.apNames))
+            for iter65 in self.apNames:
+                oprot.writeString(iter65.encode('utf-8') if sys.version_info[0] == 2 else iter65)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.formula is not None:
+            oprot.writeFieldBegin('formula', TType.STRING, 6)
+            oprot.writeString(self.formula.encode('utf-8') if sys.version_info[0] == 2 else self.formula)
+            oprot.writeFieldEnd()
+        if self.isDeterministic is not None:
+            oprot.writeFieldBegin('isDeterministic', TType.BOOL, 7)
+            oprot.writeBool(self.isDeterministic)
+            oprot.writeFieldEnd()
+        if self.hasStateBasedAcc is not None:
+            oprot.writeFieldBegin('hasStateBasedAcc', TType.BOOL, 8)
+            oprot.writeBool(self.hasStateBasedAcc)
+            oprot.writeFieldEnd()
+        if self.isTerminal is not None:
+            oprot.writeFieldBegin('isTerminal', TType.BOOL, 9)
+            oprot.writeBool(self.isTerminal)
+            oprot.writeFieldEnd()
+        if self.accepting is not None:
+            oprot.writeFieldBegin('accepting', TType.STRING, 10)
+            oprot.writeBinary(self.accepting)
+            oprot.writeFieldEnd()
+        if self.labels is not None:
+            oprot.writeFieldBegin('labels', TType.LIST, 11)
+            oprot.writeListBegin(TType.STRING, len(self.labels))
+            for iter66 in self.labels:
+                oprot.writeString(iter66.encode('utf-8') if sys.version_info[0] == 2 else iter66)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeSrc is not None:
+            oprot.writeFieldBegin('edgeSrc', TType.LIST, 12)
+            oprot.writeListBegin(TType.I32, len(self.edgeSrc))
+            for iter67 in self.edgeSrc:
+                oprot.writeI32(iter67)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeDst is not None:
+            oprot.writeFieldBegin('edgeDst', TType.LIST, 13)
+            oprot.writeListBegin(TType.I32, len(self.edgeDst))
+            for iter68 in self.edgeDst:
+                oprot.writeI32(iter68)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeLabel is not None:
+            oprot.writeFieldBegin('edgeLabel', TType.LIST, 14)
+            oprot.writeListBegin(TType.I32, len(self.edgeLabel))
+            for iter69 in self.edgeLabel:
+                oprot.writeI32(iter69)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TTranslateCursor(object):
+    """
+    Attributes:
+     - cursor
+     - header
+     - numEdges
+
+    """
+
+
+    def __init__(self, cursor=None, header=None, numEdges=None,):
+        self.cursor = cursor
+        self.header = header
+        self.numEdges = numEdges
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.cursor = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.header = TCompactGraph()
+                    self.header.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.numEdges = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TTranslateCursor')
+        if self.cursor is not None:
+            oprot.writeFieldBegin('cursor', TType.I64, 1)
+            oprot.writeI64(self.cursor)
+            oprot.writeFieldEnd()
+        if self.header is not None:
+            oprot.writeFieldBegin('header', TType.STRUCT, 2)
+            self.header.write(oprot)
+            oprot.writeFieldEnd()
+        if self.numEdges is not None:
+            oprot.writeFieldBegin('numEdges', TType.I64, 3)
+            oprot.writeI64(self.numEdges)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TEdgePage(object):
+    """
+    Attributes:
+     - labels
+     - edgeSrc
+     - edgeDst
+     - edgeLabel
+     - last
+
+    """
+
+
+    def __init__(self, labels=None, edgeSrc=None, edgeDst=None, edgeLabel=None, last=None,):
+        self.labels = labels
+        self.edgeSrc = edgeSrc
+        self.edgeDst = edgeDst
+        self.edgeLabel = edgeLabel
+        self.last = last
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.labels = []
+                    (_etype73, _size70) = iprot.readListBegin()
+                    for _i74 in range(_size70):
+                        _elem75 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.labels.append(_elem75)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.edgeSrc = []
+                    (_etype79, _size76) = iprot.readListBegin()
+                    for _i80 in range(_size76):
+                        _elem81 = iprot.readI32()
+                        self.edgeSrc.append(_elem81)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.edgeDst = []
+                    (_etype85, _size82) = iprot.readListBegin()
+                    for _i86 in range(_size82):
+                        _elem87 = iprot.readI32()
+                        self.edgeDst.append(_elem87)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.edgeLabel = []
+                    (_etype91, _size88) = iprot.readListBegin()
+                    for _i92 in range(_size88):
+                        _elem93 = iprot.readI32()
+                        self.edgeLabel.append(_elem93)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.last = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TEdgePage')
+        if self.labels is not None:
+            oprot.writeFieldBegin('labels', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.labels))
+            for iter94 in self.labels:
+                oprot.writeString(iter94.encode('utf-8') if sys.version_info[0] == 2 else iter94)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeSrc is not None:
+            oprot.writeFieldBegin('edgeSrc', TType.LIST, 2)
+            oprot.writeListBegin(TType.I32, len(self.edgeSrc))
+            for iter95 in self.edgeSrc:
+                oprot.writeI32(iter95)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeDst is not None:
+            oprot.writeFieldBegin('edgeDst', TType.LIST, 3)
+            oprot.writeListBegin(TType.I32, len(self.edgeDst))
+            for iter96 in self.edgeDst:
+                oprot.writeI32(iter96)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.edgeLabel is not None:
+            oprot.writeFieldBegin('edgeLabel', TType.LIST, 4)
+            oprot.writeListBegin(TType.I32, len(self.edgeLabel))
+            for iter97 in self.edgeLabel:
+                oprot.writeI32(iter97)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.last is not None:
+            oprot.writeFieldBegin('last', TType.BOOL, 5)
+            oprot.writeBool(self.last)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TTranslateOptions(object):
+    """
+    Attributes:
+     - outputType
+     - level
+     - stateBasedAcc
+     - complete
+     - deterministic
+
+    """
+
+
+    def __init__(self, outputType="BA", level="High", stateBasedAcc=True, complete=True, deterministic=False,):
+        self.outputType = outputType
+        self.level = level
+        self.stateBasedAcc = stateBasedAcc
+        self.complete = complete
+        self.deterministic = deterministic
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.outputType = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.level = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.stateBasedAcc = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.complete = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.deterministic = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TTranslateOptions')
+        if self.outputType is not None:
+            oprot.writeFieldBegin('outputType', TType.STRING, 1)
+            oprot.writeString(self.outputType.encode('utf-8') if sys.version_info[0] == 2 else self.outputType)
+            oprot.writeFieldEnd()
+        if self.level is not None:
+            oprot.writeFieldBegin('level', TType.STRING, 2)
+            oprot.writeString(self.level.encode('utf-8') if sys.version_info[0] == 2 else self.level)
+            oprot.writeFieldEnd()
+        if self.stateBasedAcc is not None:
+            oprot.writeFieldBegin('stateBasedAcc', TType.BOOL, 3)
+            oprot.writeBool(self.stateBasedAcc)
+            oprot.writeFieldEnd()
+        if self.complete is not None:
+            oprot.writeFieldBegin('complete', TType.BOOL, 4)
+            oprot.writeBool(self.complete)
+            oprot.writeFieldEnd()
+        if self.deterministic is not None:
+            oprot.writeFieldBegin('deterministic', TType.BOOL, 5)
+            oprot.writeBool(self.deterministic)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TFormulaPair(object):
+    """
+    Attributes:
+     - formula1
+     - formula2
+
+    """
+
+
+    def __init__(self, formula1=None, formula2=None,):
+        self.formula1 = formula1
+        self.formula2 = formula2
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.formula1 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.formula2 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TFormulaPair')
+        if self.formula1 is not None:
+            oprot.writeFieldBegin('formula1', TType.STRING, 1)
+            oprot.writeString(self.formula1.encode('utf-8') if sys.version_info[0] == 2 else self.formula1)
+            oprot.writeFieldEnd()
+        if self.formula2 is not None:
+            oprot.writeFieldBegin('formula2', TType.STRING, 2)
+            oprot.writeString(self.formula2.encode('utf-8') if sys.version_info[0] == 2 else self.formula2)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TStringResult(object):
+    """
+    Attributes:
+     - value
+     - error
+
+    """
+
+
+    def __init__(self, value=None, error=None,):
+        self.value = value
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.value = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TStringResult')
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.STRING, 1)
+            oprot.writeString(self.value.encode('utf-8') if sys.version_info[0] == 2 else self.value)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 2)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TBoolResult(object):
+    """
+    Attributes:
+     - value
+     - error
+
+    """
+
+
+    def __init__(self, value=None, error=None,):
+        self.value = value
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.BOOL:
+                    self.value = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TBoolResult')
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.BOOL, 1)
+            oprot.writeBool(self.value)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 2)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TStringListResult(object):
+    """
+    Attributes:
+     - value
+     - error
+
+    """
+
+
+    def __init__(self, value=None, error=None,):
+        self.value = value
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.value = []
+                    (_etype101, _size98) = iprot.readListBegin()
+                    for _i102 in range(_size98):
+                        _elem103 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.value.append(_elem103)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TStringListResult')
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.value))
+            for iter104 in self.value:
+                oprot.writeString(iter104.encode('utf-8') if sys.version_info[0] == 2 else iter104)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 2)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TGraphResult(object):
+    """
+    Attributes:
+     - value
+     - error
+
+    """
+
+
+    def __init__(self, value=None, error=None,):
+        self.value = value
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.value = TGraph()
+                    self.value.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TGraphResult')
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.STRUCT, 1)
+            self.value.write(oprot)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 2)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TCompactGraphResult(object):
+    """
+    Attributes:
+     - value
+     - error
+
+    """
+
+
+    def __init__(self, value=None, error=None,):
+        self.value = value
+        self.error = error
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.value = TCompactGraph()
+                    self.value.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TCompactGraphResult')
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.STRUCT, 1)
+            self.value.write(oprot)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 2)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class TCacheStats(object):
+    """
+    Attributes:
+     - operation
+     - hits
+     - misses
+     - evictions
+     - size
+     - sizeBytes
+
+    """
+
+
+    def __init__(self, operation=None, hits=None, misses=None, evictions=None, size=None, sizeBytes=None,):
+        self.operation = operation
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.sizeBytes = sizeBytes
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.operation = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.hits = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.misses = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.evictions = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I64:
+                    self.sizeBytes = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TCacheStats')
+        if self.operation is not None:
+            oprot.writeFieldBegin('operation', TType.STRING, 1)
+            oprot.writeString(self.operation.encode('utf-8') if sys.version_info[0] == 2 else self.operation)
+            oprot.writeFieldEnd()
+        if self.hits is not None:
+            oprot.writeFieldBegin('hits', TType.I64, 2)
+            oprot.writeI64(self.hits)
+            oprot.writeFieldEnd()
+        if self.misses is not None:
+            oprot.writeFieldBegin('misses', TType.I64, 3)
+            oprot.writeI64(self.misses)
+            oprot.writeFieldEnd()
+        if self.evictions is not None:
+            oprot.writeFieldBegin('evictions', TType.I64, 4)
+            oprot.writeI64(self.evictions)
+            oprot.writeFieldEnd()
+        if self.size is not None:
+            oprot.writeFieldBegin('size', TType.I32, 5)
+            oprot.writeI32(self.size)
+            oprot.writeFieldEnd()
+        if self.sizeBytes is not None:
+            oprot.writeFieldBegin('sizeBytes', TType.I64, 6)
+            oprot.writeI64(self.sizeBytes)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
 all_structs.append(TNode)
 TNode.thrift_spec = (
     None,  # 0
@@ -390,5 +1482,94 @@ TGraph.thrift_spec = (
     (10, TType.LIST, 'nodes', (TType.STRUCT, [TNode, None], False), None, ),  # 10
     (11, TType.LIST, 'edges', (TType.STRUCT, [TEdge, None], False), None, ),  # 11
 )
+all_structs.append(TCompactGraph)
+TCompactGraph.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'acceptance', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'numAccSets', None, None, ),  # 2
+    (3, TType.I32, 'numStates', None, None, ),  # 3
+    (4, TType.LIST, 'initStates', (TType.I32, None, False), None, ),  # 4
+    (5, TType.LIST, 'apNames', (TType.STRING, 'UTF8', False), None, ),  # 5
+    (6, TType.STRING, 'formula', 'UTF8', None, ),  # 6
+    (7, TType.BOOL, 'isDeterministic', None, None, ),  # 7
+    (8, TType.BOOL, 'hasStateBasedAcc', None, None, ),  # 8
+    (9, TType.BOOL, 'isTerminal', None, None, ),  # 9
+    (10, TType.STRING, 'accepting', 'BINARY', None, ),  # 10
+    (11, TType.LIST, 'labels', (TType.STRING, 'UTF8', False), None, ),  # 11
+    (12, TType.LIST, 'edgeSrc', (TType.I32, None, False), None, ),  # 12
+    (13, TType.LIST, 'edgeDst', (TType.I32, None, False), None, ),  # 13
+    (14, TType.LIST, 'edgeLabel', (TType.I32, None, False), None, ),  # 14
+)
+all_structs.append(TTranslateCursor)
+TTranslateCursor.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'cursor', None, None, ),  # 1
+    (2, TType.STRUCT, 'header', [TCompactGraph, None], None, ),  # 2
+    (3, TType.I64, 'numEdges', None, None, ),  # 3
+)
+all_structs.append(TEdgePage)
+TEdgePage.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'labels', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.LIST, 'edgeSrc', (TType.I32, None, False), None, ),  # 2
+    (3, TType.LIST, 'edgeDst', (TType.I32, None, False), None, ),  # 3
+    (4, TType.LIST, 'edgeLabel', (TType.I32, None, False), None, ),  # 4
+    (5, TType.BOOL, 'last', None, None, ),  # 5
+)
+all_structs.append(TTranslateOptions)
+TTranslateOptions.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'outputType', 'UTF8', "BA", ),  # 1
+    (2, TType.STRING, 'level', 'UTF8', "High", ),  # 2
+    (3, TType.BOOL, 'stateBasedAcc', None, True, ),  # 3
+    (4, TType.BOOL, 'complete', None, True, ),  # 4
+    (5, TType.BOOL, 'deterministic', None, False, ),  # 5
+)
+all_structs.append(TFormulaPair)
+TFormulaPair.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'formula1', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'formula2', 'UTF8', None, ),  # 2
+)
+all_structs.append(TStringResult)
+TStringResult.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'value', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'error', 'UTF8', None, ),  # 2
+)
+all_structs.append(TBoolResult)
+TBoolResult.thrift_spec = (
+    None,  # 0
+    (1, TType.BOOL, 'value', None, None, ),  # 1
+    (2, TType.STRING, 'error', 'UTF8', None, ),  # 2
+)
+all_structs.append(TStringListResult)
+TStringListResult.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'value', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRING, 'error', 'UTF8', None, ),  # 2
+)
+all_structs.append(TGraphResult)
+TGraphResult.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'value', [TGraph, None], None, ),  # 1
+    (2, TType.STRING, 'error', 'UTF8', None, ),  # 2
+)
+all_structs.append(TCompactGraphResult)
+TCompactGraphResult.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'value', [TCompactGraph, None], None, ),  # 1
+    (2, TType.STRING, 'error', 'UTF8', None, ),  # 2
+)
+all_structs.append(TCacheStats)
+TCacheStats.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'operation', 'UTF8', None, ),  # 1
+    (2, TType.I64, 'hits', None, None, ),  # 2
+    (3, TType.I64, 'misses', None, None, ),  # 3
+    (4, TType.I64, 'evictions', None, None, ),  # 4
+    (5, TType.I32, 'size', None, None, ),  # 5
+    (6, TType.I64, 'sizeBytes', None, None, ),  # 6
+)
 fix_spec(all_structs)
 del all_structs
@@ -0,0 +1,177 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: pool.py
+Description:
+    The file defines `ConnectionPool` class which manages a bounded set of Thrift connections
+    to a SpotOnDocker server, so that a single client can be shared by several threads.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from thrift.Thrift import TApplicationException
+
+import contextlib
+import queue
+import threading
+import time
+
+
+class _Connection:
+    __slots__ = ["transport", "client", "last_used"]
+
+    def __init__(self, transport, client):
+        self.transport = transport
+        self.client = client
+        self.last_used = time.monotonic()
+
+    def close(self):
+        try:
+            self.transport.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of Thrift connections to one SpotOnDocker server.
+
+    Each call checks out a connection for exclusive use and returns it to the pool when done.
+    At most `size` connections are open at any time; callers block (up to `timeout` seconds)
+    when all of them are checked out.
+
+    Connections that raise a transport/protocol error are discarded, since the stream may be
+    left half-read. Connections idle for longer than `health_check_interval` seconds are
+    pinged before being handed out, and replaced if the ping fails.
+
+    :param factory: Callable returning a new, open `(transport, client)` pair.
+    :param size: Maximum number of simultaneously open connections.
+    :param timeout: Seconds to wait for a free connection. `None` waits forever.
+    :param health_check_interval: Idle seconds after which a connection is pinged before reuse.
+    """
+    def __init__(self, factory, size=1, timeout=None, health_check_interval=30.0):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}.")
+
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+        self._closed = False
+
+    def __len__(self):
+        """ Number of idle (open, not checked out) connections. """
+        return self._idle.qsize()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """
+        Context manager which checks out a `SpotOnDocker.Client` for exclusive use.
+
+        Example:
+            with pool.connection() as client:
+                client.Ping()
+        """
+        conn = self.acquire()
+        try:
+            yield conn.client
+        except TApplicationException:
+            # Server reported an error in a well-formed reply; the stream is intact.
+            self.release(conn)
+            raise
+        except BaseException:
+            self.release(conn, discard=True)
+            raise
+        else:
+            self.release(conn)
+
+    def acquire(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed.")
+
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"No connection available within {self.timeout} seconds (pool size: {self.size}).")
+
+        try:
+            conn = self._get_idle()
+            if conn is None:
+                conn = _Connection(*self._factory())
+        except BaseException:
+            self._slots.release()
+            raise
+
+        return conn
+
+    def release(self, conn, discard=False):
+        try:
+            if discard or self._closed:
+                conn.close()
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """ Closes all idle connections. Connections in use are closed when released. """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _get_idle(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            if self._is_healthy(conn):
+                return conn
+            conn.close()
+
+    def _is_healthy(self, conn):
+        if not conn.transport.isOpen():
+            return False
+
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+
+        try:
+            conn.client.Ping()
+            return True
+        except Exception:
+            return False
@@ -37,38 +37,77 @@ Description:
 Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
 """
 
-import sys
-sys.path.append('genpy')
-from spotondocker import SpotOnDocker
+import sys, os
+dir_spotondocker = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_spotondocker)
+
+# Absolute paths, so that the handler can also be imported by the in-process backend of the client.
+try:
+    # Imported as part of the spotondocker package (client side).
+    from spotondocker.genpy.spotondocker import SpotOnDocker
+except ImportError:
+    # Imported next to server.py, e.g. in the container.
+    from genpy.spotondocker import SpotOnDocker
 
 from thrift.transport import TSocket
-from thrift.transport import TTransport
-from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
+from servers import IdleWatchdog, TNonblockingPoolServer, TPreforkServer
+from cache import LRUCache
+from compact import EdgePager, compact_graph
+from translators import TranslatorPool, translate_args
+from convert import iter_edges, to_graph, to_header
+import wire
 
 import argparse
+import itertools
+import signal
 import spot
+import time
+
+
+# Version of the server. Increment whenever the results returned for the same input change.
+SERVER_VERSION = "0.2.0"
 
 
 class SpotOnDockerHandler:
-    def __init__(self):
-        self.log = {}
+    # Operations whose results are cached. 
+    CACHED_OPERATIONS = ("MpClass", "Contains", "IsEquivalent", "Translate")
+
+    # Maximum number of open paged translations, and seconds after which an unused one is closed.
+    MAX_CURSORS = 64
+    CURSOR_TIMEOUT = 600
+
+    def __init__(self, cache_size=4096, cache_bytes=64 * 2 ** 20, recycle_translators=1000):
+        """
+        Results of `CACHED_OPERATIONS` are kept in one LRU cache per operation, holding at most 
+        `cache_size` entries and (approximately) `cache_bytes` bytes. Cache keys are the canonical 
+        strings of the parsed formulas (and, for `Translate`, the options), so that e.g. "F a" and 
+        "Fa" share an entry. `cache_size=0` disables caching.
+
+        Translations reuse long-lived spot translators, which are replaced after 
+        `recycle_translators` translations (see `TranslatorPool`).
+        """
+        self.caches = {op: LRUCache(maxsize=cache_size, maxbytes=cache_bytes) for op in self.CACHED_OPERATIONS}
+        self.translators = TranslatorPool(recycle_after=recycle_translators)
+        self.cursors = dict()
+        self._cursor_ids = itertools.count(1)
     
     def Ping(self):
-        print("Ping()")
+        pass
 
     def MpClass(self, formula):
-        return spot.mp_class(formula, 'v')
+        f = spot.formula(formula)
+        return self.caches["MpClass"].get_or_compute(str(f), lambda: spot.mp_class(f, 'v'))
     
     def Contains(self, formula1, formula2):
         f1 = spot.formula(formula1)
         f2 = spot.formula(formula2)
-        return spot.contains(f1, f2)
+        return self.caches["Contains"].get_or_compute((str(f1), str(f2)), lambda: spot.contains(f1, f2))
 
     def IsEquivalent(self, formula1, formula2):
         f1 = spot.formula(formula1)
         f2 = spot.formula(formula2)
-        return spot.are_equivalent(f1, f2)
+        return self.caches["IsEquivalent"].get_or_compute((str(f1), str(f2)), lambda: spot.are_equivalent(f1, f2))
         
     def RndLTL(self, numAP, rndSeed):
         f = spot.randltl(numAP, output='ltl', seed=rndSeed).relabel(spot.Abc).simplify()
@@ -81,43 +120,103 @@ class SpotOnDockerHandler:
     def ToLatexString(self, formula):
         return spot.formula(formula).to_str("sclatex")
 
-    def Translate(self, formula):
-        aut = spot.translate(formula, "BA", "High", "SBAcc", "Complete")
-        bdict = aut.get_dict()
-
-        autGraph = SpotOnDocker.TGraph()
-        print(type(aut.get_acceptance()))
-        autGraph.acceptance = str(aut.get_acceptance())
-        autGraph.numAccSets = int(aut.num_sets())
-        autGraph.numStates = int(aut.num_states())
-        autGraph.initStates = [int(aut.get_init_state_number())]
-        autGraph.apNames = [str(ap) for ap in aut.ap()]
-        autGraph.formula = str(aut.get_name())
-        autGraph.isDeterministic = bool(aut.prop_universal() and aut.is_existential())
-        autGraph.isTerminal = bool(aut.prop_terminal())
-        autGraph.hasStateBasedAcc = bool(aut.prop_state_acc())
-        
-        states = []
-        edges = []
-        for src in range(0, aut.num_states()):
-            n = SpotOnDocker.TNode()
-            n.id = int(src)
-
-            for edge in aut.out(src):
-                e = SpotOnDocker.TEdge()
-                e.srcId = int(edge.src)
-                e.dstId = int(edge.dst)
-                e.label = str(spot.bdd_format_formula(bdict, edge.cond))
-                n.isAcc = not (edge.acc is None)
-                
-                edges.append(e)
-            
-            states.append(n)
-        
-        autGraph.nodes = states
-        autGraph.edges = edges
+    def Translate(self, formula, options=None):
+        f = spot.formula(formula)
+        args = self._translate_args(options)
+        return self.caches["Translate"].get_or_compute((str(f), args), lambda: self._translate(f, args))
+
+    def TranslateCompact(self, formula, options=None):
+        return compact_graph(self.Translate(formula, options))
+
+    def TranslateOpen(self, formula, options=None):
+        aut = self._translate_aut(spot.formula(formula), self._translate_args(options))
+        self._expire_cursors()
+        cursor = next(self._cursor_ids)
+        self.cursors[cursor] = EdgePager(iter_edges(aut))
+        return SpotOnDocker.TTranslateCursor(cursor=cursor, header=to_header(aut), numEdges=int(aut.num_edges()))
+
+    def TranslateNext(self, cursor, maxEdges):
+        pager = self.cursors.get(cursor)
+        if pager is None:
+            raise KeyError(f"Unknown or expired cursor {cursor}.")
+
+        page = pager.next_page(maxEdges)
+        if page.last:
+            del self.cursors[cursor]
+        return page
+
+    def TranslateClose(self, cursor):
+        self.cursors.pop(cursor, None)
 
-        return autGraph
+    def _expire_cursors(self):
+        now = time.monotonic()
+        for cursor, pager in list(self.cursors.items()):
+            if now - pager.last_used > self.CURSOR_TIMEOUT:
+                del self.cursors[cursor]
+        while len(self.cursors) >= self.MAX_CURSORS:
+            del self.cursors[min(self.cursors, key=lambda c: self.cursors[c].last_used)]
+
+    @staticmethod
+    def _translate_args(options):
+        """ Options of `spot.translate` for `TTranslateOptions` (the defaults, if `options` is None). """
+        return translate_args(SpotOnDocker.TTranslateOptions() if options is None else options)
+
+    def _translate_aut(self, formula, args):
+        return self.translators.translate(formula, *args)
+
+    def _translate(self, formula, args):
+        return to_graph(self._translate_aut(formula, args))
+
+    def MpClassBatch(self, formulas):
+        return self._batch(SpotOnDocker.TStringResult, self.MpClass, [(f, ) for f in formulas])
+
+    def ContainsBatch(self, pairs):
+        return self._batch(SpotOnDocker.TBoolResult, self.Contains, [(p.formula1, p.formula2) for p in pairs])
+
+    def IsEquivalentBatch(self, pairs):
+        return self._batch(SpotOnDocker.TBoolResult, self.IsEquivalent, [(p.formula1, p.formula2) for p in pairs])
+
+    def GetAPBatch(self, formulas):
+        return self._batch(SpotOnDocker.TStringListResult, self.GetAP, [(f, ) for f in formulas])
+
+    def ToLatexStringBatch(self, formulas):
+        return self._batch(SpotOnDocker.TStringResult, self.ToLatexString, [(f, ) for f in formulas])
+
+    def TranslateBatch(self, formulas, options=None):
+        return self._batch(SpotOnDocker.TGraphResult, self.Translate, [(f, options) for f in formulas])
+
+    def TranslateCompactBatch(self, formulas, options=None):
+        return self._batch(SpotOnDocker.TCompactGraphResult, self.TranslateCompact, [(f, options) for f in formulas])
+
+    def Version(self):
+        return f"spotondocker-server/{SERVER_VERSION} spot/{spot.version()}"
+
+    def GetCacheStats(self):
+        return [
+            SpotOnDocker.TCacheStats(
+                operation=op, 
+                hits=cache.hits, 
+                misses=cache.misses, 
+                evictions=cache.evictions, 
+                size=len(cache), 
+                sizeBytes=cache.nbytes
+            )
+            for op, cache in self.caches.items()
+        ]
+
+    @staticmethod
+    def _batch(result_type, func, args):
+        """ 
+        Applies `func` to every argument tuple. A failing item is reported in its result's `error` 
+        field instead of failing the whole batch. 
+        """
+        results = []
+        for a in args:
+            try:
+                results.append(result_type(value=func(*a)))
+            except Exception as err:
+                results.append(result_type(error=f"{type(err).__name__}: {err}"))
+        return results
 
 
 if __name__ == '__main__':
@@ -125,15 +224,60 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("ip", type=str, nargs='?', default="*", help="IP address to connect to.")
     parser.add_argument("port", type=str, nargs='?', default="7159", help="Port to connect to.")
+    parser.add_argument("--workers", type=int, default=1, 
+                        help="Number of pre-forked worker processes sharing the listening socket (0: one per CPU core).")
+    parser.add_argument("--nonblocking", action="store_true", 
+                        help="Serve all connections from a non-blocking I/O loop which dispatches calls to the "
+                             "--workers worker processes. Needs --transport framed.")
+    parser.add_argument("--cache-size", type=int, default=4096, 
+                        help="Maximum number of cached results per operation (0: disable caching).")
+    parser.add_argument("--cache-mb", type=float, default=64, 
+                        help="Approximate memory limit of the result cache of each operation, in MiB.")
+    parser.add_argument("--unix-socket", type=str, default=None, 
+                        help="Listen on a Unix domain socket at this path instead of ip:port.")
+    parser.add_argument("--idle-timeout", type=float, default=0, 
+                        help="Exit after this many seconds without connected clients (0: never).")
+    parser.add_argument("--recycle-translators", type=int, default=1000, 
+                        help="Replace the spot translators and BDD dictionary after this many translations (0: never).")
+    parser.add_argument("--protocol", choices=wire.PROTOCOLS, default=wire.DEFAULT_PROTOCOL, 
+                        help="Thrift protocol. Clients must use the same one.")
+    parser.add_argument("--transport", choices=wire.TRANSPORTS, default=wire.DEFAULT_TRANSPORT, 
+                        help="Thrift transport. Clients must use the same one.")
     args = parser.parse_args()
+    if args.nonblocking and args.transport != "framed":
+        parser.error("--nonblocking needs --transport framed")
 
     # initialize server
-    handler = SpotOnDockerHandler()
+    handler = SpotOnDockerHandler(cache_size=args.cache_size, cache_bytes=int(args.cache_mb * 2 ** 20), 
+                                  recycle_translators=args.recycle_translators)
     processor = SpotOnDocker.Processor(handler)
-    transport = TSocket.TServerSocket(host=args.ip, port=args.port)
-    tfactory = TTransport.TBufferedTransportFactory()
-    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
-    server = TServer.TSimpleServer(processor, transport, tfactory, pfactory)
+    if args.unix_socket is None:
+        transport = TSocket.TServerSocket(host=args.ip, port=args.port)
+    else:
+        # The server runs as root in the container. Let any user on the host connect to the socket.
+        os.umask(0)
+        transport = TSocket.TServerSocket(unix_socket=args.unix_socket)
+    tfactory = wire.transport_factory(args.transport)
+    pfactory = wire.protocol_factory(args.protocol)
+    watchdog = None
+    if args.idle_timeout > 0:
+        watchdog = IdleWatchdog(args.idle_timeout)
+        processor = watchdog.wrap_processor(processor)
+        tfactory = watchdog.wrap_transport_factory(tfactory)
+
+    # As PID 1 of the container, the server ignores SIGTERM unless it handles it. 
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    if args.nonblocking:
+        # Framing is done by the server itself, without a transport factory.
+        server = TNonblockingPoolServer(processor, transport, pfactory, numWorkers=args.workers)
+        if watchdog is not None:
+            watchdog.count_connections = lambda: len(server.clients)
+    elif args.workers == 1:
+        server = TServer.TSimpleServer(processor, transport, tfactory, pfactory)
+    else:
+        server = TPreforkServer(processor, transport, tfactory, pfactory, numWorkers=args.workers)
+    if watchdog is not None:
+        watchdog.start()
     try:
         server.serve()
     except KeyboardInterrupt:
@@ -0,0 +1,316 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: servers.py
+Description:
+    The file defines Thrift server classes used by `server.py` in addition to those shipped with
+    Apache Thrift. The classes do not depend on spot, so that they can be exercised with stub handlers.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from thrift.server.TNonblockingServer import TNonblockingServer
+from thrift.server.TProcessPoolServer import TProcessPoolServer
+from thrift.transport import TTransport
+
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TPreforkServer(TProcessPoolServer):
+    """
+    Pre-fork server.
+
+    The listening socket is bound once in the parent process. Then, `numWorkers` worker processes
+    are forked, each running an accept loop on the shared socket. Every worker serves one connection
+    at a time, so up to `numWorkers` clients are served in parallel, each on its own core.
+
+    Unlike `TProcessPoolServer`, workers that die (e.g. a crash inside spot) are replaced.
+    """
+    def __init__(self, *args, numWorkers=None):
+        TProcessPoolServer.__init__(self, *args)
+        self.numWorkers = os.cpu_count() if not numWorkers else numWorkers
+        self._context = multiprocessing.get_context("fork")
+
+    def serve(self):
+        self.isRunning.value = True
+
+        # `docker stop` sends SIGTERM. Make sure that the workers go down with the server.
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+
+        # Bind and listen once. The workers inherit the socket.
+        self.serverTransport.listen()
+        for _ in range(self.numWorkers):
+            self._spawn_worker()
+
+        try:
+            while self.isRunning.value:
+                multiprocessing.connection.wait([w.sentinel for w in self.workers], timeout=1.0)
+                self._replace_dead_workers()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        self.isRunning.value = False
+        for w in self.workers:
+            w.terminate()
+        for w in self.workers:
+            w.join()
+        self.workers = []
+        self.serverTransport.close()
+
+    def _on_sigterm(self, signum, frame):
+        raise SystemExit(0)
+
+    def _worker_main(self):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        self.workerProcess()
+
+    def _spawn_worker(self):
+        w = self._context.Process(target=self._worker_main, daemon=True)
+        w.start()
+        self.workers.append(w)
+        return w
+
+    def _replace_dead_workers(self):
+        for w in list(self.workers):
+            if w.is_alive() or not self.isRunning.value:
+                continue
+            w.join()
+            logger.warning("Worker %s exited with code %s. Starting a new worker.", w.pid, w.exitcode)
+            self.workers.remove(w)
+            self._spawn_worker()
+
+
+class TNonblockingPoolServer(TNonblockingServer):
+    """
+    Non-blocking server with a pool of worker processes.
+
+    One I/O loop (`TNonblockingServer`) accepts any number of connections and reads and writes their 
+    messages, so it never waits for a call to be computed. Each complete request is queued and 
+    processed by the first free one of `numWorkers` worker processes. A long call thus occupies one 
+    worker, while connections and the calls of other clients are still served by the others. Calls 
+    of the same connection are processed one after the other. Clients must use the framed transport.
+
+    Calls run in processes rather than threads, because spot does not release the GIL. As for 
+    `TPreforkServer`, workers that die are replaced; the connection whose call was lost is closed.
+    """
+    def __init__(self, processor, lsocket, inputProtocolFactory=None, outputProtocolFactory=None, numWorkers=None):
+        TNonblockingServer.__init__(self, processor, lsocket, inputProtocolFactory, outputProtocolFactory, 
+                                    threads=os.cpu_count() if not numWorkers else numWorkers)
+        self._context = multiprocessing.get_context("fork")
+        self.workers = []
+
+    def prepare(self):
+        if self.prepared:
+            return
+        self.socket.listen()
+        for _ in range(self.threads):
+            worker = _ProcessWorker(self)
+            worker.start()
+            self.workers.append(worker)
+        self.prepared = True
+
+    def close(self):
+        TNonblockingServer.close(self)
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+
+class _ProcessWorker(threading.Thread):
+    """ 
+    Thread of `TNonblockingPoolServer` which takes requests from the queue of the server and forwards 
+    them to its worker process through a pipe. 
+    """
+    def __init__(self, server):
+        threading.Thread.__init__(self, name="TNonblockingPoolServer worker", daemon=True)
+        self.server = server
+        self.process = None
+        self.conn = None
+        self._spawn()
+
+    def _spawn(self):
+        self.conn, child_conn = self.server._context.Pipe()
+        self.process = self.server._context.Process(target=self._process_main, args=(child_conn, ), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def _process_main(self, conn):
+        # The server process decides when its workers exit: they stop once the pipe is closed.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        server = self.server
+        # Close the inherited sockets and the pipes of the other workers, which belong to the server process.
+        server.socket.close()
+        server._read.close()
+        server._write.close()
+        for worker in server.workers:
+            worker.conn.close()
+        while True:
+            try:
+                request = conn.recv_bytes()
+            except (EOFError, OSError):
+                return
+            otrans = TTransport.TMemoryBuffer()
+            try:
+                server.processor.process(server.in_protocol.getProtocol(TTransport.TMemoryBuffer(request)), 
+                                         server.out_protocol.getProtocol(otrans))
+            except Exception:
+                logger.exception("Exception while processing request")
+                conn.send((False, b""))
+            else:
+                conn.send((True, otrans.getvalue()))
+
+    def run(self):
+        while True:
+            processor, iprot, oprot, otrans, callback = self.server.tasks.get()
+            if processor is None:
+                break
+            # The input transport is a memory buffer positioned at the start of the request.
+            request = iprot.trans.read(self.server.max_frame_size)
+            try:
+                self.conn.send_bytes(request)
+                ok, reply = self.conn.recv()
+            except (EOFError, OSError):
+                self.process.join()
+                logger.warning("Worker %s exited with code %s. Starting a new worker.", 
+                               self.process.pid, self.process.exitcode)
+                self._spawn()
+                ok, reply = False, b""
+            callback(ok, reply)
+        self.conn.close()
+        self.process.join()
+
+
+class IdleWatchdog:
+    """
+    Stops the server process (by sending it SIGTERM) once no client has been connected and no call 
+    has been processed for `timeout` seconds. Used for containers that outlive their clients.
+
+    The watchdog sees connections through the wrapped transport factory and calls through the wrapped 
+    processor. Its state lives in shared memory, so that it also sees the connections served by 
+    `TPreforkServer` workers, provided the wrapping is done before the workers are forked. 
+
+    Usage:
+        watchdog = IdleWatchdog(timeout)
+        processor = watchdog.wrap_processor(processor)
+        tfactory = watchdog.wrap_transport_factory(tfactory)
+        watchdog.start()
+
+    Servers which do not use a transport factory (`TNonblockingPoolServer`) report their connections 
+    through `count_connections`, a function returning the number of open connections.
+    """
+    def __init__(self, timeout, count_connections=None):
+        self.timeout = timeout
+        self.count_connections = count_connections
+        self._last_active = multiprocessing.Value('d', time.monotonic())
+        # Number of open transports. Every connection opens an input and an output transport.
+        self._num_transports = multiprocessing.Value('i', 0)
+
+    def start(self):
+        threading.Thread(target=self._run, name="IdleWatchdog", daemon=True).start()
+
+    def is_idle(self):
+        with self._num_transports.get_lock():
+            if self._num_transports.value > 0:
+                return False
+        if self.count_connections is not None and self.count_connections() > 0:
+            return False
+        return time.monotonic() - self._last_active.value >= self.timeout
+
+    def touch(self):
+        self._last_active.value = time.monotonic()
+
+    def wrap_processor(self, processor):
+        return _WatchedProcessor(processor, self)
+
+    def wrap_transport_factory(self, factory):
+        return _WatchedTransportFactory(factory, self)
+
+    def _run(self):
+        interval = min(1.0, self.timeout / 4)
+        while not self.is_idle():
+            time.sleep(interval)
+        logger.info("No activity for %s seconds. Stopping the server.", self.timeout)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    def _opened(self):
+        with self._num_transports.get_lock():
+            self._num_transports.value += 1
+        self.touch()
+
+    def _closed(self):
+        with self._num_transports.get_lock():
+            self._num_transports.value -= 1
+        self.touch()
+
+
+class _WatchedProcessor:
+    def __init__(self, processor, watchdog):
+        self._processor = processor
+        self._watchdog = watchdog
+
+    def __getattr__(self, name):
+        return getattr(self._processor, name)
+
+    def process(self, iprot, oprot):
+        self._watchdog.touch()
+        return self._processor.process(iprot, oprot)
+
+
+class _WatchedTransportFactory:
+    def __init__(self, factory, watchdog):
+        self._factory = factory
+        self._watchdog = watchdog
+
+    def getTransport(self, client):
+        trans = self._factory.getTransport(client)
+        close, watchdog = trans.close, self._watchdog
+
+        def watched_close():
+            try:
+                close()
+            finally:
+                watchdog._closed()
+
+        trans.close = watched_close
+        watchdog._opened()
+        return trans
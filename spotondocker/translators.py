@@ -0,0 +1,99 @@
+# Copyright (c) 2020-2021, Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: translators.py
+Description:
+    The file defines `TranslatorPool` class which is used by `SpotOnDockerHandler` to keep
+    long-lived `spot.translator` objects instead of configuring a new one on every `translate` call,
+    and `translate_args` function which converts `TTranslateOptions` into options of `spot.translate`.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+import spot
+
+
+# Optimization levels accepted in `TTranslateOptions.level`.
+LEVELS = ("Low", "Medium", "High")
+
+
+def translate_args(options):
+    """ Converts `TTranslateOptions` into a tuple of options of `spot.translate`. """
+    if options.level not in LEVELS:
+        raise ValueError(f"level must be one of {LEVELS}, not {options.level!r}")
+    args = [options.outputType, options.level, "Deterministic" if options.deterministic else "Small"]
+    if options.stateBasedAcc:
+        args.append("SBAcc")
+    if options.complete:
+        args.append("Complete")
+    return tuple(args)
+
+class TranslatorPool:
+    """
+    One `spot.translator` per option set (e.g. `("BA", "High", "SBAcc", "Complete")`, as accepted
+    by `spot.translate`), all sharing one BDD dictionary. Translators keep the formula simplifier
+    and its caches between calls, so repeated small formulas are translated much faster.
+
+    The BDD dictionary and the simplifier caches only grow. After `recycle_after` translations,
+    the dictionary and all translators are replaced by fresh ones (`recycle_after=0`: never).
+    Automata translated earlier stay valid, as they hold a reference to their own dictionary.
+    """
+    def __init__(self, recycle_after=1000):
+        self.recycle_after = recycle_after
+        self.recycles = 0
+        self._reset()
+
+    def _reset(self):
+        self.bdd_dict = spot.make_bdd_dict()
+        self.translators = dict()
+        self.count = 0
+
+    def recycle(self):
+        """ Replaces the BDD dictionary and all translators. """
+        self._reset()
+        self.recycles += 1
+
+    def get(self, options):
+        """ Returns the translator for the option tuple `options`, creating it if needed. """
+        translator = self.translators.get(options)
+        if translator is None:
+            translator = spot.translator(self.bdd_dict)
+            # Same interpretation of the options as `spot.translate`.
+            spot._postproc_translate_options(translator, spot.postprocessor.TGBA, *options)
+            self.translators[options] = translator
+        return translator
+
+    def translate(self, formula, *options):
+        """ Equivalent to `spot.translate(formula, *options)`. """
+        if self.recycle_after and self.count >= self.recycle_after:
+            self.recycle()
+        self.count += 1
+        return self.get(options).run(formula)
@@ -0,0 +1,75 @@
+"""
+Project: spotondocker
+URL: https://github.com/abhibp1993/spotondocker
+File: wire.py
+Description:
+    The file defines the Thrift protocols and transports which SpotOnDocker servers and clients can
+    be configured with. Both ends of a connection must use the same protocol and transport.
+
+Author: Abhishek N. Kulkarni <abhi.bp1993@gmail.com>
+"""
+
+from thrift.transport import TTransport
+
+
+# Supported protocols:
+#   - "binary": pure-Python binary protocol.
+#   - "accelerated": binary protocol, encoded and decoded by Thrift's C extension (if installed).
+#     Same bytes on the wire as "binary", so either end may use either one.
+#   - "compact": compact protocol (variable-length integers), also C-accelerated if possible.
+PROTOCOLS = ("binary", "accelerated", "compact")
+
+# Supported transports: "buffered" (plain stream) or "framed" (every message is preceded by its length).
+TRANSPORTS = ("buffered", "framed")
+
+DEFAULT_PROTOCOL = "accelerated"
+DEFAULT_TRANSPORT = "buffered"
+
+
+def check(protocol, transport):
+    """ Raises `ValueError` unless `protocol` and `transport` are supported. """
+    if protocol not in PROTOCOLS:
+        raise ValueError(f"protocol must be one of {PROTOCOLS}, not {protocol!r}")
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {TRANSPORTS}, not {transport!r}")
+
+
+def protocol_factory(protocol):
+    # Imported here, as they are slow to import and clients only need them to connect.
+    from thrift.protocol import TBinaryProtocol
+    from thrift.protocol import TCompactProtocol
+
+    check(protocol, DEFAULT_TRANSPORT)
+    if protocol == "binary":
+        return TBinaryProtocol.TBinaryProtocolFactory()
+    if protocol == "accelerated":
+        return TBinaryProtocol.TBinaryProtocolAcceleratedFactory()
+    return TCompactProtocol.TCompactProtocolAcceleratedFactory()
+
+
+def transport_factory(transport):
+    check(DEFAULT_PROTOCOL, transport)
+    if transport == "buffered":
+        return TTransport.TBufferedTransportFactory()
+    return TTransport.TFramedTransportFactory()
+
+
+def server_args(protocol, transport):
+    """ Command line arguments of `server.py` selecting `protocol` and `transport` (none for the defaults). """
+    args = []
+    if protocol != DEFAULT_PROTOCOL:
+        args += ["--protocol", protocol]
+    if transport != DEFAULT_TRANSPORT:
+        args += ["--transport", transport]
+    return args
+
+
+def parse_server_args(args):
+    """ Returns the `(protocol, transport)` selected by the command line arguments `args` of `server.py`. """
+    args = list(args)
+    options = {"--protocol": DEFAULT_PROTOCOL, "--transport": DEFAULT_TRANSPORT}
+    for i, arg in enumerate(args):
+        name, _, value = arg.partition("=")
+        if name in options:
+            options[name] = value if value else args[i + 1]
+    return options["--protocol"], options["--transport"]
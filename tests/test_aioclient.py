@@ -0,0 +1,107 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+import asyncio
+import contextlib
+import socket
+import threading
+
+from thrift.Thrift import TApplicationException
+from thrift.server import TServer
+from thrift.transport import TSocket
+from spotondocker import wire
+from spotondocker.aioclient import AsyncSpotOnDockerClient
+from spotondocker.client import SpotOnDockerError
+from spotondocker.compact import compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+class EchoHandler:
+    def Ping(self):
+        pass
+
+    def MpClass(self, formula):
+        if formula == "bad":
+            raise ValueError(formula)
+        return f"class of {formula}"
+
+    def GetAPBatch(self, formulas):
+        return [SpotOnDocker.TStringListResult(value=[f]) if f != "bad" else SpotOnDocker.TStringListResult(error="bad")
+                for f in formulas]
+
+    def Translate(self, formula, options=None):
+        return SpotOnDocker.TGraph(
+            acceptance="Inf(0)", numAccSets=1, numStates=1, initStates=[0], apNames=["a"], formula=formula,
+            isDeterministic=True, hasStateBasedAcc=True, isTerminal=False,
+            nodes=[SpotOnDocker.TNode(id=0, isAcc=True)],
+            edges=[SpotOnDocker.TEdge(srcId=0, dstId=0, label="a" * 100000)]
+        )
+
+    def TranslateCompact(self, formula, options=None):
+        return compact_graph(self.Translate(formula))
+
+
+@pytest.fixture(params=[(p, t) for p in wire.PROTOCOLS for t in wire.TRANSPORTS], ids="-".join)
+def server(request):
+    # TSimpleServer serves a single connection at a time, so every test below also checks
+    # that the async client uses only one connection.
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(('', 0))
+        port = s.getsockname()[1]
+
+    protocol, transport_name = request.param
+    transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+    server = TServer.TSimpleServer(
+        SpotOnDocker.Processor(EchoHandler()),
+        transport,
+        wire.transport_factory(transport_name),
+        wire.protocol_factory(protocol)
+    )
+    # Listen before the server thread starts, so that the client can connect right away.
+    transport.listen()
+    transport.listen = lambda: None
+    threading.Thread(target=serve, args=(server,), daemon=True).start()
+    yield dict(host="127.0.0.1", port=port, protocol=protocol, transport=transport_name)
+    transport.close()
+
+
+def serve(server):
+    # Closing the server socket at the end of a test makes the next accept() fail.
+    with contextlib.suppress(AttributeError, OSError):
+        server.serve()
+
+
+def test_pipelined_calls_get_their_own_replies(server):
+    async def run():
+        async with AsyncSpotOnDockerClient(**server) as client:
+            formulas = [f"F(a{i})" for i in range(300)]
+            return formulas, await asyncio.gather(*(client.mp_class(f) for f in formulas))
+
+    formulas, classes = asyncio.run(run())
+    assert classes == [f"class of {f}" for f in formulas]
+
+
+def test_errors_and_large_replies(server):
+    async def run():
+        async with AsyncSpotOnDockerClient(**server) as client:
+            client.batch_chunk_size = 2
+            results = await asyncio.gather(
+                client.translate("Ga"),
+                client.mp_class("bad"),
+                client.get_ap_batch(["a", "bad", "b"]),
+                client.ping(),
+                return_exceptions=True
+            )
+            # The connection is still usable after a failed call.
+            results.append(await client.mp_class("Fa"))
+            return results
+
+    aut, err, aps, pong, cls = asyncio.run(run())
+    assert aut.graph["formula"] == "Ga"
+    assert len(aut.edges[0, 0, 0]["label"]) == 100000
+    assert isinstance(err, TApplicationException)
+    assert aps[0] == ["a"] and isinstance(aps[1], SpotOnDockerError) and aps[2] == ["b"]
+    assert pong is None
+    assert cls == "class of Fa"
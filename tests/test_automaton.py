@@ -0,0 +1,62 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pickle
+import pytest
+from spotondocker.automaton import Automaton
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.compact import compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+def make_compact(shuffle=False):
+    labels = ["a & b", "!a", "1"]
+    edges = [SpotOnDocker.TEdge(srcId=i, dstId=(i * 7 + j) % 5, label=labels[(i + j) % 3]) for i in range(5) for j in range(3)]
+    if shuffle:
+        edges = edges[1::2] + edges[0::2]
+    return compact_graph(SpotOnDocker.TGraph(
+        acceptance="Inf(0)", numAccSets=1, numStates=6, initStates=[2], apNames=["a", "b"], formula="GFa",
+        isDeterministic=False, hasStateBasedAcc=True, isTerminal=False,
+        nodes=[SpotOnDocker.TNode(id=i, isAcc=(i % 2 == 0)) for i in range(6)],
+        edges=edges
+    ))
+
+
+def test_automaton_from_compact():
+    aut = Automaton.from_compact(make_compact())
+    assert aut.num_edges == 15
+    assert list(aut.offsets) == [0, 3, 6, 9, 12, 15, 15]
+    assert aut.out(1) == [(2, "!a"), (3, "1"), (4, "a & b")]
+    assert aut.out(5) == []
+    assert aut.accepting_states() == [0, 2, 4]
+    assert aut.is_accepting(4) and not aut.is_accepting(5)
+    assert aut.initStates == (2, ) and aut.formula == "GFa"
+
+    with pytest.raises(AttributeError):
+        aut.extra = 1
+
+
+def test_unsorted_edges_are_grouped_by_source():
+    aut = Automaton.from_compact(make_compact(shuffle=True))
+    assert list(aut.offsets) == [0, 3, 6, 9, 12, 15, 15]
+    assert sorted(aut.edges()) == sorted(Automaton.from_compact(make_compact()).edges())
+    assert aut.out(1) == [(2, "!a"), (4, "a & b"), (3, "1")]    # stable within a state
+
+
+def test_to_networkx_matches_translate_graph():
+    compact = make_compact()
+    expected = SpotOnDockerClient._compact_to_networkx(compact)
+    actual = Automaton.from_compact(compact).to_networkx()
+    assert actual.graph == expected.graph
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges(keys=True, data=True)) == list(expected.edges(keys=True, data=True))
+
+
+def test_labels_are_shared_and_pickle_roundtrip():
+    aut1 = Automaton.from_compact(make_compact())
+    aut2 = Automaton.from_compact(make_compact())
+    assert aut1.labels[0] is aut2.labels[0]
+
+    copy = pickle.loads(pickle.dumps(aut1))
+    assert list(copy.edges()) == list(aut1.edges())
@@ -0,0 +1,49 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+
+from thrift.Thrift import TApplicationException
+from spotondocker.backends import InProcessConnection, resolve_backend, spot_available
+from spotondocker.pool import ConnectionPool
+
+
+class EchoHandler:
+    def __init__(self):
+        self.calls = 0
+
+    def Ping(self):
+        pass
+
+    def MpClass(self, formula):
+        self.calls += 1
+        if formula == "bad":
+            raise SyntaxError("bad formula")
+        return f"class of {formula}"
+
+
+def test_in_process_connection_calls_handler():
+    handler = EchoHandler()
+    conn = InProcessConnection(handler)
+    pool = ConnectionPool(lambda: (conn, conn), size=2)
+
+    with pool.connection() as client:
+        assert client.MpClass("Fa") == "class of Fa"
+
+    with pytest.raises(TApplicationException) as info:
+        with pool.connection() as client:
+            client.MpClass("bad")
+    assert "SyntaxError: bad formula" in str(info.value)
+    assert isinstance(info.value.__cause__, SyntaxError)
+
+    # The connection is kept after a handler error, as for a remote server.
+    assert len(pool) == 1
+    assert handler.calls == 2
+
+
+def test_resolve_backend():
+    assert resolve_backend("docker") == "docker"
+    assert resolve_backend("auto") == ("inprocess" if spot_available() else "docker")
+    with pytest.raises(ValueError):
+        resolve_backend("ssh")
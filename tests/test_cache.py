@@ -0,0 +1,89 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+from spotondocker.cache import LRUCache, PersistentCache, approx_sizeof
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+def test_lru_eviction_by_count():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1          # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_lru_eviction_by_bytes():
+    cache = LRUCache(maxsize=100, maxbytes=1000, sizeof=lambda obj: 10 if isinstance(obj, str) else obj)
+    cache.put("a", 400)
+    cache.put("b", 400)
+    cache.put("c", 400)
+
+    assert "a" not in cache
+    assert cache.nbytes == 820
+    # Values larger than the limit are not cached at all.
+    cache.put("d", 5000)
+    assert "d" not in cache and len(cache) == 2
+
+
+def test_counters_and_get_or_compute():
+    cache = LRUCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "recurrence"
+
+    assert cache.get_or_compute("G(a -> Fb)", compute) == "recurrence"
+    assert cache.get_or_compute("G(a -> Fb)", compute) == "recurrence"
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disabled_cache():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_approx_sizeof_grows_with_graph():
+    small = SpotOnDocker.TGraph(nodes=[SpotOnDocker.TNode(id=0, isAcc=True)], edges=[])
+    large = SpotOnDocker.TGraph(
+        nodes=[SpotOnDocker.TNode(id=i, isAcc=True) for i in range(100)],
+        edges=[SpotOnDocker.TEdge(srcId=i, dstId=i, label="a & b") for i in range(100)]
+    )
+    assert approx_sizeof(large) > 50 * approx_sizeof(small.nodes[0])
+    assert approx_sizeof(large) > approx_sizeof(small)
+
+
+def test_persistent_cache_roundtrip(tmp_path):
+    path = str(tmp_path / "cache" / "results.sqlite")
+    cache = PersistentCache(path)
+    cache.put("k1", b"recurrence")
+    assert cache.get("k1") == b"recurrence"
+    assert cache.get("k2") is None
+    cache.close()
+
+    # Another process (here: another instance) sees the stored results.
+    cache = PersistentCache(path)
+    assert cache.get("k1") == b"recurrence"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_persistent_cache_eviction(tmp_path):
+    cache = PersistentCache(str(tmp_path / "results.sqlite"), maxsize=100, maxbytes=10000)
+    for i in range(200):
+        cache.put(f"k{i}", b"x" * 10)
+
+    assert len(cache) <= 100
+    assert cache.evictions > 0
+    assert cache.get("k199") is not None
+    assert cache.get("k1") is None
@@ -0,0 +1,157 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+import threading
+import time
+
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.compact import EdgePager, compact_graph
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+class PingHandler:
+    def Ping(self):
+        pass
+
+
+def make_graph():
+    labels = ["a", "!a", "a & b", "1"]
+    return SpotOnDocker.TGraph(
+        acceptance="Inf(0)", numAccSets=1, numStates=20, initStates=[0], apNames=["a", "b"], formula="GFa",
+        isDeterministic=False, hasStateBasedAcc=True, isTerminal=False,
+        nodes=[SpotOnDocker.TNode(id=i, isAcc=(i % 3 == 0)) for i in range(20)],
+        edges=[SpotOnDocker.TEdge(srcId=i, dstId=(i + j) % 20, label=labels[(i * j) % 4]) for i in range(20) for j in range(5)]
+    )
+
+
+class PagingHandler(PingHandler):
+    def __init__(self):
+        self.graph = make_graph()
+        self.cursors = dict()
+        self.options = []
+
+    def TranslateCompact(self, formula, options=None):
+        self.options.append(options)
+        return compact_graph(self.graph)
+
+    def TranslateOpen(self, formula, options=None):
+        header = compact_graph(self.graph)
+        header.labels, header.edgeSrc, header.edgeDst, header.edgeLabel = [], [], [], []
+        self.cursors[1] = EdgePager((e.srcId, e.dstId, e.label) for e in self.graph.edges)
+        return SpotOnDocker.TTranslateCursor(cursor=1, header=header, numEdges=len(self.graph.edges))
+
+    def TranslateNext(self, cursor, maxEdges):
+        page = self.cursors[cursor].next_page(maxEdges)
+        if page.last:
+            del self.cursors[cursor]
+        return page
+
+    def TranslateClose(self, cursor):
+        self.cursors.pop(cursor, None)
+
+
+def start_server_later(delay, handler=None, **address):
+    def run():
+        time.sleep(delay)
+        transport = TSocket.TServerSocket(**address)
+        server = TServer.TSimpleServer(
+            SpotOnDocker.Processor(PingHandler() if handler is None else handler),
+            transport,
+            TTransport.TBufferedTransportFactory(),
+            TBinaryProtocol.TBinaryProtocolFactory()
+        )
+        server.serve()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def test_readiness_probe_waits_for_server():
+    port = SpotOnDockerClient._find_free_port()
+    start_server_later(0.3, host="127.0.0.1", port=port)
+
+    spot = SpotOnDockerClient(host="127.0.0.1", port=port, client_wait_time=5000)
+    assert 0.3 <= spot.startup_latency < 2.0
+    assert len(spot.pool) == 1
+    spot.ping()
+
+
+def test_readiness_probe_deadline():
+    port = SpotOnDockerClient._find_free_port()
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        SpotOnDockerClient(host="127.0.0.1", port=port, client_wait_time=200)
+    assert time.monotonic() - start < 1.0
+
+
+def test_connect_by_host_does_not_own_a_container():
+    port = SpotOnDockerClient._find_free_port()
+    start_server_later(0, host="127.0.0.1", port=port)
+
+    spot = SpotOnDockerClient(host="127.0.0.1", port=port)
+    assert spot.container is None and not spot.owns_container
+    spot.ping()
+    spot.close()
+
+    with pytest.raises(ValueError):
+        SpotOnDockerClient(host="127.0.0.1")
+
+
+def test_connect_by_unix_socket(tmp_path):
+    path = str(tmp_path / "server.sock")
+    start_server_later(0, unix_socket=path)
+
+    spot = SpotOnDockerClient(unix_socket=path)
+    assert spot.address == path
+    spot.ping()
+    spot.close()
+
+
+def test_translate_paged():
+    port = SpotOnDockerClient._find_free_port()
+    handler = PagingHandler()
+    start_server_later(0, handler, host="127.0.0.1", port=port)
+    spot = SpotOnDockerClient(host="127.0.0.1", port=port)
+
+    pages = [page for _, page in spot.iter_translate_pages("GFa", page_size=30)]
+    assert [len(page.edgeSrc) for page in pages] == [30, 30, 30, 10]
+    assert sum(len(page.labels) for page in pages) == 4
+
+    expected = spot.translate("GFa")
+    actual = spot.translate_paged("GFa", page_size=7)
+    assert actual.graph == expected.graph
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges(keys=True, data=True)) == list(expected.edges(keys=True, data=True))
+
+    aut = spot.translate_paged("GFa", page_size=7, return_type="automaton")
+    assert list(aut.edges()) == list(spot.translate("GFa", return_type="automaton").edges())
+
+    # Stopping early closes the cursor on the server.
+    pages = spot.iter_translate_pages("GFa", page_size=10)
+    next(pages)
+    pages.close()
+    spot.ping()
+    assert handler.cursors == {}
+
+
+def test_translate_options_are_sent_and_cached_per_option_set(tmp_path):
+    port = SpotOnDockerClient._find_free_port()
+    handler = PagingHandler()
+    start_server_later(0, handler, host="127.0.0.1", port=port)
+    spot = SpotOnDockerClient(host="127.0.0.1", port=port, cache_dir=str(tmp_path))
+
+    spot.translate("GFa")
+    spot.translate("GFa", options={"level": "Low"})
+    spot.translate("GFa", options=SpotOnDocker.TTranslateOptions(level="Low"))
+    spot.translate("GFa", options={"level": "Low", "deterministic": True})
+    assert handler.options == [
+        SpotOnDocker.TTranslateOptions(),
+        SpotOnDocker.TTranslateOptions(level="Low"),
+        SpotOnDocker.TTranslateOptions(level="Low", deterministic=True),
+    ]
+    spot.close()
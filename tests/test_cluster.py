@@ -0,0 +1,92 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+import multiprocessing
+import threading
+import time
+
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.cluster import SpotOnDockerCluster
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+class PidHandler:
+    def Ping(self):
+        pass
+
+    def MpClass(self, formula):
+        time.sleep(0.05)
+        return str(os.getpid())
+
+    def MpClassBatch(self, formulas):
+        return [SpotOnDocker.TStringResult(value=f"{os.getpid()}:{f}") for f in formulas]
+
+
+def run_server(port):
+    transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+    server = TServer.TSimpleServer(
+        SpotOnDocker.Processor(PidHandler()),
+        transport,
+        TTransport.TBufferedTransportFactory(),
+        TBinaryProtocol.TBinaryProtocolFactory()
+    )
+    server.serve()
+
+
+@pytest.fixture
+def servers():
+    ports = [SpotOnDockerClient._find_free_port() for _ in range(2)]
+    procs = [multiprocessing.get_context("fork").Process(target=run_server, args=(port, )) for port in ports]
+    for p in procs:
+        p.start()
+    yield ports, procs
+    for p in procs:
+        p.terminate()
+        p.join()
+
+
+def new_cluster(ports):
+    return SpotOnDockerCluster(clients=[SpotOnDockerClient(host="127.0.0.1", port=port) for port in ports])
+
+
+def test_calls_are_spread_over_replicas(servers):
+    ports, procs = servers
+    spot = new_cluster(ports)
+
+    pids = []
+    threads = [threading.Thread(target=lambda: pids.append(spot.mp_class("Fa"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(set(pids)) == sorted(str(p.pid) for p in procs)
+    assert all(r.outstanding == 0 for r in spot.replicas)
+
+    # Batches are split over the replicas, and the order of the results is kept.
+    results = spot.mp_class_batch([f"F a{i}" for i in range(10)])
+    assert [r.split(":")[1] for r in results] == [f"F a{i}" for i in range(10)]
+    assert len({r.split(":")[0] for r in results}) == 2
+    assert spot.mp_class_batch([]) == []
+
+
+def test_failover_when_replica_dies(servers):
+    ports, procs = servers
+    spot = new_cluster(ports)
+    spot.ping()
+
+    procs[0].terminate()
+    procs[0].join()
+
+    assert {spot.mp_class("Fa") for _ in range(4)} == {str(procs[1].pid)}
+    assert spot.num_alive == 1
+
+    procs[1].terminate()
+    procs[1].join()
+    with pytest.raises(TTransport.TTransportException):
+        spot.mp_class("Fa")
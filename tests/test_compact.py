@@ -0,0 +1,43 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from thrift import TSerialization
+from spotondocker.client import SpotOnDockerClient
+from spotondocker.compact import compact_graph, pack_bits, unpack_bits
+from spotondocker.genpy.spotondocker import SpotOnDocker
+
+
+def make_graph():
+    labels = ["a & b", "!a", "1"]
+    return SpotOnDocker.TGraph(
+        acceptance="Inf(0)", numAccSets=1, numStates=10, initStates=[3], apNames=["a", "b"], formula="GFa",
+        isDeterministic=False, hasStateBasedAcc=True, isTerminal=False,
+        nodes=[SpotOnDocker.TNode(id=i, isAcc=(i % 3 == 0)) for i in range(10)],
+        edges=[SpotOnDocker.TEdge(srcId=i, dstId=(i * 7 + j) % 10, label=labels[(i + j) % 3]) for i in range(10) for j in range(4)]
+    )
+
+
+def test_pack_bits_roundtrip():
+    flags = [True, False, False, True, True, False, True, False, True, True, False]
+    bits = pack_bits(flags)
+    assert len(bits) == 2
+    assert bits[0] == 0b01011001
+    assert unpack_bits(bits, len(flags)) == flags
+
+
+def test_compact_graph_decodes_to_same_networkx_graph():
+    graph = make_graph()
+    compact = compact_graph(graph)
+    assert len(compact.labels) == 3
+
+    expected = SpotOnDockerClient._to_networkx(graph)
+    actual = SpotOnDockerClient._compact_to_networkx(compact)
+    assert actual.graph == expected.graph
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges(keys=True, data=True)) == list(expected.edges(keys=True, data=True))
+
+
+def test_compact_graph_is_smaller_on_the_wire():
+    graph = make_graph()
+    assert len(TSerialization.serialize(compact_graph(graph))) < len(TSerialization.serialize(graph))
@@ -0,0 +1,28 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def loaded_modules(code):
+    """ Runs `code` in a fresh interpreter and returns the names of all modules imported by then. """
+    code += "\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, universal_newlines=True)
+    return set(output.split())
+
+
+def test_client_import_does_not_load_heavy_dependencies():
+    modules = loaded_modules("import spotondocker.client, spotondocker.aioclient, spotondocker.cluster")
+    assert not {"docker", "networkx", "sqlite3", "spot"} & modules
+
+
+def test_networkx_is_loaded_when_a_graph_is_built():
+    modules = loaded_modules(
+        "from spotondocker.client import SpotOnDockerClient\n"
+        "from spotondocker.genpy.spotondocker import SpotOnDocker\n"
+        "SpotOnDockerClient._to_networkx(SpotOnDocker.TGraph(nodes=[], edges=[]))"
+    )
+    assert "networkx" in modules and "docker" not in modules
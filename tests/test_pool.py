@@ -0,0 +1,124 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+import threading
+import time
+from thrift.transport import TTransport
+from spotondocker.pool import ConnectionPool
+
+
+class FakeTransport:
+    def __init__(self):
+        self.open = True
+
+    def isOpen(self):
+        return self.open
+
+    def close(self):
+        self.open = False
+
+
+class FakeClient:
+    def __init__(self, transport):
+        self.transport = transport
+        self.pings = 0
+
+    def Ping(self):
+        self.pings += 1
+        if not self.transport.open:
+            raise TTransport.TTransportException(TTransport.TTransportException.NOT_OPEN)
+
+
+def make_factory(created):
+    def factory():
+        transport = FakeTransport()
+        client = FakeClient(transport)
+        created.append(client)
+        return transport, client
+    return factory
+
+
+def test_reuse():
+    created = []
+    pool = ConnectionPool(make_factory(created), size=2)
+
+    with pool.connection() as c1:
+        pass
+    with pool.connection() as c2:
+        pass
+
+    assert c1 is c2
+    assert len(created) == 1
+
+
+def test_bounded_with_timeout():
+    created = []
+    pool = ConnectionPool(make_factory(created), size=2, timeout=0.05)
+
+    a = pool.acquire()
+    b = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    pool.release(a)
+    c = pool.acquire()
+    assert c is a
+    assert len(created) == 2
+
+
+def test_concurrent_checkout_is_exclusive():
+    created = []
+    pool = ConnectionPool(make_factory(created), size=3)
+    in_use = set()
+    lock = threading.Lock()
+    errors = []
+
+    def worker():
+        for _ in range(50):
+            with pool.connection() as client:
+                with lock:
+                    if client in in_use:
+                        errors.append(client)
+                    in_use.add(client)
+                time.sleep(0.0005)
+                with lock:
+                    in_use.discard(client)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(created) <= 3
+
+
+def test_broken_connection_is_discarded():
+    created = []
+    pool = ConnectionPool(make_factory(created), size=1)
+
+    with pytest.raises(TTransport.TTransportException):
+        with pool.connection() as client:
+            raise TTransport.TTransportException(TTransport.TTransportException.END_OF_FILE)
+
+    assert not client.transport.open
+    with pool.connection() as fresh:
+        assert fresh is not client
+
+
+def test_health_check_replaces_dead_connection():
+    created = []
+    pool = ConnectionPool(make_factory(created), size=1, health_check_interval=0)
+
+    with pool.connection() as client:
+        pass
+    client.transport.open = False
+
+    with pool.connection() as fresh:
+        assert fresh is not client
+    with pool.connection() as again:
+        assert again is fresh
+        assert fresh.pings == 1
@@ -0,0 +1,182 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import pytest
+import contextlib
+import multiprocessing
+import socket
+import threading
+import time
+
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from spotondocker.genpy.spotondocker import SpotOnDocker
+from spotondocker.servers import IdleWatchdog, TNonblockingPoolServer, TPreforkServer
+
+
+class SleepyHandler:
+    def Ping(self):
+        pass
+
+    def MpClass(self, formula):
+        time.sleep(0.3)
+        return str(os.getpid())
+
+    def Contains(self, formula1, formula2):
+        os._exit(1)
+
+
+def free_port():
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+def connect(port, deadline=10.0, framed=False):
+    start = time.monotonic()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+            break
+        except OSError:
+            if time.monotonic() - start > deadline:
+                raise
+            time.sleep(0.05)
+
+    transport = TSocket.TSocket("127.0.0.1", port)
+    transport = TTransport.TFramedTransport(transport) if framed else TTransport.TBufferedTransport(transport)
+    transport.open()
+    return transport, SpotOnDocker.Client(TBinaryProtocol.TBinaryProtocol(transport))
+
+
+@pytest.fixture
+def prefork_port():
+    def run(port):
+        processor = SpotOnDocker.Processor(SleepyHandler())
+        transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+        tfactory = TTransport.TBufferedTransportFactory()
+        pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+        TPreforkServer(processor, transport, tfactory, pfactory, numWorkers=2).serve()
+
+    port = free_port()
+    server = multiprocessing.get_context("fork").Process(target=run, args=(port, ))
+    server.start()
+    yield port
+    server.terminate()
+    server.join()
+
+
+def test_prefork_serves_connections_in_parallel(prefork_port):
+    connections = [connect(prefork_port) for _ in range(2)]
+    pids = []
+
+    def call(client):
+        pids.append(client.MpClass("Fa"))
+
+    threads = [threading.Thread(target=call, args=(client, )) for _, client in connections]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.55
+    assert len(set(pids)) == 2
+    for transport, _ in connections:
+        transport.close()
+
+
+def test_prefork_replaces_dead_worker(prefork_port):
+    transport, client = connect(prefork_port)
+    with pytest.raises(TTransport.TTransportException):
+        client.Contains("Fa", "Ga")
+    transport.close()
+
+    # Both workers must be available again: two parallel connections are served.
+    test_prefork_serves_connections_in_parallel(prefork_port)
+
+
+@pytest.fixture
+def nonblocking_port():
+    def run(port):
+        processor = SpotOnDocker.Processor(SleepyHandler())
+        transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+        TNonblockingPoolServer(processor, transport, TBinaryProtocol.TBinaryProtocolFactory(), numWorkers=2).serve()
+
+    port = free_port()
+    server = multiprocessing.get_context("fork").Process(target=run, args=(port, ))
+    server.start()
+    yield port
+    server.terminate()
+    server.join()
+
+
+def test_nonblocking_serves_other_connections_during_slow_calls(nonblocking_port):
+    connections = [connect(nonblocking_port, framed=True) for _ in range(3)]
+    pids = []
+
+    def call(client):
+        pids.append(client.MpClass("Fa"))
+
+    threads = [threading.Thread(target=call, args=(client, )) for _, client in connections[:2]]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    # Both workers are busy. The third connection is still accepted and read; its call waits for a free worker.
+    time.sleep(0.1)
+    connections[2][1].Ping()
+    ping = time.monotonic() - start
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.55
+    assert 0.25 < ping < 0.55
+    assert len(set(pids)) == 2
+    for transport, _ in connections:
+        transport.close()
+
+
+def test_nonblocking_replaces_dead_worker(nonblocking_port):
+    transport, client = connect(nonblocking_port, framed=True)
+    with pytest.raises(TTransport.TTransportException):
+        client.Contains("Fa", "Ga")
+    transport.close()
+
+    # Other connections are not affected, and both workers are available again.
+    transport, client = connect(nonblocking_port, framed=True)
+    client.Ping()
+    transport.close()
+    test_nonblocking_serves_other_connections_during_slow_calls(nonblocking_port)
+
+
+def test_idle_watchdog_stops_server_without_clients():
+    def run(port):
+        watchdog = IdleWatchdog(0.5)
+        processor = watchdog.wrap_processor(SpotOnDocker.Processor(SleepyHandler()))
+        tfactory = watchdog.wrap_transport_factory(TTransport.TBufferedTransportFactory())
+        transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+        server = TServer.TSimpleServer(processor, transport, tfactory, TBinaryProtocol.TBinaryProtocolFactory())
+        watchdog.start()
+        server.serve()
+
+    port = free_port()
+    server = multiprocessing.get_context("fork").Process(target=run, args=(port, ))
+    server.start()
+    try:
+        # A connected client keeps the server alive, even when it does not call.
+        transport, client = connect(port)
+        time.sleep(1.0)
+        client.Ping()
+        assert server.is_alive()
+        transport.close()
+
+        server.join(timeout=5.0)
+        assert not server.is_alive()
+    finally:
+        server.terminate()
+        server.join()